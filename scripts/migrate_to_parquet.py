@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+HIVEC-CM Results Migration Tool
+Writes Parquet copies of existing result CSVs so the web interface can
+load them without re-parsing text:
+  - simulation_results.csv      -> simulation_results.parquet
+  - detailed_age_sex_results.csv -> detailed_age_sex_results.parquet
+
+String columns (type, age_group, sex, region) are stored as dictionary
+encoded columns. CSVs are left untouched.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+RESULT_FILES = ("simulation_results.csv", "detailed_age_sex_results.csv")
+CATEGORY_COLUMNS = ("type", "age_group", "sex", "region")
+
+
+def migrate_file(csv_path, force=False):
+    """Write the Parquet sibling of ``csv_path``; returns True if a file was written."""
+    parquet_path = csv_path.with_suffix(".parquet")
+    if (not force and parquet_path.exists()
+            and parquet_path.stat().st_mtime >= csv_path.stat().st_mtime):
+        return False
+
+    df = pd.read_csv(csv_path)
+    df = df.astype({c: "category" for c in CATEGORY_COLUMNS if c in df.columns})
+    df.to_parquet(parquet_path, index=False, compression="snappy")
+    return True
+
+
+def migrate(results_dir, force=False):
+    """Migrate every results/<run>/<scenario>/ result CSV under ``results_dir``."""
+    written = skipped = 0
+    for name in RESULT_FILES:
+        for csv_path in sorted(Path(results_dir).glob(f"*/*/{name}")):
+            if migrate_file(csv_path, force=force):
+                written += 1
+                print(f"  ✓ {csv_path.with_suffix('.parquet')}")
+            else:
+                skipped += 1
+    print(f"\nWrote {written} Parquet file(s), {skipped} already up to date")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write Parquet copies of HIVEC-CM result CSVs")
+    parser.add_argument("--results-dir", default=str(Path(__file__).parent.parent / "results"),
+                        help="Results root directory (default: ./results)")
+    parser.add_argument("--force", action="store_true",
+                        help="Rewrite Parquet files even if they are newer than the CSV")
+    args = parser.parse_args()
+
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        print("pyarrow is required: pip install pyarrow", file=sys.stderr)
+        return 1
+
+    migrate(args.results_dir, force=args.force)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -23,6 +23,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../s
 from hivec_cm.models.parameters import load_parameters
 from hivec_cm.models.model import EnhancedHIVModel
 from hivec_cm.scenarios.scenario_definitions import SCENARIO_REGISTRY, list_scenarios
+from hivec_cm.utils.io import save_table
 
 
 def print_banner(mode):
@@ -112,7 +113,7 @@ def save_detailed_results(model, output_dir, scenario_id):
                                 })
     
     df = pd.DataFrame(rows)
-    df.to_csv(csv_file, index=False)
+    save_table(df, csv_file)
     print(f"  ✓ Saved CSV: {csv_file} ({len(df):,} rows)")
     
     # 3. Save metadata
@@ -655,15 +655,20 @@ MODEL VALIDATION:
         return "\n".join(report_lines)
 
 
-def save_analysis_results(analyzer: ModelAnalyzer, output_dir: str):
-    """Save all analysis results to files."""
+def save_analysis_results(analyzer: ModelAnalyzer, output_dir: str, dpi: int = 300):
+    """Save all analysis results to files.
+
+    Set ``HIVEC_SKIP_PLOTS=1`` to skip the dashboard render (by far the most
+    expensive output) in automated sweeps; the report and JSON are still saved.
+    """
     os.makedirs(output_dir, exist_ok=True)
     
     # Generate comprehensive dashboard
-    fig = analyzer.create_comprehensive_dashboard()
-    dashboard_path = os.path.join(output_dir, 'comprehensive_analysis_dashboard.png')
-    fig.savefig(dashboard_path, dpi=300, bbox_inches='tight')
-    plt.close(fig)
+    if os.environ.get("HIVEC_SKIP_PLOTS", "").strip().lower() not in ("1", "true", "yes"):
+        fig = analyzer.create_comprehensive_dashboard()
+        dashboard_path = os.path.join(output_dir, 'comprehensive_analysis_dashboard.png')
+        fig.savefig(dashboard_path, dpi=dpi, bbox_inches='tight')
+        plt.close(fig)
     
     # Generate and save report
     report = analyzer.generate_comprehensive_report()
@@ -4,6 +4,7 @@ import pandas as pd
 
 from hivec_cm.models.parameters import load_parameters
 from hivec_cm.models.model import EnhancedHIVModel
+from hivec_cm.utils.io import save_table
 from analysis.analyzer import ModelAnalyzer, save_analysis_results
 
 
@@ -60,7 +61,7 @@ def main(argv=None):
     results = model.run_simulation(years=args.years, dt=args.dt)
 
     results_path = os.path.join(args.output, "simulation_results.csv")
-    results.to_csv(results_path, index=False)
+    save_table(results, results_path)
 
     if not args.no_plots:
         analyzer = ModelAnalyzer(results, None)
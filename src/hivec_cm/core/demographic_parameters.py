@@ -408,6 +408,33 @@ def get_age_specific_mortality_rate(age: float, year: float,
     return float(adjusted_rate)
 
 
+def get_age_specific_mortality_rates(ages: np.ndarray, year: float) -> np.ndarray:
+    """
+    Vectorized form of get_age_specific_mortality_rate for an array of ages.
+    
+    Args:
+        ages: Ages in years
+        year: Calendar year
+        
+    Returns:
+        Annual natural death rate per age
+    """
+    age_brackets = np.array(sorted(AGE_SPECIFIC_MORTALITY_RATES.keys()), dtype=float)
+    base_rates = np.array(
+        [AGE_SPECIFIC_MORTALITY_RATES[b] for b in sorted(AGE_SPECIFIC_MORTALITY_RATES.keys())],
+        dtype=float
+    )
+    
+    # Largest bracket not exceeding each age (youngest bracket below range)
+    idx = np.searchsorted(age_brackets, ages, side='right') - 1
+    idx = np.clip(idx, 0, len(age_brackets) - 1)
+    
+    years_since_1985 = max(0, year - 1985)
+    improvement_factor = max(0.5, (1 - MORTALITY_IMPROVEMENT_RATE) ** years_since_1985)
+    
+    return base_rates[idx] * improvement_factor
+
+
 def get_regional_assignment_probabilities() -> Dict[str, float]:
     """
     Get probability distribution for assigning agents to regions.
@@ -0,0 +1,103 @@
+"""
+Parallel ensembles of independent simulations (parameter draws, Monte Carlo
+replicates) run across worker processes.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from .model import EnhancedHIVModel
+from .parameters import ModelParameters
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    import pandas as pd
+
+
+def _init_worker() -> None:
+    """Pin each worker's Numba kernels to one thread; the ensemble already uses every core."""
+    try:
+        import numba
+        numba.set_num_threads(1)
+    except Exception:
+        pass
+
+
+def _run_member(task) -> "pd.DataFrame":
+    """Run one ensemble member; module-level so it pickles to workers."""
+    params, seed, years, dt, start_year, use_numba = task
+    model = EnhancedHIVModel(params, start_year=start_year, seed=seed, use_numba=use_numba)
+    return model.run_simulation(years=years, dt=dt)
+
+
+def run_ensemble(
+    params_iter: Iterable[ModelParameters],
+    years: int = 35,
+    dt: float = 0.1,
+    n_workers: Optional[int] = None,
+    seeds: Optional[Sequence[int]] = None,
+    start_year: int = 1990,
+    use_numba: Optional[bool] = None,
+) -> List["pd.DataFrame"]:
+    """Run one simulation per parameter set, in parallel across processes.
+
+    Args:
+        params_iter: Parameter sets, one per ensemble member
+        years: Simulated years per member
+        dt: Time step in years
+        n_workers: Worker processes (default: all CPU cores); 1 runs serially
+            in this process
+        seeds: One RNG seed per member; derived from a fixed SeedSequence
+            when omitted so ensembles are reproducible
+        start_year: Calendar start year of every member
+        use_numba: Passed to ``EnhancedHIVModel`` (None = auto-detect)
+
+    Returns:
+        Results DataFrames in the order of ``params_iter``
+    """
+    params_list = list(params_iter)
+    if seeds is None:
+        seeds = [int(s.generate_state(1)[0]) for s in np.random.SeedSequence(0).spawn(len(params_list))]
+    elif len(seeds) != len(params_list):
+        raise ValueError("seeds must provide one seed per parameter set")
+
+    tasks = [
+        (params, int(seed), years, dt, start_year, use_numba)
+        for params, seed in zip(params_list, seeds)
+    ]
+    if not tasks:
+        return []
+
+    n_workers = min(n_workers or os.cpu_count() or 1, len(tasks))
+    if n_workers == 1:
+        return [_run_member(task) for task in tasks]
+
+    with ProcessPoolExecutor(max_workers=n_workers, initializer=_init_worker) as pool:
+        return list(pool.map(_run_member, tasks))
+
+
+def run_replicates(
+    params: ModelParameters,
+    replicates: int,
+    years: int = 35,
+    dt: float = 0.1,
+    n_workers: Optional[int] = None,
+    base_seed: int = 0,
+    start_year: int = 1990,
+    use_numba: Optional[bool] = None,
+) -> List["pd.DataFrame"]:
+    """Run ``replicates`` stochastic realisations of one parameter set in parallel.
+
+    Replicate ``r`` uses seed ``base_seed + r``, so any single replicate can
+    be reproduced with ``EnhancedHIVModel(params, seed=base_seed + r)``.
+    """
+    return run_ensemble(
+        [params] * replicates,
+        years=years,
+        dt=dt,
+        n_workers=n_workers,
+        seeds=[base_seed + r for r in range(replicates)],
+        start_year=start_year,
+        use_numba=use_numba,
+    )
@@ -1,12 +1,62 @@
 import numpy as np
-from typing import Optional
+from typing import Dict, Optional
 from numpy.random import Generator, default_rng
 from .parameters import ModelParameters
 from hivec_cm.core.demographic_parameters import (
     get_regional_assignment_probabilities,
+    get_regional_hepatitis_b_prevalence,
     get_regional_hiv_risk_multiplier
 )
 
+def get_care_cascade_rates(params: ModelParameters, current_year: float) -> Dict[str, float]:
+    """Year-dependent testing and treatment policy scalars shared by all individuals.
+
+    Returns the base testing rate, the ART initiation factor (both including the
+    funding cut scenario) and the CD4 eligibility threshold (infinite under
+    "Treat All").
+    """
+    funding_cut = (params.funding_cut_scenario and
+                   current_year >= params.funding_cut_year)
+
+    # Enhanced time-varying testing rates reflecting Cameroon's actual scale-up
+    if current_year < 2004:
+        testing_rate = 0.05  # Enhanced: Slightly higher early testing
+    elif current_year < 2010:
+        testing_rate = 0.18  # Enhanced: Better VCT scale-up
+    elif current_year < 2018:
+        testing_rate = 0.32  # Enhanced: Accelerated testing expansion
+    else:
+        testing_rate = 0.55  # Enhanced: Aggressive "Test and Treat"
+    if funding_cut:
+        testing_rate *= (1.0 - params.funding_cut_magnitude)
+
+    # Treatment eligibility based on CD4 count and year
+    if current_year >= 2016:
+        cd4_threshold = np.inf  # "Treat All" policy
+    elif current_year < 2010:
+        cd4_threshold = 200  # WHO guidelines 2002-2009
+    elif current_year < 2013:
+        cd4_threshold = 350  # WHO guidelines 2010-2012
+    else:
+        cd4_threshold = 500  # WHO guidelines 2013+
+
+    # Time-varying initiation probability
+    if current_year < 2004.75:  # October 2004
+        initiation_factor = 0.1  # High cost, very low initiation
+    elif current_year < 2010:
+        initiation_factor = 0.5  # Post-price drop
+    else:
+        initiation_factor = 1.0  # PEPFAR/Global Fund scale-up
+    if funding_cut:
+        initiation_factor *= (1.0 - params.funding_cut_magnitude)
+
+    return {
+        'testing_rate': testing_rate,
+        'cd4_threshold': cd4_threshold,
+        'initiation_factor': initiation_factor,
+    }
+
+
 class Individual:
     """Enhanced individual agent with detailed characteristics."""
 
@@ -18,6 +68,7 @@ class Individual:
         params: ModelParameters,
         rng: Optional[Generator] = None,
         region: Optional[str] = None,
+        risk_group: Optional[str] = None,
     ):
         self.id = agent_id
         self.age = age
@@ -46,7 +97,7 @@ class Individual:
         self.viral_load_suppressed = False
         
         # Social and behavioral characteristics
-        self.risk_group = self._assign_risk_group()
+        self.risk_group = risk_group if risk_group else self._assign_risk_group()
         self.contacts_per_year = self._assign_contact_rate()
         self.partnership_duration = self.rng.exponential(2.0)
         
@@ -179,8 +230,6 @@ class Individual:
     
     def _assign_hbv_status(self) -> str:
         """Assign HBV status based on CAMPHIA regional data (PHASE 2)."""
-        from hivec_cm.core.demographic_parameters import get_regional_hepatitis_b_prevalence
-        
         # Get regional HBV prevalence for this individual's region
         hbv_prev = get_regional_hepatitis_b_prevalence(self.region)
         
@@ -206,13 +255,16 @@ class Individual:
         base_rate = time_varying_rate if time_varying_rate is not None else self.params.base_transmission_rate
         
         # Base infectivity by stage
-        stage_multipliers = {
-            'acute': self.params.acute_multiplier,
-            'chronic': self.params.chronic_multiplier,
-            'aids': self.params.aids_multiplier
-        }
+        if self.hiv_status == 'acute':
+            stage_multiplier = self.params.acute_multiplier
+        elif self.hiv_status == 'chronic':
+            stage_multiplier = self.params.chronic_multiplier
+        elif self.hiv_status == 'aids':
+            stage_multiplier = self.params.aids_multiplier
+        else:
+            stage_multiplier = 1.0
         
-        base_infectivity = base_rate * stage_multipliers.get(self.hiv_status, 1.0)
+        base_infectivity = base_rate * stage_multiplier
         
         # Viral load effect (simplified)
         if hasattr(self, 'viral_load'):
@@ -231,8 +283,27 @@ class Individual:
         
         return base_infectivity
     
-    def update(self, dt: float, current_year: float):
-        """Update individual state for one time step."""
+    def update(
+        self,
+        dt: float,
+        current_year: float,
+        update_viral_load: bool = True,
+        cascade_rates: Optional[Dict[str, float]] = None,
+        update_progression: bool = True,
+    ):
+        """Update individual state for one time step.
+
+        Args:
+            dt: Time step in years
+            current_year: Current simulation year
+            update_viral_load: Redraw viral load here; the model passes False
+                when it redraws viral loads for the whole population in one batch
+            cascade_rates: Output of ``get_care_cascade_rates`` for this year,
+                computed once per step by the model; derived here if omitted
+            update_progression: Advance disease stage, CD4 and ART effects
+                here; the model passes False when it runs the jitted
+                population-wide kernel
+        """
         if not self.alive:
             return
             
@@ -241,20 +312,27 @@ class Individual:
         # HIV-related updates
         if self.hiv_status != "susceptible":
             self.infection_time += dt
-            self._update_disease_progression(dt)
-            self._update_viral_load()
+            if update_progression:
+                self._update_disease_progression(dt)
+            if update_viral_load:
+                self._update_viral_load()
         
         # Treatment updates
-        if self.on_art:
+        if self.on_art and update_progression:
             self._update_treatment_effects(dt)
         
         # Testing and care cascade
-        if current_year >= 2000:  # Testing became available
-            self._consider_testing(dt, current_year)
+        if cascade_rates is None:
+            cascade_rates = get_care_cascade_rates(self.params, current_year)
+
+        # Testing became available in 2000; only untested HIV+ individuals are eligible
+        if (current_year >= 2000 and not self.tested and
+                self.hiv_status != "susceptible"):
+            self._consider_testing(dt, current_year, cascade_rates['testing_rate'])
         
         if (self.diagnosed and not self.on_art and 
             current_year >= self.params.art_start_year):
-            self._consider_treatment_initiation(dt, current_year)
+            self._consider_treatment_initiation(dt, current_year, cascade_rates)
     
     def _update_disease_progression(self, dt: float):
         """Update HIV disease stage progression."""
@@ -306,25 +384,15 @@ class Individual:
                 self.rng.random() < 0.1 * dt):
                 self.hiv_status = "chronic"
     
-    def _consider_testing(self, dt: float, current_year: float):
+    def _consider_testing(self, dt: float, current_year: float,
+                          testing_rate: Optional[float] = None):
         """Consider HIV testing based on year and individual characteristics."""
         if self.tested or self.hiv_status == "susceptible":
             return
         
-        # Enhanced time-varying testing rates reflecting Cameroon's actual scale-up
-        if current_year < 2004:
-            testing_rate = 0.05  # Enhanced: Slightly higher early testing
-        elif current_year < 2010:
-            testing_rate = 0.18  # Enhanced: Better VCT scale-up
-        elif current_year < 2018:
-            testing_rate = 0.32  # Enhanced: Accelerated testing expansion
-        else:
-            testing_rate = 0.55  # Enhanced: Aggressive "Test and Treat"
-        
-        # Funding cut scenario
-        if (self.params.funding_cut_scenario and
-                current_year >= self.params.funding_cut_year):
-            testing_rate *= (1.0 - self.params.funding_cut_magnitude)
+        # Time-varying base testing rate (includes funding cut scenario)
+        if testing_rate is None:
+            testing_rate = get_care_cascade_rates(self.params, current_year)['testing_rate']
         
         # Risk group multiplier for testing
         if self.risk_group == 'high':
@@ -376,7 +444,8 @@ class Individual:
         return str(self.rng.choice(modalities, p=probs))
 
     
-    def _consider_treatment_initiation(self, dt: float, current_year: float):
+    def _consider_treatment_initiation(self, dt: float, current_year: float,
+                                       cascade_rates: Optional[Dict[str, float]] = None):
         """Consider starting antiretroviral treatment."""
         # PHASE 1 ENHANCEMENT: Track linkage to care
         if self.diagnosed and not self.cascade_linkage_year:
@@ -384,32 +453,13 @@ class Individual:
             if self.rng.random() < 0.8 * dt:  # 80% linkage probability
                 self.cascade_linkage_year = current_year
         
-        # Treatment eligibility based on CD4 count and year
-        if current_year >= 2016:
-            eligible = True  # "Treat All" policy
-        else:
-            # Keep the original CD4 threshold logic
-            if current_year < 2010:
-                cd4_threshold = 200  # WHO guidelines 2002-2009
-            elif current_year < 2013:
-                cd4_threshold = 350  # WHO guidelines 2010-2012
-            else:
-                cd4_threshold = 500  # WHO guidelines 2013+
-            eligible = (self.hiv_status == "aids" or
-                        self.cd4_count <= cd4_threshold)
+        if cascade_rates is None:
+            cascade_rates = get_care_cascade_rates(self.params, current_year)
 
-        # Time-varying initiation probability
-        if current_year < 2004.75:  # October 2004
-            initiation_factor = 0.1  # High cost, very low initiation
-        elif current_year < 2010:
-            initiation_factor = 0.5  # Post-price drop
-        else:
-            initiation_factor = 1.0  # PEPFAR/Global Fund scale-up
-
-        # Funding cut scenario
-        if (self.params.funding_cut_scenario and
-                current_year >= self.params.funding_cut_year):
-            initiation_factor *= (1.0 - self.params.funding_cut_magnitude)
+        # Treatment eligibility based on CD4 count and year ("Treat All" from 2016)
+        eligible = (self.hiv_status == "aids" or
+                    self.cd4_count <= cascade_rates['cd4_threshold'])
+        initiation_factor = cascade_rates['initiation_factor']
         
         if (eligible and self.rng.random() < 
                 self.params.treatment_initiation_prob * initiation_factor * dt):
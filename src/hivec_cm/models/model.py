@@ -1,14 +1,21 @@
 
 import numpy as np
-import pandas as pd
 import logging
-from typing import List, Optional, Callable, Dict, Any
+from typing import TYPE_CHECKING, List, Optional, Callable, Dict, Any, Tuple
 from numpy.random import default_rng, Generator
-from hivec_cm.utils.accel import NUMBA_AVAILABLE, poisson_counts_numba
+from hivec_cm.utils.accel import (
+    NUMBA_AVAILABLE,
+    disease_progression_numba,
+    hiv_mortality_rates_numba,
+    transmission_binned_numba,
+)
 import time
 
 from .parameters import ModelParameters
-from .individual import Individual
+
+if TYPE_CHECKING:
+    import pandas as pd
+from .individual import Individual, get_care_cascade_rates
 from hivec_cm.calibration.parameter_mapper import ParameterMapper
 from hivec_cm.core.disease_parameters import (
     VIRAL_LOAD_PARAMETERS,
@@ -21,12 +28,28 @@ from hivec_cm.core.disease_parameters import (
 )
 from hivec_cm.core.demographic_parameters import (
     get_age_specific_fertility_rate,
-    get_age_specific_mortality_rate,
-    get_regional_assignment_probabilities
+    get_age_specific_mortality_rates,
+    get_regional_assignment_probabilities,
+    REGIONAL_DISTRIBUTION
 )
 
 logger = logging.getLogger(__name__)
 
+# Integer codes for HIV status used by the vectorized population passes
+HIV_STATUS_CODES = {"susceptible": 0, "acute": 1, "chronic": 2, "aids": 3}
+STATUS_SUSCEPTIBLE = HIV_STATUS_CODES["susceptible"]
+
+# Result columns holding proportions; all other result columns are counts
+RESULT_RATE_FIELDS = frozenset({
+    'true_hiv_prevalence', 'true_art_coverage', 'detected_prevalence',
+    'detected_art_coverage', 'undiagnosed_rate', 'testing_coverage_achieved',
+    'testing_capacity_used', 'false_negative_rate',
+})
+
+# Below this many agent-steps, loading the cached Numba kernels costs more
+# than they save, so auto-detected acceleration stays off for the run
+NUMBA_MIN_AGENT_STEPS = 100_000
+
 
 class EnhancedHIVModel:
     """HIVEC CM enhanced model with improved calibration."""
@@ -34,7 +57,7 @@ class EnhancedHIVModel:
     def __init__(
         self,
         params: ModelParameters,
-        calibration_data: Optional[pd.DataFrame] = None,
+        calibration_data: Optional["pd.DataFrame"] = None,
         start_year: int = 1990,
         seed: Optional[int] = None,
         rng: Optional[Generator] = None,
@@ -50,17 +73,56 @@ class EnhancedHIVModel:
         self.params = params
         self.calibration_data = calibration_data
         self.population: List[Individual] = []
+        # Dead individuals are flagged (alive=False) and compacted out lazily
+        self._n_dead: int = 0
+        # Living individuals gathered by the update pass, shared by the
+        # population-level processes of the same step
+        self._step_alive: Optional[List[Individual]] = None
+        # Steps between regrouping the population list by HIV status (0 disables)
+        self.sort_interval: int = 50
         self.agent_id_counter = 0
         self.start_year = int(start_year)
         self.current_year = float(self.start_year)
         self.rng: Generator = rng or default_rng(seed)
         self.use_numba: bool = NUMBA_AVAILABLE if use_numba is None else bool(use_numba)
+        self._numba_auto: bool = use_numba is None
         self.mixing_method: str = mixing_method if mixing_method in ("binned", "scan") else "binned"
-        self._accel_seed: int = int(seed or 0)
         self._on_year_result = on_year_result
         self._stop_requested: bool = False
         self._pause_requested: bool = False
         self._run_total_years: float = 0.0
+        # Condom coverage per simulation time point, filled by run_simulation
+        self._condom_curve: Dict[float, float] = {}
+
+        # Transmission multiplier lookup tables indexed by integer status and
+        # risk-group codes (see HIV_STATUS_CODES)
+        self._risk_groups: List[str] = list(params.risk_group_proportions.keys())
+        self._risk_group_index: Dict[str, int] = {rg: i for i, rg in enumerate(self._risk_groups)}
+        self._stage_mult = np.array(
+            [0.0, params.acute_multiplier, params.chronic_multiplier, params.aids_multiplier],
+            dtype=np.float32,
+        )
+        self._risk_mult = np.array(
+            [params.risk_group_multipliers[rg] for rg in self._risk_groups], dtype=np.float32
+        )
+
+        # Time-invariant assortative-mixing tables used by every transmission
+        # step: partner age-bin offsets with their cumulative weights, and
+        # per-own-risk-group cumulative partner risk-group weights (prefer same)
+        self._neighbor_offsets = np.array([-2, -1, 0, 1, 2], dtype=np.int64)
+        neighbor_weights = np.array([0.2, 0.5, 1.0, 0.5, 0.2], dtype=float)
+        self._neighbor_cdf = np.cumsum(neighbor_weights / neighbor_weights.sum())
+        n_rg = len(self._risk_groups)
+        same_rg_weight = 0.7
+        other_weight = (1.0 - same_rg_weight) / max(1, n_rg - 1)
+        rg_weights = np.where(np.eye(n_rg, dtype=bool), same_rg_weight, other_weight)
+        self._rg_cdf = np.cumsum(rg_weights / rg_weights.sum(axis=1, keepdims=True), axis=1)
+
+        # HIV-specific annual mortality by status code (separate from natural):
+        # 2% acute, 5% chronic, 30% AIDS
+        self._stage_mortality = np.array([0.0, 0.02, 0.05, 0.30])
+        for table in (self._neighbor_offsets, self._neighbor_cdf, self._rg_cdf, self._stage_mortality):
+            table.setflags(write=False)
 
         # ParameterMapper for policy/history parameters
         self.mapper = ParameterMapper(
@@ -132,6 +194,10 @@ class EnhancedHIVModel:
             'false_negative_rate': [],  # % HIV+ who tested but got false negative
         }
         
+        # Columns are preallocated as NumPy arrays once the run length is known;
+        # self._n_records counts the rows filled so far
+        self._n_records = 0
+        
         # Enhanced detailed results storage for age-sex stratified analysis
         self.detailed_results = {}
 
@@ -143,22 +209,38 @@ class EnhancedHIVModel:
     
     def _initialize_population(self):
         """Initialize population with demographic structure and geographic distribution."""
-        # Get regional distribution for proper population allocation
+        n = self.params.initial_population
+
+        # Categorical attributes for the whole population, sampled in batches
+        # from precomputed CDFs instead of per-agent rng.choice calls
+        ages = self._sample_age_structure(n)
+        genders = np.where(self.rng.random(n) < 0.5, 'M', 'F')
+
         regional_probs = get_regional_assignment_probabilities()
-        
-        for _ in range(self.params.initial_population):
-            # Age structure based on Cameroon demographics
-            age = self._sample_age_structure()
-            gender = self.rng.choice(['M', 'F'])
-            
-            # Individual constructor now handles region assignment internally
+        regions = self._sample_categorical(list(regional_probs), list(regional_probs.values()), n)
+
+        # Risk groups for adults; children are always low risk
+        risk_groups = self._sample_categorical(
+            list(self.params.risk_group_proportions),
+            list(self.params.risk_group_proportions.values()),
+            n,
+        )
+        risk_groups[ages < 15] = 'low'
+
+        # Cameroon: ~55% urban, 45% rural
+        residences = np.where(self.rng.random(n) < 0.55, 'urban', 'rural')
+        seed_draws = self.rng.random(n)
+
+        for i in range(n):
+            age = float(ages[i])
             individual = Individual(
-                self.agent_id_counter, age, gender, self.params, rng=self.rng
+                self.agent_id_counter, age, str(genders[i]), self.params, rng=self.rng,
+                region=str(regions[i]), risk_group=str(risk_groups[i])
             )
             self.agent_id_counter += 1
             
             # Assign urban/rural residence
-            individual.residence = self._assign_residence()
+            individual.residence = str(residences[i])
             individual.last_test_year = None
             individual.viral_load_suppressed = False
             
@@ -169,7 +251,7 @@ class EnhancedHIVModel:
                 individual.regional_hiv_risk_multiplier
             )
             
-            if age >= 15 and self.rng.random() < regional_hiv_prevalence:
+            if age >= 15 and seed_draws[i] < regional_hiv_prevalence:
                 individual.hiv_status = "chronic"
                 individual.infection_time = float(self.rng.uniform(0, 3))
                 individual.viral_load = self._assign_initial_viral_load(individual)
@@ -186,6 +268,12 @@ class EnhancedHIVModel:
                     individual.viral_load = self.rng.lognormal(10, 1)  # High VL
             
             self.population.append(individual)
+
+    def _sample_categorical(self, labels: List[str], probs: List[float], size: int) -> np.ndarray:
+        """Draw ``size`` labels by inverting the cumulative distribution of ``probs``."""
+        cdf = np.cumsum(probs, dtype=float)
+        idx = np.searchsorted(cdf / cdf[-1], self.rng.random(size), side='right')
+        return np.asarray(labels, dtype=object)[np.minimum(idx, len(labels) - 1)]
     
     def _assign_residence(self) -> str:
         """Assign urban/rural residence based on Cameroon demographics."""
@@ -211,23 +299,25 @@ class EnhancedHIVModel:
         else:
             return self.rng.lognormal(9, 1)   # Chronic untreated: ~8,000-20,000
     
-    def _sample_age_structure(self) -> float:
-        """Sample age from realistic Cameroon age structure."""
+    def _sample_age_structure(self, size: int) -> np.ndarray:
+        """Sample ages from realistic Cameroon age structure."""
         # Simplified age distribution for Cameroon
-        age_groups = [
+        age_groups = np.array([
             (0, 15, 0.45),   # Children
             (15, 30, 0.25),  # Young adults
             (30, 50, 0.20),  # Adults
             (50, 65, 0.08),  # Older adults
             (65, 85, 0.02)   # Elderly
-        ]
+        ])
         
-        # Select age group
-        probs = [group[2] for group in age_groups]
-        selected_group = int(self.rng.choice(len(age_groups), p=probs))
-        min_age, max_age, _ = age_groups[selected_group]
+        # Select age groups by inverting the cumulative distribution
+        cdf = np.cumsum(age_groups[:, 2])
+        selected = np.minimum(
+            np.searchsorted(cdf / cdf[-1], self.rng.random(size), side='right'), len(age_groups) - 1
+        )
+        min_age, max_age = age_groups[selected, 0], age_groups[selected, 1]
         
-        return float(self.rng.uniform(min_age, max_age))
+        return self.rng.uniform(min_age, max_age)
     
     def get_time_varying_transmission_rate(self, year: float) -> float:
         """
@@ -266,7 +356,7 @@ class EnhancedHIVModel:
             decline_multiplier = getattr(self.params, 'decline_phase_multiplier', 1.0)
             return base_rate * decline_multiplier
     
-    def run_simulation(self, years: int = 35, dt: float = 0.1) -> pd.DataFrame:
+    def run_simulation(self, years: int = 35, dt: float = 0.1) -> "pd.DataFrame":
         """Run the complete HIV epidemic simulation."""
         logger.info(f"Starting simulation for {years} years")
 
@@ -274,11 +364,24 @@ class EnhancedHIVModel:
         if int(self.current_year) != self.start_year:
             self.start_year = int(self.current_year)
 
+        steps = int(years / dt)
+        self._run_total_years = float(years)
+        steps_per_year = int(1/dt)
+        progress_interval = max(1, steps // 10)
+        if self._numba_auto:
+            self.use_numba = NUMBA_AVAILABLE and steps * len(self.population) >= NUMBA_MIN_AGENT_STEPS
+
+        # Initial record plus one per simulated year
+        self._reserve_results(1 + -(-steps // steps_per_year))
+
         # Record initial state before starting the simulation loop
         self._record_results(int(self.current_year))
 
-        steps = int(years / dt)
-        self._run_total_years = float(years)
+        # Evaluate the condom coverage curve once over the whole time grid
+        self._condom_curve = {
+            year: float(self.mapper.get_condom_coverage(year))
+            for year in (self.start_year + (step * dt) for step in range(steps))
+        }
         
         for step in range(steps):
             self.current_year = self.start_year + (step * dt)
@@ -289,28 +392,58 @@ class EnhancedHIVModel:
             while self._pause_requested and not self._stop_requested:
                 time.sleep(0.05)
             
-            # Update all individuals
-            for individual in self.population[:]:
-                if individual.alive:
-                    individual.update(dt, self.current_year)
-            
-            # Population-level processes
-            self._transmission_events(dt)
-            self._mortality_events(dt)
-            self._birth_events(dt)
+            self._step(dt)
             
             # Record results annually
-            if step % int(1/dt) == 0:
+            if step % steps_per_year == 0:
                 self._record_results(int(self.current_year))
+            self._step_alive = None
+
+            # Keep infected individuals contiguous for the status-filtered passes
+            if self.sort_interval and step % self.sort_interval == self.sort_interval - 1:
+                self._compact_population(sort_by_status=True)
                 
             # Progress reporting
-            progress_interval = max(1, steps // 10)
             if step % progress_interval == 0:
                 progress = (step / steps) * 100
                 logger.info(f"Simulation progress: {progress:.1f}%")
         
         logger.info("Simulation completed")
-        return pd.DataFrame(self.results)
+        # pandas is only needed for the final table; import lazily to keep
+        # model import (e.g. in calibration workers) light
+        import pandas as pd
+        self.results = {k: v[:self._n_records] for k, v in self.results.items()}
+        # Each run reserves new buffers, so the frame can take the trimmed
+        # column views without another per-column copy
+        return pd.DataFrame(self.results, copy=False)
+
+    def _step(self, dt: float):
+        """Advance every individual and the population-level processes by one time step."""
+        # Update all individuals in one pass that also collects the
+        # living population; viral loads are redrawn in one batch
+        cascade_rates = get_care_cascade_rates(self.params, self.current_year)
+        update = Individual.update
+        year = self.current_year
+        per_agent_progression = not self.use_numba
+        alive = []
+        append = alive.append
+        for individual in self.population:
+            if individual.alive:
+                if individual.hiv_status == "susceptible":
+                    # Susceptibles are never tested or treated; only ageing applies
+                    individual.age += dt
+                else:
+                    update(individual, dt, year, False, cascade_rates, per_agent_progression)
+                append(individual)
+        self._step_alive = alive
+        if not per_agent_progression:
+            self._update_disease_progression_numba(dt)
+        self._update_viral_loads()
+        
+        # Population-level processes
+        self._transmission_events(dt)
+        self._mortality_events(dt)
+        self._birth_events(dt)
 
     def request_stop(self) -> None:
         """Request cooperative stop of the simulation loop."""
@@ -325,15 +458,100 @@ class EnhancedHIVModel:
         self._pause_requested = False
     
     def _poisson_counts(self, lams: np.ndarray) -> np.ndarray:
-        """Vectorized Poisson sampling with optional Numba acceleration."""
+        """Vectorized Poisson sampling from the model's own generator.
+
+        Both paths draw from ``self.rng`` so that models built from spawned
+        generators (``rng=parent.spawn(n)[i]``) get independent streams.
+        """
         if lams.size == 0:
             return np.zeros(0, dtype=np.int64)
-        if self.use_numba:
-            # Derive a deterministic seed per call to keep runs stable-ish when seeded
-            step_seed = (self._accel_seed + int((self.current_year - self.start_year) * 1000)) % (2**31 - 1)
-            return poisson_counts_numba(lams.astype(np.float64), int(step_seed))
         return self.rng.poisson(lams)
 
+    def _update_disease_progression_numba(self, dt: float):
+        """Advance disease stage, CD4 and ART effects of all infected individuals in one jitted pass."""
+        infected = [p for p in self._alive_individuals() if p.hiv_status != "susceptible"]
+        if not infected:
+            return
+        n = len(infected)
+        codes = HIV_STATUS_CODES
+        status = np.fromiter((codes[p.hiv_status] for p in infected), dtype=np.int8, count=n)
+        cd4 = np.fromiter((p.cd4_count for p in infected), dtype=float, count=n)
+        infection_time = np.fromiter((p.infection_time for p in infected), dtype=float, count=n)
+        on_art = np.fromiter((p.on_art for p in infected), dtype=bool, count=n)
+        art_start_time = np.fromiter((p.art_start_time for p in infected), dtype=float, count=n)
+        new_status = status.copy()
+
+        disease_progression_numba(
+            new_status,
+            cd4,
+            infection_time,
+            on_art,
+            art_start_time,
+            self.params.acute_duration_months / 12.0,
+            self.params.chronic_duration_years,
+            dt,
+            self.rng.standard_normal(n),
+            self.rng.random(n),
+            self.rng.standard_normal(n),
+            self.rng.random(n),
+        )
+
+        status_names = list(codes)
+        for i, person in enumerate(infected):
+            person.cd4_count = float(cd4[i])
+            if new_status[i] != status[i]:
+                person.hiv_status = status_names[new_status[i]]
+
+    def _update_viral_loads(self):
+        """Redraw viral loads of all infected individuals with batched draws.
+
+        Same stage/treatment-specific lognormal distributions as
+        ``Individual._update_viral_load``, sampled with one RNG call per
+        distribution parameter instead of one call per person.
+        """
+        infected = [p for p in self._alive_individuals() if p.hiv_status != "susceptible"]
+        if not infected:
+            return
+        cols = self._population_columns(infected)
+        status = cols['status']
+        on_art = cols['on_art']
+
+        # Chronic, untreated by default; overwritten per stage/treatment below
+        mu = np.full(len(infected), 9.0)
+        sigma = np.ones(len(infected))
+        mu[status == HIV_STATUS_CODES['acute']] = 11.0
+        mu[status == HIV_STATUS_CODES['aids']] = 10.0
+
+        chronic_art = (status == HIV_STATUS_CODES['chronic']) & on_art
+        suppressed = chronic_art & (self.rng.random(len(infected)) < self.params.treatment_adherence)
+        mu[chronic_art] = 8.0
+        mu[suppressed] = 1.5
+        sigma[suppressed] = 0.5
+
+        viral_loads = np.exp(mu + sigma * self.rng.standard_normal(len(infected)))
+        for person, vl in zip(infected, viral_loads.tolist()):
+            person.viral_load = vl
+
+    def _alive_individuals(self) -> List[Individual]:
+        """Living individuals, reusing the current step's snapshot when available."""
+        if self._step_alive is None:
+            return [p for p in self.population if p.alive]
+        return self._step_alive
+
+    def _split_for_transmission(self) -> Tuple[List[Individual], List[Individual]]:
+        """Classify the living population into adult susceptibles and infected in one pass."""
+        susceptible = []
+        infected = []
+        add_susceptible = susceptible.append
+        add_infected = infected.append
+        for p in self._alive_individuals():
+            if p.hiv_status == "susceptible":
+                if p.age >= 15:
+                    add_susceptible(p)
+            else:
+                add_infected(p)
+        return susceptible, infected
+
     def _transmission_events(self, dt: float):
         if self.mixing_method == "binned":
             return self._transmission_events_binned(dt)
@@ -342,18 +560,14 @@ class EnhancedHIVModel:
 
     def _transmission_events_binned(self, dt: float):
         """Handle HIV transmission using age/risk binned partner selection."""
-        susceptible = [
-            p for p in self.population
-            if p.alive and p.hiv_status == "susceptible" and p.age >= 15
-        ]
-        infected = [
-            p for p in self.population
-            if p.alive and p.hiv_status in ["acute", "chronic", "aids"]
-        ]
+        susceptible, infected = self._split_for_transmission()
 
         if not infected or not susceptible:
             return
 
+        if self.use_numba:
+            return self._transmission_events_binned_numba(susceptible, infected, dt)
+
         # Build infected pools by age bin and risk group for fast sampling
         bin_size = 5
         def age_bin(age: float) -> int:
@@ -364,35 +578,40 @@ class EnhancedHIVModel:
             key = (age_bin(partner.age), partner.risk_group)
             infected_bins.setdefault(key, []).append(partner)
 
-        # Precompute neighbor bin offsets and weights for assortative mixing
-        neighbor_offsets = [-2, -1, 0, 1, 2]
-        neighbor_weights = np.array([0.2, 0.5, 1.0, 0.5, 0.2], dtype=float)
-        neighbor_weights /= neighbor_weights.sum()
+        # Assortative mixing tables (precomputed once per model)
+        neighbor_offsets = self._neighbor_offsets.tolist()
+        neighbor_cdf = self._neighbor_cdf
+        risk_groups = self._risk_groups
+        rg_cdfs = {rg: self._rg_cdf[i] for i, rg in enumerate(risk_groups)}
 
-        risk_groups = list(self.params.risk_group_proportions.keys())
+        # Year-dependent rates, constant within the step
+        time_varying_rate = self.get_time_varying_transmission_rate(self.current_year)
+        condom_rate = self._get_condom_use_rate(self.current_year)
+        sus_risk_mult = self._susceptible_risk_multipliers(susceptible).tolist()
 
         # Vectorized contact draws
         lams = np.array([max(0.0, p.contacts_per_year * dt) for p in susceptible], dtype=float)
         contact_counts = self._poisson_counts(lams)
 
+        # Draw every per-contact uniform for this step in one batch:
+        # columns are age bin, risk group, partner, circumcision, condom, transmission
+        uniforms = self.rng.random((int(contact_counts.sum()), 6))
+        offset_idx = np.minimum(np.searchsorted(neighbor_cdf, uniforms[:, 0], side='right'), len(neighbor_offsets) - 1)
+        contact_start = np.concatenate(([0], np.cumsum(contact_counts)[:-1]))
+
         for idx, person in enumerate(susceptible):
             base_bin = age_bin(person.age)
             contacts = int(contact_counts[idx])
+            rg_cdf = rg_cdfs[person.risk_group]
 
-            for _ in range(contacts):
+            for c in range(contact_start[idx], contact_start[idx] + contacts):
+                u = uniforms[c]
                 # Pick an age bin with assortative preference
-                chosen_offset = int(self.rng.choice(neighbor_offsets, p=neighbor_weights))
-                chosen_bin = base_bin + chosen_offset
+                chosen_bin = base_bin + neighbor_offsets[offset_idx[c]]
 
                 # Choose partner risk group (prefer same)
-                same_rg_weight = 0.7
-                other_weight = (1.0 - same_rg_weight) / max(1, len(risk_groups) - 1)
-                rg_weights = []
-                for rg in risk_groups:
-                    rg_weights.append(same_rg_weight if rg == person.risk_group else other_weight)
-                rg_weights = np.array(rg_weights, dtype=float)
-                rg_weights /= rg_weights.sum()
-                chosen_rg = str(self.rng.choice(risk_groups, p=rg_weights))
+                rg_idx = min(int(np.searchsorted(rg_cdf, u[1], side='right')), len(risk_groups) - 1)
+                chosen_rg = risk_groups[rg_idx]
 
                 pool = infected_bins.get((chosen_bin, chosen_rg))
                 # Fallbacks if pool empty
@@ -406,281 +625,392 @@ class EnhancedHIVModel:
                     # global fallback
                     pool = infected
 
-                partner = pool[int(self.rng.integers(len(pool)))] if pool else None
+                partner = pool[min(int(u[2] * len(pool)), len(pool) - 1)] if pool else None
                 if not partner:
                     continue
 
-                # Get time-varying transmission rate
-                time_varying_rate = self.get_time_varying_transmission_rate(self.current_year)
                 transmission_prob = partner.get_infectivity(self.current_year, time_varying_rate)
 
                 # Transmission probability modifiers
-                risk_multiplier = person.params.risk_group_multipliers[person.risk_group]
-                if (
-                    self.params.funding_cut_scenario
-                    and self.current_year >= self.params.funding_cut_year
-                    and person.risk_group in ['medium', 'high']
-                ):
-                    # Increase risk by reducing prevention
-                    risk_multiplier *= (1.0 + self.params.kp_prevention_cut_magnitude)
-
-                transmission_prob *= risk_multiplier
+                transmission_prob *= sus_risk_mult[idx]
 
                 # Circumcision effect (males)
-                if person.gender == 'M' and self.rng.random() < 0.3:  # 30% circumcised
+                if person.gender == 'M' and u[3] < 0.3:  # 30% circumcised
                     transmission_prob *= 0.4
 
                 # Condom use effect
-                if self.rng.random() < self._get_condom_use_rate(self.current_year):
+                if u[4] < condom_rate:
                     transmission_prob *= 0.15  # 85% efficacy
 
-                if self.rng.random() < transmission_prob:
-                    # PHASE 1 ENHANCEMENT: Track transmission details
-                    person.hiv_status = "acute"
-                    person.infection_time = 0.0
-                    person.cd4_count = self.rng.normal(600, 100)
-                    person.transmission_donor_id = partner.id
-                    person.transmission_donor_stage = partner.hiv_status
-                    person.transmission_donor_viral_load = partner.viral_load
-                    person.transmission_year = self.current_year
+                if u[5] < transmission_prob:
+                    self._infect(person, partner)
                     break
 
+    def _transmission_events_binned_numba(
+        self,
+        susceptible: List[Individual],
+        infected: List[Individual],
+        dt: float,
+    ):
+        """Binned partner selection and transmission in a single Numba kernel."""
+        year = self.current_year
+        params = self.params
+        codes = HIV_STATUS_CODES
+        rg_index = self._risk_group_index
+        n_rg = len(self._risk_groups)
+        bin_size = 5
+
+        # Susceptible columns
+        n_sus = len(susceptible)
+        sus_age = np.fromiter((p.age for p in susceptible), dtype=float, count=n_sus)
+        sus_bin = (sus_age // bin_size).astype(np.int64)
+        sus_rg = np.fromiter((rg_index[p.risk_group] for p in susceptible), dtype=np.int8, count=n_sus)
+        sus_male = np.fromiter((p.gender == 'M' for p in susceptible), dtype=bool, count=n_sus)
+        sus_risk_mult = self._step_risk_multipliers()[sus_rg]
+
+        # Infected columns and per-partner infectivity (see Individual.get_infectivity)
+        n_inf = len(infected)
+        inf_age = np.fromiter((p.age for p in infected), dtype=float, count=n_inf)
+        inf_rg = np.fromiter((rg_index[p.risk_group] for p in infected), dtype=np.int64, count=n_inf)
+        inf_status = np.fromiter((codes[p.hiv_status] for p in infected), dtype=np.int8, count=n_inf)
+        inf_vl = np.fromiter((p.viral_load for p in infected), dtype=np.float32, count=n_inf)
+        inf_on_art = np.fromiter((p.on_art for p in infected), dtype=bool, count=n_inf)
+        inf_base = (
+            np.float32(self.get_time_varying_transmission_rate(year))
+            * self._stage_mult[inf_status]
+            * np.minimum(np.float32(2.0), inf_vl / np.float32(50000))
+        )
+        adherence_prob = params.treatment_adherence
+        if params.funding_cut_scenario and year >= params.funding_cut_year:
+            adherence_prob *= 0.75  # 25% reduction in effective adherence
+        art_applies = inf_on_art & (year >= params.art_start_year)
+        inf_art_prob = np.where(art_applies, adherence_prob, 0.0).astype(np.float32)
+
+        # CSR layout of infected pools keyed by (age bin, risk group)
+        inf_bin = (inf_age // bin_size).astype(np.int64)
+        n_bins = int(inf_bin.max()) + 1
+        keys = inf_bin * n_rg + inf_rg.astype(np.int64)
+        order = np.argsort(keys, kind='stable')
+        pool_starts = np.searchsorted(keys[order], np.arange(n_bins * n_rg + 1)).astype(np.int64)
+
+        # Assortative mixing tables (precomputed once per model)
+        neighbor_offsets = self._neighbor_offsets
+        neighbor_cdf = self._neighbor_cdf
+        rg_cdf = self._rg_cdf
+
+        lams = np.array([max(0.0, p.contacts_per_year * dt) for p in susceptible], dtype=float)
+        contact_counts = self._poisson_counts(lams)
+
+        # Per-contact uniforms drawn up front so the kernel can run in parallel
+        contact_start = np.concatenate(([0], np.cumsum(contact_counts)[:-1])).astype(np.int64)
+        uniforms = self.rng.random((int(contact_counts.sum()), 7))
+
+        partners = transmission_binned_numba(
+            contact_counts,
+            contact_start,
+            uniforms,
+            sus_bin,
+            sus_rg,
+            sus_male,
+            sus_risk_mult,
+            pool_starts,
+            n_bins,
+            inf_base[order],
+            inf_art_prob[order],
+            1.0 - params.art_efficacy_transmission,
+            neighbor_offsets,
+            neighbor_cdf,
+            rg_cdf,
+            float(self._get_condom_use_rate(year)),
+        )
+        for i in np.flatnonzero(partners >= 0):
+            self._infect(susceptible[i], infected[order[partners[i]]])
+
+    def _step_risk_multipliers(self) -> np.ndarray:
+        """Risk-group transmission multipliers for the current year, by risk-group code."""
+        risk_mult = self._risk_mult.copy()
+        if self.params.funding_cut_scenario and self.current_year >= self.params.funding_cut_year:
+            # Increase risk by reducing prevention
+            for rg in ('medium', 'high'):
+                if rg in self._risk_group_index:
+                    risk_mult[self._risk_group_index[rg]] *= (1.0 + self.params.kp_prevention_cut_magnitude)
+        return risk_mult
+
+    def _susceptible_risk_multipliers(self, susceptible: List[Individual]) -> np.ndarray:
+        """Per-person risk-group transmission multipliers for the current year."""
+        codes = np.fromiter(
+            (self._risk_group_index[p.risk_group] for p in susceptible),
+            dtype=np.int8,
+            count=len(susceptible),
+        )
+        return self._step_risk_multipliers()[codes]
+
+    def _infect(self, person: Individual, partner: Individual) -> None:
+        """Infect a susceptible person and record transmission details."""
+        # PHASE 1 ENHANCEMENT: Track transmission details
+        person.hiv_status = "acute"
+        person.infection_time = 0.0
+        person.cd4_count = self.rng.normal(600, 100)
+        person.transmission_donor_id = partner.id
+        person.transmission_donor_stage = partner.hiv_status
+        person.transmission_donor_viral_load = partner.viral_load
+        person.transmission_year = self.current_year
+
     def _transmission_events_scan(self, dt: float):
         """Baseline scanning partner selection (pre-binning) for benchmarking."""
-        susceptible = [
-            p for p in self.population
-            if p.alive and p.hiv_status == "susceptible" and p.age >= 15
-        ]
-        infected = [
-            p for p in self.population
-            if p.alive and p.hiv_status in ["acute", "chronic", "aids"]
-        ]
+        susceptible, infected = self._split_for_transmission()
 
         if not infected or not susceptible:
             return
 
+        # Year-dependent rates, constant within the step
+        time_varying_rate = self.get_time_varying_transmission_rate(self.current_year)
+        condom_rate = self._get_condom_use_rate(self.current_year)
+        sus_risk_mult = self._susceptible_risk_multipliers(susceptible).tolist()
+
         # Vectorized contact draws for susceptible
         lams = np.array([max(0.0, p.contacts_per_year * dt) for p in susceptible], dtype=float)
         contact_counts = self._poisson_counts(lams)
 
+        # Age-bucket partner pools, built once per step
+        partner_bins = self._build_partner_bins(susceptible, infected)
+
         for idx, person in enumerate(susceptible):
             contacts = int(contact_counts[idx])
             for _ in range(contacts):
-                partner = self._select_partner(person, infected)
+                partner = self._select_partner(person, infected, partner_bins)
                 if not partner:
                     continue
                 
-                # Get time-varying transmission rate
-                time_varying_rate = self.get_time_varying_transmission_rate(self.current_year)
                 transmission_prob = partner.get_infectivity(self.current_year, time_varying_rate)
 
-                risk_multiplier = person.params.risk_group_multipliers[person.risk_group]
-                if (
-                    self.params.funding_cut_scenario
-                    and self.current_year >= self.params.funding_cut_year
-                    and person.risk_group in ['medium', 'high']
-                ):
-                    risk_multiplier *= (1.0 + self.params.kp_prevention_cut_magnitude)
-
-                transmission_prob *= risk_multiplier
+                transmission_prob *= sus_risk_mult[idx]
 
                 if person.gender == 'M' and self.rng.random() < 0.3:
                     transmission_prob *= 0.4
 
-                if self.rng.random() < self._get_condom_use_rate(self.current_year):
+                if self.rng.random() < condom_rate:
                     transmission_prob *= 0.15
 
                 if self.rng.random() < transmission_prob:
-                    # PHASE 1 ENHANCEMENT: Track transmission details
-                    person.hiv_status = "acute"
-                    person.infection_time = 0.0
-                    person.cd4_count = self.rng.normal(600, 100)
-                    person.transmission_donor_id = partner.id
-                    person.transmission_donor_stage = partner.hiv_status
-                    person.transmission_donor_viral_load = partner.viral_load
-                    person.transmission_year = self.current_year
+                    self._infect(person, partner)
                     break
     
+    @staticmethod
+    def _age_mixing_weight_table(n_bins: int, bin_size: int = 5) -> np.ndarray:
+        """Age-assortative mixing weights between age bins.
+
+        Uses the 5/10/20-year age-difference thresholds of partner selection,
+        measured between bin starts.
+        """
+        bins = np.arange(n_bins)
+        age_diff = np.abs(np.subtract.outer(bins, bins)) * bin_size
+        return np.select(
+            [age_diff <= 5, age_diff <= 10, age_diff <= 20],
+            [1.0, 0.5, 0.2],
+            default=0.05,
+        )
+
+    def _build_partner_bins(
+        self,
+        susceptible: List[Individual],
+        infected: List[Individual],
+        bin_size: int = 5,
+    ) -> Tuple[List[np.ndarray], np.ndarray]:
+        """Bucket infected partners by age bin and precompute bin-choice probabilities.
+
+        Returns the infected indices in each bin and, for each susceptible age
+        bin, the probability of drawing a partner from every bin (mixing weight
+        times the number of infected agents in that bin).
+        """
+        inf_ages = np.fromiter((p.age for p in infected), dtype=float, count=len(infected))
+        max_age = max(float(inf_ages.max()), max(p.age for p in susceptible))
+        n_bins = int(max_age // bin_size) + 1
+
+        inf_bins = (inf_ages // bin_size).astype(np.int64)
+        order = np.argsort(inf_bins, kind='stable')
+        bin_counts = np.bincount(inf_bins, minlength=n_bins)
+        members = np.split(order, np.cumsum(bin_counts)[:-1])
+
+        weights = self._age_mixing_weight_table(n_bins, bin_size) * bin_counts
+        probs = weights / weights.sum(axis=1, keepdims=True)
+        return members, probs
+
     def _select_partner(
         self,
         person: Individual,
         infected: List[Individual],
+        partner_bins: Optional[Tuple[List[np.ndarray], np.ndarray]] = None,
     ) -> Optional[Individual]:
         """Select sexual partner with assortative mixing."""
         if not infected:
             return None
-        
-        # Age assortative mixing
-        age_preferences = []
-        for partner in infected:
-            age_diff = abs(person.age - partner.age)
-            if age_diff <= 5:
-                weight = 1.0
-            elif age_diff <= 10:
-                weight = 0.5
-            elif age_diff <= 20:
-                weight = 0.2
-            else:
-                weight = 0.05
-            age_preferences.append(weight)
-        
-        # Normalize weights
-        total_weight = sum(age_preferences)
-        if total_weight == 0:
-            return infected[int(self.rng.integers(len(infected)))]
-        
-        # Use numpy choice with indices
-        probs = [w / total_weight for w in age_preferences]
-        chosen_index = int(self.rng.choice(len(infected), p=probs))
-        return infected[chosen_index]
+        if partner_bins is None:
+            partner_bins = self._build_partner_bins([person], infected)
+        members, probs = partner_bins
+
+        # Age assortative mixing: pick a bin, then a partner uniformly within it
+        bin_size = 5
+        chosen_bin = int(self.rng.choice(len(members), p=probs[int(person.age // bin_size)]))
+        pool = members[chosen_bin]
+        return infected[int(pool[int(self.rng.integers(len(pool)))])]
     
     def _get_condom_use_rate(self, year: float) -> float:
-        """Get condom use rate from ParameterMapper."""
-        return self.mapper.get_condom_coverage(year)
+        """Get condom use rate from the precomputed curve, or ParameterMapper off-grid."""
+        rate = self._condom_curve.get(year)
+        if rate is None:
+            rate = self.mapper.get_condom_coverage(year)
+        return rate
     
     def _mortality_events(self, dt: float):
         """Handle mortality with age-specific natural rates and HIV-specific mortality."""
-        
-        for individual in self.population[:]:
-            if not individual.alive:
-                continue
-            
-            # Age-specific natural (non-HIV) mortality
-            natural_death_rate = get_age_specific_mortality_rate(
-                individual.age,
-                self.current_year
+        people = self._alive_individuals()
+        if not people:
+            return
+        cols = self._population_columns(people)
+        status = cols['status']
+        on_art = cols['on_art']
+        suppressed = cols['viral_load_suppressed']
+        cd4 = cols['cd4_count']
+
+        # Age-specific natural (non-HIV) mortality
+        natural_death_rate = get_age_specific_mortality_rates(cols['age'], self.current_year)
+
+        # HIV-specific mortality (separate from natural), by disease stage
+        stage_mortality = self._stage_mortality
+        if self.use_numba:
+            # Same hazard as below, fused into one pass without temporaries
+            hiv_death_rate = hiv_mortality_rates_numba(status, on_art, suppressed, cd4, stage_mortality)
+        else:
+            hiv_death_rate = stage_mortality[status]
+
+            # ART dramatically reduces HIV mortality: 96% with viral suppression,
+            # 70% even without suppression
+            hiv_death_rate = np.where(
+                on_art, hiv_death_rate * np.where(suppressed, 0.04, 0.30), hiv_death_rate
             )
-            
-            # HIV-specific mortality (separate from natural)
-            hiv_death_rate = 0.0
-            
-            if individual.hiv_status != "susceptible":
-                # Base HIV mortality by disease stage
-                stage_mortality = {
-                    "acute": 0.02,      # 2% annual mortality in acute phase
-                    "chronic": 0.05,    # 5% annual mortality in chronic phase
-                    "aids": 0.30        # 30% annual mortality in AIDS stage
-                }
-                
-                hiv_death_rate = stage_mortality.get(individual.hiv_status, 0.0)
-                
-                # ART dramatically reduces HIV mortality
-                if individual.on_art:
-                    if individual.viral_load_suppressed:
-                        # 96% mortality reduction with viral suppression
-                        hiv_death_rate *= 0.04
-                    else:
-                        # 70% reduction even without suppression
-                        hiv_death_rate *= 0.30
-                
-                # CD4 count effect (lower CD4 = higher mortality)
-                if hasattr(individual, 'cd4_count'):
-                    if individual.cd4_count < 200:
-                        hiv_death_rate *= 2.0  # Double mortality risk
-                    elif individual.cd4_count < 350:
-                        hiv_death_rate *= 1.5
-            
-            # Combined mortality rate
-            total_death_rate = natural_death_rate + hiv_death_rate
-            
-            # Stochastic death event
-            if self.rng.random() < total_death_rate * dt:
-                individual.alive = False
-                
-                # Classify death cause (for tracking)
-                if hiv_death_rate > natural_death_rate:
-                    cause = "HIV"
-                    self.deaths_hiv_this_year += 1
-                else:
-                    cause = "Natural"
-                    self.deaths_natural_this_year += 1
-                individual.death_cause = cause
-                self.population.remove(individual)
+
+            # CD4 count effect (lower CD4 = higher mortality)
+            hiv_death_rate = hiv_death_rate * np.where(
+                cd4 < 200, 2.0, np.where(cd4 < 350, 1.5, 1.0)
+            )
+
+        # Combined mortality rate and a single stochastic draw for all agents
+        total_death_rate = natural_death_rate + hiv_death_rate
+        died = self.rng.random(len(people)) < total_death_rate * dt
+        if not died.any():
+            return
+
+        # Classify death cause (for tracking)
+        hiv_cause = hiv_death_rate > natural_death_rate
+        self.deaths_hiv_this_year += int(np.count_nonzero(died & hiv_cause))
+        self.deaths_natural_this_year += int(np.count_nonzero(died & ~hiv_cause))
+        for i in np.flatnonzero(died):
+            individual = people[i]
+            individual.alive = False
+            individual.death_cause = "HIV" if hiv_cause[i] else "Natural"
+
+        self._n_dead += int(np.count_nonzero(died))
+        if self._step_alive is not None:
+            self._step_alive = [p for p in people if p.alive]
+        if self._n_dead > 0.5 * len(self.population):
+            self._compact_population()
+
+    def _compact_population(self, sort_by_status: bool = False):
+        """Drop dead individuals from the population list in a single pass.
+
+        With ``sort_by_status`` the survivors are also stably grouped by HIV
+        status, so susceptible and infected individuals are scanned as runs.
+        """
+        self.population = [p for p in self.population if p.alive]
+        if sort_by_status:
+            codes = HIV_STATUS_CODES
+            self.population.sort(key=lambda p: codes[p.hiv_status])
+        self._n_dead = 0
     
     def _birth_events(self, dt: float):
         """Handle births with age-specific fertility and mother-to-child transmission."""
-        # Group women by age brackets (5-year groups)
-        fertile_age_groups = [15, 20, 25, 30, 35, 40, 45]
-        
-        total_births = 0
-        
-        for age_start in fertile_age_groups:
-            age_end = age_start + 5
-            
-            # Get women in this age group
-            women_in_group = [
-                p for p in self.population
-                if p.alive and p.gender == 'F' 
-                and age_start <= p.age < age_end
-            ]
-            
-            if not women_in_group:
-                continue
-            
-            # Get age-specific fertility rate for this group
-            # Use midpoint of age group for rate lookup
-            mid_age = age_start + 2.5
-            fertility_rate = get_age_specific_fertility_rate(mid_age, self.current_year)
-            
-            # Calculate expected births for this age group
-            expected_births = len(women_in_group) * fertility_rate * dt
-            
-            # Sample actual births from Poisson distribution
-            births_in_group = int(self.rng.poisson(expected_births))
-            total_births += births_in_group
-            
-            # Create babies for this age group
-            for _ in range(births_in_group):
-                mother = women_in_group[int(self.rng.integers(len(women_in_group)))]
-                gender = self.rng.choice(['M', 'F'])
-                
-                # Baby inherits mother's region
-                baby = Individual(
-                    self.agent_id_counter, 
-                    0, 
-                    gender, 
-                    self.params, 
-                    rng=self.rng,
-                    region=mother.region
-                )
-                self.agent_id_counter += 1
-
-                # Mother-to-child transmission with evolving PMTCT guidelines
-                if mother.hiv_status in ["acute", "chronic", "aids"]:
-                    # Enhanced PMTCT rates based on viral load and ART status
-                    if self.current_year < 2004:
-                        mtct_rate = 0.25  # Pre-PMTCT era
-                    elif self.current_year < 2010:
-                        if mother.on_art and mother.viral_load_suppressed:
-                            mtct_rate = 0.02  # Suppressed on ART
-                        elif mother.on_art:
-                            mtct_rate = 0.05  # On ART but not suppressed
-                        else:
-                            mtct_rate = 0.15  # No treatment
-                    elif self.current_year < 2016:
-                        if mother.on_art and mother.viral_load_suppressed:
-                            mtct_rate = 0.01  # Option B+
-                        elif mother.on_art:
-                            mtct_rate = 0.03
-                        else:
-                            mtct_rate = 0.12
-                    else:
-                        # "Treat All" era with improved PMTCT
-                        if mother.on_art and mother.viral_load_suppressed:
-                            mtct_rate = 0.005  # <1% transmission
-                        elif mother.on_art:
-                            mtct_rate = 0.02
-                        else:
-                            mtct_rate = 0.10
+        # Group women by age brackets (5-year groups, 15-49)
+        fertile_age_groups = np.array([15, 20, 25, 30, 35, 40, 45])
+        alive = self._alive_individuals()
 
-                    if self.rng.random() < mtct_rate:
-                        baby.hiv_status = "chronic"
-                        baby.infection_time = 0.0
-                        baby.viral_load = self.rng.lognormal(8, 1)  # Moderate VL in infants
+        women = [p for p in alive if p.gender == 'F' and 15 <= p.age < 50]
+        if not women:
+            return
+        ages = np.fromiter((p.age for p in women), dtype=float, count=len(women))
+        group = ((ages - 15) // 5).astype(np.int64)
+        women_per_group = np.bincount(group, minlength=len(fertile_age_groups))
+
+        # Age-specific fertility rates, looked up at each group's midpoint
+        fertility_rates = np.array([
+            get_age_specific_fertility_rate(age_start + 2.5, self.current_year)
+            for age_start in fertile_age_groups
+        ])
 
-                self.population.append(baby)
-        
-        self.births_this_year += int(total_births)
+        # Sample births for all age groups from one Poisson draw
+        births_per_group = self.rng.poisson(women_per_group * fertility_rates * dt)
+        total_births = int(births_per_group.sum())
+        if total_births == 0:
+            return
+
+        # Mothers drawn uniformly within their age group
+        order = np.argsort(group, kind='stable')
+        group_starts = np.concatenate(([0], np.cumsum(women_per_group)[:-1]))
+        mother_group = np.repeat(np.arange(len(fertile_age_groups)), births_per_group)
+        within = np.floor(self.rng.random(total_births) * women_per_group[mother_group]).astype(np.int64)
+        mothers = [women[i] for i in order[group_starts[mother_group] + within]]
+        is_male = self.rng.random(total_births) < 0.5
+
+        # Mother-to-child transmission with evolving PMTCT guidelines
+        mtct_rates = self._get_mtct_rates(self.current_year)
+        mtct_rate = np.array([
+            0.0 if m.hiv_status == "susceptible"
+            else mtct_rates['suppressed'] if m.on_art and m.viral_load_suppressed
+            else mtct_rates['on_art'] if m.on_art
+            else mtct_rates['untreated']
+            for m in mothers
+        ])
+        infected_at_birth = self.rng.random(total_births) < mtct_rate
+        infant_viral_load = self.rng.lognormal(8, 1, size=total_births)  # Moderate VL in infants
+
+        babies = []
+        for k, mother in enumerate(mothers):
+            # Baby inherits mother's region
+            baby = Individual(
+                self.agent_id_counter,
+                0,
+                'M' if is_male[k] else 'F',
+                self.params,
+                rng=self.rng,
+                region=mother.region
+            )
+            self.agent_id_counter += 1
+            if infected_at_birth[k]:
+                baby.hiv_status = "chronic"
+                baby.infection_time = 0.0
+                baby.viral_load = float(infant_viral_load[k])
+            babies.append(baby)
+
+        self.population.extend(babies)
+        if self._step_alive is not None:
+            self._step_alive.extend(babies)
+        self.births_this_year += total_births
+
+    def _get_mtct_rates(self, year: float) -> Dict[str, float]:
+        """Mother-to-child transmission rates by maternal treatment status for a year."""
+        # Enhanced PMTCT rates based on viral load and ART status
+        if year < 2004:
+            # Pre-PMTCT era
+            return {'suppressed': 0.25, 'on_art': 0.25, 'untreated': 0.25}
+        elif year < 2010:
+            # Suppressed on ART / on ART but not suppressed / no treatment
+            return {'suppressed': 0.02, 'on_art': 0.05, 'untreated': 0.15}
+        elif year < 2016:
+            # Option B+
+            return {'suppressed': 0.01, 'on_art': 0.03, 'untreated': 0.12}
+        else:
+            # "Treat All" era with improved PMTCT (<1% transmission when suppressed)
+            return {'suppressed': 0.005, 'on_art': 0.02, 'untreated': 0.10}
 
     def _get_series_value(self, series_dict, year: float) -> float:
         """Interpolate from year->value mapping. Clamps outside range."""
@@ -785,6 +1115,38 @@ class EnhancedHIVModel:
         """Get birth rate from ParameterMapper."""
         return self.mapper.get_birth_rate(year)
     
+    def _population_columns(self, people: List[Individual]) -> Dict[str, np.ndarray]:
+        """Gather per-agent state into NumPy columns for vectorized reductions.
+
+        Columns use compact dtypes (int8 codes, float32 CD4, bool flags) to
+        cut memory traffic; times and age stay float64 since they are compared
+        against exact year thresholds and mortality band edges.
+        """
+        n = len(people)
+        codes = HIV_STATUS_CODES
+        return {
+            'status': np.fromiter((codes[p.hiv_status] for p in people), dtype=np.int8, count=n),
+            'on_art': np.fromiter((p.on_art for p in people), dtype=bool, count=n),
+            'viral_load_suppressed': np.fromiter(
+                (getattr(p, 'viral_load_suppressed', False) for p in people), dtype=bool, count=n
+            ),
+            'tested': np.fromiter((getattr(p, 'tested', False) for p in people), dtype=bool, count=n),
+            'diagnosed': np.fromiter(
+                (getattr(p, 'diagnosed', False) for p in people), dtype=bool, count=n
+            ),
+            'age': np.fromiter((p.age for p in people), dtype=float, count=n),
+            'cd4_count': np.fromiter((p.cd4_count for p in people), dtype=np.float32, count=n),
+            'infection_time': np.fromiter((p.infection_time for p in people), dtype=float, count=n),
+            'last_test_year': np.fromiter(
+                (
+                    np.nan if getattr(p, 'last_test_year', None) is None else p.last_test_year
+                    for p in people
+                ),
+                dtype=float,
+                count=n,
+            ),
+        }
+
     def _record_results(self, year: int):
         """
         Record comprehensive simulation results separating TRUE vs DETECTED values.
@@ -792,84 +1154,66 @@ class EnhancedHIVModel:
         TRUE values = actual epidemiological state (ground truth)
         DETECTED values = what health system observes based on testing coverage
         """
-        alive = [p for p in self.population if p.alive]
+        alive = self._alive_individuals()
         total_pop = len(alive)
 
+        # Gather the per-agent state once and reduce with masked counts
+        cols = self._population_columns(alive)
+        status = cols['status']
+        hiv_pos = status != STATUS_SUSCEPTIBLE
+        on_art = cols['on_art']
+        tested = cols['tested']
+        diagnosed = cols['diagnosed']
+
         # ==================== TRUE VALUES (GROUND TRUTH) ====================
         # These represent the actual epidemiological state, independent of testing
-        
-        susceptible = len([p for p in alive if p.hiv_status == "susceptible"])
-        true_acute = len([p for p in alive if p.hiv_status == "acute"])
-        true_chronic = len([p for p in alive if p.hiv_status == "chronic"])
-        true_aids = len([p for p in alive if p.hiv_status == "aids"])
-        
+
+        susceptible, true_acute, true_chronic, true_aids = (
+            int(c) for c in np.bincount(status, minlength=len(HIV_STATUS_CODES))
+        )
+
         true_hiv_positive = true_acute + true_chronic + true_aids
         true_hiv_prevalence = (true_hiv_positive / total_pop) if total_pop > 0 else 0
 
         # New infections (infected within last year) - TRUE count
-        true_new_infections = len([
-            p for p in alive
-            if p.hiv_status in ["acute", "chronic", "aids"]
-            and p.infection_time < 1.0
-        ])
+        true_new_infections = int(np.count_nonzero(hiv_pos & (cols['infection_time'] < 1.0)))
 
         # TRUE treatment status
-        true_on_art = len([p for p in alive if p.on_art])
-        true_virally_suppressed = len([
-            p for p in alive 
-            if p.on_art and hasattr(p, 'viral_load_suppressed') and p.viral_load_suppressed
-        ])
+        true_on_art = int(np.count_nonzero(on_art))
+        true_virally_suppressed = int(np.count_nonzero(on_art & cols['viral_load_suppressed']))
         true_art_coverage = (true_on_art / true_hiv_positive) if true_hiv_positive > 0 else 0
 
         # ==================== DETECTED VALUES (HEALTH SYSTEM VIEW) ====================
         # These represent what the health system knows based on testing coverage
-        
+
         # People who have ever been tested
-        tested_ever = len([p for p in alive if hasattr(p, 'tested') and p.tested])
-        
-        # People tested in last 12 months
-        tested_this_year = len([
-            p for p in alive
-            if hasattr(p, 'last_test_year') and p.last_test_year is not None
-            and (year - p.last_test_year) <= 1.0
-        ])
-        
+        tested_ever = int(np.count_nonzero(tested))
+
+        # People tested in last 12 months (never-tested agents carry NaN)
+        tested_this_year = int(np.count_nonzero((year - cols['last_test_year']) <= 1.0))
+
         # Diagnosed = knows HIV+ status (has been tested AND received positive result)
-        diagnosed = len([p for p in alive if hasattr(p, 'diagnosed') and p.diagnosed])
-        
+        diagnosed_count = int(np.count_nonzero(diagnosed))
+
         # Detected HIV+ = subset of diagnosed who are truly HIV+
-        detected_hiv_positive = len([
-            p for p in alive 
-            if p.hiv_status in ["acute", "chronic", "aids"] 
-            and hasattr(p, 'diagnosed') and p.diagnosed
-        ])
-        
+        detected_hiv_positive = int(np.count_nonzero(hiv_pos & diagnosed))
+
         detected_prevalence = (detected_hiv_positive / total_pop) if total_pop > 0 else 0
         detected_art_coverage = (true_on_art / detected_hiv_positive) if detected_hiv_positive > 0 else 0
 
         # ==================== UNDETECTED GAP (MISSED DIAGNOSES) ====================
         # Critical metrics showing the gap between reality and what health system knows
-        
+
         undiagnosed_hiv_positive = true_hiv_positive - detected_hiv_positive
         undiagnosed_rate = (undiagnosed_hiv_positive / true_hiv_positive) if true_hiv_positive > 0 else 0
-        
+
         # Missed diagnoses = HIV+ people who could have been detected if testing coverage was 100%
         # This accounts for both:
         # 1. People never tested
         # 2. People tested but result not received/recorded
-        hiv_positive_never_tested = len([
-            p for p in alive
-            if p.hiv_status in ["acute", "chronic", "aids"]
-            and (not hasattr(p, 'tested') or not p.tested)
-        ])
-        
-        hiv_positive_tested_not_diagnosed = len([
-            p for p in alive
-            if p.hiv_status in ["acute", "chronic", "aids"]
-            and hasattr(p, 'tested') and p.tested
-            and (not hasattr(p, 'diagnosed') or not p.diagnosed)
-        ])
-        
+        hiv_positive_never_tested = int(np.count_nonzero(hiv_pos & ~tested))
+        hiv_positive_tested_not_diagnosed = int(np.count_nonzero(hiv_pos & tested & ~diagnosed))
+
         missed_diagnoses = hiv_positive_never_tested + hiv_positive_tested_not_diagnosed
 
         # ==================== TESTING SYSTEM PERFORMANCE ====================
@@ -887,45 +1231,47 @@ class EnhancedHIVModel:
 
         # ==================== STORE ALL RESULTS ====================
         
-        self.results['year'].append(year)
-        self.results['total_population'].append(total_pop)
-        self.results['susceptible'].append(susceptible)
+        record: Dict[str, Any] = {}
+        record['year'] = year
+        record['total_population'] = total_pop
+        record['susceptible'] = susceptible
         
         # TRUE values (ground truth)
-        self.results['true_hiv_positive'].append(true_hiv_positive)
-        self.results['true_acute'].append(true_acute)
-        self.results['true_chronic'].append(true_chronic)
-        self.results['true_aids'].append(true_aids)
-        self.results['true_new_infections'].append(true_new_infections)
-        self.results['true_hiv_prevalence'].append(true_hiv_prevalence)
-        self.results['true_on_art'].append(true_on_art)
-        self.results['true_virally_suppressed'].append(true_virally_suppressed)
-        self.results['true_art_coverage'].append(true_art_coverage)
+        record['true_hiv_positive'] = true_hiv_positive
+        record['true_acute'] = true_acute
+        record['true_chronic'] = true_chronic
+        record['true_aids'] = true_aids
+        record['true_new_infections'] = true_new_infections
+        record['true_hiv_prevalence'] = true_hiv_prevalence
+        record['true_on_art'] = true_on_art
+        record['true_virally_suppressed'] = true_virally_suppressed
+        record['true_art_coverage'] = true_art_coverage
         
         # DETECTED values (health system view)
-        self.results['detected_hiv_positive'].append(detected_hiv_positive)
-        self.results['diagnosed'].append(diagnosed)
-        self.results['tested_ever'].append(tested_ever)
-        self.results['tested_this_year'].append(tested_this_year)
-        self.results['detected_prevalence'].append(detected_prevalence)
-        self.results['detected_art_coverage'].append(detected_art_coverage)
+        record['detected_hiv_positive'] = detected_hiv_positive
+        record['diagnosed'] = diagnosed_count
+        record['tested_ever'] = tested_ever
+        record['tested_this_year'] = tested_this_year
+        record['detected_prevalence'] = detected_prevalence
+        record['detected_art_coverage'] = detected_art_coverage
         
         # UNDETECTED gap
-        self.results['undiagnosed_hiv_positive'].append(undiagnosed_hiv_positive)
-        self.results['undiagnosed_rate'].append(undiagnosed_rate)
-        self.results['missed_diagnoses'].append(missed_diagnoses)
+        record['undiagnosed_hiv_positive'] = undiagnosed_hiv_positive
+        record['undiagnosed_rate'] = undiagnosed_rate
+        record['missed_diagnoses'] = missed_diagnoses
         
         # Testing system performance
-        self.results['testing_coverage_achieved'].append(testing_coverage_achieved)
-        self.results['testing_capacity_used'].append(testing_coverage_achieved)  # Same for now
-        self.results['tests_performed_this_year'].append(tests_performed)
-        self.results['positive_tests_this_year'].append(positive_tests)
-        self.results['false_negative_rate'].append(false_negative_rate)
+        record['testing_coverage_achieved'] = testing_coverage_achieved
+        record['testing_capacity_used'] = testing_coverage_achieved  # Same for now
+        record['tests_performed_this_year'] = tests_performed
+        record['positive_tests_this_year'] = positive_tests
+        record['false_negative_rate'] = false_negative_rate
         
         # Deaths and births
-        self.results['deaths_hiv'].append(self.deaths_hiv_this_year)
-        self.results['deaths_natural'].append(self.deaths_natural_this_year)
-        self.results['births'].append(self.births_this_year)
+        record['deaths_hiv'] = self.deaths_hiv_this_year
+        record['deaths_natural'] = self.deaths_natural_this_year
+        record['births'] = self.births_this_year
+        self._store_record(record)
 
         # Record detailed age-sex stratified results
         self.detailed_results[year] = self._collect_detailed_indicators(alive)
@@ -933,11 +1279,7 @@ class EnhancedHIVModel:
         # Optional streaming callback per-year
         if self._on_year_result is not None:
             try:
-                last_idx = len(self.results['year']) - 1
-                row = {
-                    k: self.results[k][last_idx]
-                    for k in self.results
-                }
+                row = dict(record)
                 # Include progress if possible
                 try:
                     if self._run_total_years > 0:
@@ -958,6 +1300,24 @@ class EnhancedHIVModel:
         self.deaths_natural_this_year = 0
         self.births_this_year = 0
     
+    def _reserve_results(self, n_records: int):
+        """Grow the preallocated result columns to hold ``n_records`` more rows."""
+        capacity = self._n_records + n_records
+        reserved = {}
+        for key, column in self.results.items():
+            dtype = float if key in RESULT_RATE_FIELDS else np.int64
+            reserved[key] = np.empty(capacity, dtype=dtype)
+            reserved[key][:self._n_records] = column[:self._n_records]
+        self.results = reserved
+
+    def _store_record(self, record: Dict[str, Any]):
+        """Write one row of annual results into the preallocated columns."""
+        if self._n_records >= len(self.results['year']):
+            self._reserve_results(max(1, self._n_records))
+        for key, value in record.items():
+            self.results[key][self._n_records] = value
+        self._n_records += 1
+
     def _collect_detailed_indicators(self, alive: List[Individual]) -> Dict:
         """Collect comprehensive age-sex-region stratified HIV indicators."""
         
@@ -1042,6 +1402,21 @@ class EnhancedHIVModel:
             'fertility_patterns': fertility_patterns
         }
     
+    def _age_sex_columns(self, alive: List[Individual]) -> Tuple[np.ndarray, ...]:
+        """Age (float64, for exact band edges), sex masks and HIV+ mask of ``alive``."""
+        n = len(alive)
+        age = np.fromiter((p.age for p in alive), dtype=float, count=n)
+        male = np.fromiter((p.gender == 'M' for p in alive), dtype=bool, count=n)
+        female = np.fromiter((p.gender == 'F' for p in alive), dtype=bool, count=n)
+        status = np.fromiter((HIV_STATUS_CODES[p.hiv_status] for p in alive), dtype=np.int8, count=n)
+        return age, male, female, status != STATUS_SUSCEPTIBLE
+
+    @staticmethod
+    def _age_band_membership(age: np.ndarray, bands: List[Tuple[int, int]]) -> np.ndarray:
+        """Boolean (bands x people) matrix of inclusive ``min <= age <= max`` membership."""
+        edges = np.asarray(bands, dtype=float)
+        return (age >= edges[:, :1]) & (age <= edges[:, 1:])
+
     def _calculate_age_sex_prevalence(self, alive: List[Individual]) -> Dict:
         """Calculate HIV prevalence by 5-year age bands and sex (15-64)."""
         
@@ -1051,27 +1426,20 @@ class EnhancedHIVModel:
             (40, 44), (45, 49), (50, 54), (55, 59), (60, 64)
         ]
         
+        # Band membership for everyone at once instead of one scan per group
+        age, male, female, hiv_positive = self._age_sex_columns(alive)
+        in_band = self._age_band_membership(age, age_bands)
+        
         prevalence_data = {}
         
-        for sex in ['M', 'F']:
+        for sex, sex_mask in (('M', male), ('F', female)):
             prevalence_data[sex] = {}
+            group = in_band & sex_mask
+            totals = np.count_nonzero(group, axis=1)
+            positives = np.count_nonzero(group & hiv_positive, axis=1)
             
-            for min_age, max_age in age_bands:
-                # Get population in this age-sex group
-                group_pop = [
-                    p for p in alive
-                    if p.gender == sex and min_age <= p.age <= max_age
-                ]
-
-                # Count HIV-positive individuals
-                hiv_positive = [
-                    p for p in group_pop
-                    if p.hiv_status in ["acute", "chronic", "aids"]
-                ]
-                
+            for (min_age, max_age), total, positive in zip(age_bands, totals.tolist(), positives.tolist()):
                 # Calculate prevalence percentage
-                total = len(group_pop)
-                positive = len(hiv_positive)
                 prevalence_pct = (positive / total * 100) if total > 0 else 0
                 
                 band_name = f"{min_age}-{max_age}"
@@ -1086,45 +1454,27 @@ class EnhancedHIVModel:
     def _calculate_age_sex_incidence(self, alive: List[Individual]) -> Dict:
         """Calculate HIV incidence rates by age groups and sex."""
         
-        # Get individuals infected in the last year
-        recently_infected = [
-            p for p in alive
-            if p.hiv_status in ["acute", "chronic", "aids"]
-            and p.infection_time <= 1.0
-        ]
+        age, male, female, hiv_positive = self._age_sex_columns(alive)
+        infection_time = np.fromiter((p.infection_time for p in alive), dtype=float, count=len(alive))
+        
+        # Individuals infected in the last year
+        recently_infected = hiv_positive & (infection_time <= 1.0)
         
         age_groups = ['15-24', '25-34', '35-49', '15-49', '15-64']
+        in_group = self._age_band_membership(
+            age, [tuple(map(int, age_group.split('-'))) for age_group in age_groups]
+        )
         incidence_data = {}
         
-        for age_group in age_groups:
-            min_age, max_age = map(int, age_group.split('-'))
+        for age_group, members in zip(age_groups, in_group):
             incidence_data[age_group] = {}
             
-            for sex in ['M', 'F', 'Total']:
-                if sex == 'Total':
-                    # All individuals in age group
-                    group_pop = [
-                        p for p in alive
-                        if min_age <= p.age <= max_age
-                    ]
-                    new_infections = [
-                        p for p in recently_infected
-                        if min_age <= p.age <= max_age
-                    ]
-                else:
-                    # Sex-specific groups
-                    group_pop = [
-                        p for p in alive
-                        if p.gender == sex and min_age <= p.age <= max_age
-                    ]
-                    new_infections = [
-                        p for p in recently_infected
-                        if p.gender == sex and min_age <= p.age <= max_age
-                    ]
+            for sex, sex_mask in (('M', male), ('F', female), ('Total', None)):
+                group = members if sex_mask is None else members & sex_mask
                 
                 # Calculate annual incidence rate per 1000
-                total_pop = len(group_pop)
-                new_inf = len(new_infections)
+                total_pop = int(np.count_nonzero(group))
+                new_inf = int(np.count_nonzero(group & recently_infected))
                 incidence_rate = (new_inf / total_pop * 1000) if total_pop > 0 else 0
                 
                 incidence_data[age_group][sex] = {
@@ -1144,14 +1494,14 @@ class EnhancedHIVModel:
             '15-24': (15, 24)
         }
         
+        age, _, _, hiv_positive = self._age_sex_columns(alive)
+        in_group = self._age_band_membership(age, list(age_groups.values()))
+        totals = np.count_nonzero(in_group, axis=1).tolist()
+        positives = np.count_nonzero(in_group & hiv_positive, axis=1).tolist()
+        
         aggregates = {}
         
-        for group_name, (min_age, max_age) in age_groups.items():
-            adults = [p for p in alive if min_age <= p.age <= max_age]
-            hiv_positive = [p for p in adults if p.hiv_status in ["acute", "chronic", "aids"]]
-            
-            total = len(adults)
-            positive = len(hiv_positive)
+        for group_name, total, positive in zip(age_groups, totals, positives):
             prevalence_pct = (positive / total * 100) if total > 0 else 0
             
             aggregates[group_name] = {
@@ -1323,46 +1673,55 @@ class EnhancedHIVModel:
     
     def _calculate_regional_prevalence(self, alive: List[Individual]) -> Dict:
         """Calculate HIV prevalence by region."""
-        from hivec_cm.core.demographic_parameters import REGIONAL_DISTRIBUTION
+        
+        regions = list(REGIONAL_DISTRIBUTION.keys())
+        region_index = {region: i for i, region in enumerate(regions)}
+        n_regions = len(regions)
+        
+        # Per-person columns, then one bincount per indicator instead of
+        # rescanning the population for every region
+        age, male, female, hiv_positive = self._age_sex_columns(alive)
+        region = np.fromiter(
+            (region_index.get(getattr(p, 'region', None), -1) for p in alive),
+            dtype=np.int64,
+            count=len(alive),
+        )
+        known = region >= 0
+        adults_15_49 = (age >= 15) & (age <= 49)
+        
+        def per_region(mask: np.ndarray) -> List[int]:
+            return np.bincount(region[known & mask], minlength=n_regions).tolist()
+        
+        totals = per_region(known)
+        positives = per_region(hiv_positive)
+        adults = per_region(adults_15_49)
+        adults_positive = per_region(adults_15_49 & hiv_positive)
+        males = per_region(male)
+        females = per_region(female)
+        males_positive = per_region(male & hiv_positive)
+        females_positive = per_region(female & hiv_positive)
         
         regional_data = {}
         
-        for region in REGIONAL_DISTRIBUTION.keys():
-            # Get population in this region
-            region_pop = [p for p in alive if hasattr(p, 'region') and p.region == region]
-            
-            if not region_pop:
+        for i, name in enumerate(regions):
+            if not totals[i]:
                 continue
             
-            # Count HIV+ individuals
-            hiv_positive = [p for p in region_pop if p.hiv_status in ["acute", "chronic", "aids"]]
-            
-            # Age-specific prevalence (15-49)
-            adults_15_49 = [p for p in region_pop if 15 <= p.age <= 49]
-            hiv_pos_15_49 = [p for p in adults_15_49 if p.hiv_status in ["acute", "chronic", "aids"]]
-            
-            # Gender-specific
-            males = [p for p in region_pop if p.gender == 'M']
-            females = [p for p in region_pop if p.gender == 'F']
-            hiv_pos_males = [p for p in males if p.hiv_status in ["acute", "chronic", "aids"]]
-            hiv_pos_females = [p for p in females if p.hiv_status in ["acute", "chronic", "aids"]]
-            
-            regional_data[region] = {
-                'total_population': len(region_pop),
-                'hiv_positive': len(hiv_positive),
-                'prevalence_all_ages_pct': (len(hiv_positive) / len(region_pop) * 100) if region_pop else 0,
-                'prevalence_15_49_pct': (len(hiv_pos_15_49) / len(adults_15_49) * 100) if adults_15_49 else 0,
-                'prevalence_male_pct': (len(hiv_pos_males) / len(males) * 100) if males else 0,
-                'prevalence_female_pct': (len(hiv_pos_females) / len(females) * 100) if females else 0,
-                'male_count': len(males),
-                'female_count': len(females)
+            regional_data[name] = {
+                'total_population': totals[i],
+                'hiv_positive': positives[i],
+                'prevalence_all_ages_pct': positives[i] / totals[i] * 100,
+                'prevalence_15_49_pct': (adults_positive[i] / adults[i] * 100) if adults[i] else 0,
+                'prevalence_male_pct': (males_positive[i] / males[i] * 100) if males[i] else 0,
+                'prevalence_female_pct': (females_positive[i] / females[i] * 100) if females[i] else 0,
+                'male_count': males[i],
+                'female_count': females[i]
             }
         
         return regional_data
     
     def _calculate_regional_cascade(self, alive: List[Individual]) -> Dict:
         """Calculate 95-95-95 cascade by region."""
-        from hivec_cm.core.demographic_parameters import REGIONAL_DISTRIBUTION
         
         regional_cascade = {}
         
@@ -1399,7 +1758,6 @@ class EnhancedHIVModel:
     
     def _calculate_regional_demographics(self, alive: List[Individual]) -> Dict:
         """Calculate demographic indicators by region."""
-        from hivec_cm.core.demographic_parameters import REGIONAL_DISTRIBUTION
         
         regional_demog = {}
         
@@ -1440,7 +1798,6 @@ class EnhancedHIVModel:
     
     def _calculate_regional_age_sex_prevalence(self, alive: List[Individual]) -> Dict:
         """Calculate HIV prevalence by region, age, and sex."""
-        from hivec_cm.core.demographic_parameters import REGIONAL_DISTRIBUTION
         
         regional_age_sex = {}
         
@@ -2014,7 +2371,6 @@ class EnhancedHIVModel:
         
         # Regional breakdown of HBV-HIV
         regional_coinfection = {}
-        from hivec_cm.core.demographic_parameters import REGIONAL_DISTRIBUTION
         
         for region in REGIONAL_DISTRIBUTION.keys():
             region_hiv_pos = [p for p in hiv_positive
@@ -1,7 +1,21 @@
+import copy
 import json
+import os
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, Union
 
+try:  # optional C parser; the stdlib json module is the fallback
+    import orjson
+
+    def _loads(data: bytes) -> Dict:
+        return orjson.loads(data)
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+    def _loads(data: bytes) -> Dict:
+        return json.loads(data)
+
 @dataclass
 class ModelParameters:
     """
@@ -66,9 +80,22 @@ class ModelParameters:
 
 
 def load_parameters(path: str) -> ModelParameters:
-    """Loads model parameters from a JSON file."""
-    with open(path, 'r') as f:
-        config = json.load(f)
+    """Loads model parameters from a JSON file.
+
+    Parsed files are cached per (path, mtime). Every call returns its own
+    shallow copy, so fields can be reassigned freely; nested dict series
+    are shared with the cache and must be replaced rather than edited.
+    """
+    return copy.copy(
+        _load_parameters_cached(os.path.abspath(path), os.path.getmtime(path))
+    )
+
+
+@lru_cache(maxsize=32)
+def _load_parameters_cached(path: str, mtime: float) -> ModelParameters:
+    """Parse a parameter file; ``mtime`` only keys the cache."""
+    with open(path, 'rb') as f:
+        config = _loads(f.read())
     
     params = config['parameters']
     
@@ -2,16 +2,23 @@
 Optional numeric accelerators using Numba.
 
 Provides jitted kernels when Numba is available; falls back to NumPy otherwise.
+Kernels are compiled with ``cache=True`` so the machine code is reused across
+processes. Set ``HIVEC_DISABLE_NUMBA=1`` to skip Numba entirely (e.g. for quick
+test runs that should not pay the first-run compilation cost).
 """
 
 from __future__ import annotations
 
+import os
 from typing import Any
 
 import numpy as np
 
 try:
-    from numba import njit  # type: ignore
+    if os.environ.get("HIVEC_DISABLE_NUMBA", "").strip().lower() in ("1", "true", "yes"):
+        raise ImportError("Numba disabled via HIVEC_DISABLE_NUMBA")
+
+    from numba import njit, prange  # type: ignore
 
     NUMBA_AVAILABLE = True
 
@@ -28,8 +35,162 @@ try:
                 out[i] = np.random.poisson(lam)
         return out
 
+    @njit(cache=True, parallel=True)
+    def transmission_binned_numba(
+        contacts: np.ndarray,
+        contact_start: np.ndarray,
+        uniforms: np.ndarray,
+        sus_bin: np.ndarray,
+        sus_rg: np.ndarray,
+        sus_male: np.ndarray,
+        sus_risk_mult: np.ndarray,
+        pool_starts: np.ndarray,
+        n_bins: int,
+        inf_base: np.ndarray,
+        inf_art_prob: np.ndarray,
+        art_factor: float,
+        neighbor_offsets: np.ndarray,
+        neighbor_cdf: np.ndarray,
+        rg_cdf: np.ndarray,
+        condom_rate: float,
+    ) -> np.ndarray:  # pragma: no cover - numba
+        """Binned-mixing transmission; returns infecting partner index per susceptible.
+
+        Infected agents are pre-sorted by ``bin * n_risk_groups + risk_group`` and
+        ``pool_starts`` holds the CSR offsets of each (bin, risk group) pool.
+        ``uniforms`` holds seven pre-drawn U(0, 1) values per contact, with the
+        contacts of susceptible ``i`` starting at row ``contact_start[i]``, so
+        susceptibles are processed in parallel with reproducible results.
+        Entries of -1 mark susceptibles that were not infected this step.
+        """
+        n_sus = contacts.shape[0]
+        n_inf = inf_base.shape[0]
+        n_rg = rg_cdf.shape[0]
+        n_offsets = neighbor_offsets.shape[0]
+        out = np.full(n_sus, -1, dtype=np.int64)
+        for i in prange(n_sus):
+            for c in range(contact_start[i], contact_start[i] + contacts[i]):
+                u = uniforms[c]
+
+                # Pick an age bin with assortative preference
+                k = min(np.searchsorted(neighbor_cdf, u[0], side='right'), n_offsets - 1)
+                b = sus_bin[i] + neighbor_offsets[k]
+
+                # Choose partner risk group (prefer same)
+                rg = min(np.searchsorted(rg_cdf[sus_rg[i]], u[1], side='right'), n_rg - 1)
+
+                # Pool for (bin, risk group), then any risk group in bin, then global
+                lo = 0
+                hi = n_inf
+                if 0 <= b < n_bins:
+                    key = b * n_rg + rg
+                    if pool_starts[key + 1] > pool_starts[key]:
+                        lo = pool_starts[key]
+                        hi = pool_starts[key + 1]
+                    elif pool_starts[(b + 1) * n_rg] > pool_starts[b * n_rg]:
+                        lo = pool_starts[b * n_rg]
+                        hi = pool_starts[(b + 1) * n_rg]
+                j = min(lo + int(u[2] * (hi - lo)), hi - 1)
+
+                # Branchless modifiers: ART adherence, circumcision (30% of
+                # males, 60% reduction) and condom use (85% efficacy)
+                on_art = u[3] < inf_art_prob[j]
+                circumcised = sus_male[i] & (u[4] < 0.3)
+                condom = u[5] < condom_rate
+                prob = (
+                    inf_base[j]
+                    * (1.0 - (1.0 - art_factor) * on_art)
+                    * sus_risk_mult[i]
+                    * (1.0 - 0.6 * circumcised)
+                    * (1.0 - 0.85 * condom)
+                )
+                if u[6] < prob:
+                    out[i] = j
+                    break
+        return out
+
+    @njit(cache=True)
+    def disease_progression_numba(
+        status: np.ndarray,
+        cd4: np.ndarray,
+        infection_time: np.ndarray,
+        on_art: np.ndarray,
+        art_start_time: np.ndarray,
+        acute_duration: float,
+        chronic_duration: float,
+        dt: float,
+        normals: np.ndarray,
+        uniforms: np.ndarray,
+        art_normals: np.ndarray,
+        art_uniforms: np.ndarray,
+    ) -> None:  # pragma: no cover - numba
+        """Advance HIV stage, CD4 and ART effects in place.
+
+        Mirrors Individual._update_disease_progression followed by
+        Individual._update_treatment_effects. Status codes are 1 = acute,
+        2 = chronic, 3 = AIDS. ``normals``/``uniforms`` and
+        ``art_normals``/``art_uniforms`` hold one pre-drawn N(0, 1) and
+        U(0, 1) value per agent for each of the two updates.
+        """
+        for i in range(status.shape[0]):
+            if status[i] == 1:
+                if infection_time[i] > acute_duration:
+                    status[i] = 2
+                    cd4[i] = max(200.0, cd4[i] - (200.0 + 50.0 * normals[i]))
+            elif status[i] == 2 and not on_art[i]:
+                # Gradual CD4 decline and progression to AIDS
+                cd4[i] = max(0.0, cd4[i] - (50.0 + 20.0 * normals[i]) * dt)
+                if uniforms[i] < dt / chronic_duration:
+                    status[i] = 3
+                    cd4[i] = min(cd4[i], 200.0)
+
+            # CD4 recovery and AIDS reversal after 6 months on ART
+            if on_art[i] and infection_time[i] - art_start_time[i] > 0.5:
+                if cd4[i] < 500.0:
+                    cd4[i] = min(800.0, cd4[i] + (30.0 + 10.0 * art_normals[i]) * dt)
+                if status[i] == 3 and cd4[i] > 350.0 and art_uniforms[i] < 0.1 * dt:
+                    status[i] = 2
+
+    @njit(cache=True)
+    def hiv_mortality_rates_numba(
+        status: np.ndarray,
+        on_art: np.ndarray,
+        suppressed: np.ndarray,
+        cd4: np.ndarray,
+        stage_mortality: np.ndarray,
+    ) -> np.ndarray:  # pragma: no cover - numba
+        """Annual HIV-specific mortality hazard per agent in one fused pass.
+
+        Same closed form as the NumPy path in EnhancedHIVModel._mortality_events:
+        stage rate, times the ART factor (0.04 suppressed / 0.30 unsuppressed),
+        times the CD4 factor (2.0 below 200, 1.5 below 350).
+        """
+        n = status.shape[0]
+        out = np.empty(n, dtype=np.float64)
+        for i in range(n):
+            rate = stage_mortality[status[i]]
+            if on_art[i]:
+                rate = rate * (0.04 if suppressed[i] else 0.30)
+            if cd4[i] < 200:
+                rate = rate * 2.0
+            elif cd4[i] < 350:
+                rate = rate * 1.5
+            else:
+                rate = rate * 1.0
+            out[i] = rate
+        return out
+
 except Exception:  # Numba not present or incompatible
     NUMBA_AVAILABLE = False
 
     def poisson_counts_numba(lams: np.ndarray, seed: int) -> np.ndarray:
         raise RuntimeError("Numba is not available")
+
+    def transmission_binned_numba(*args: Any, **kwargs: Any) -> np.ndarray:
+        raise RuntimeError("Numba is not available")
+
+    def disease_progression_numba(*args: Any, **kwargs: Any) -> None:
+        raise RuntimeError("Numba is not available")
+
+    def hiv_mortality_rates_numba(*args: Any, **kwargs: Any) -> np.ndarray:
+        raise RuntimeError("Numba is not available")
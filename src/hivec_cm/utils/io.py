@@ -0,0 +1,28 @@
+"""
+Result table output helpers.
+"""
+import os
+
+import pandas as pd
+
+try:  # optional; enables the columnar copy read by the UI
+    import pyarrow  # noqa: F401
+
+    PARQUET_AVAILABLE = True
+except ImportError:  # pragma: no cover - pyarrow is optional
+    PARQUET_AVAILABLE = False
+
+
+def save_table(df: pd.DataFrame, csv_path: str) -> str:
+    """Write ``df`` to ``csv_path`` and, when pyarrow is installed, a sibling Parquet file.
+
+    The CSV stays the canonical output; the Parquet copy (same stem,
+    ``.parquet`` suffix) is a typed, columnar fast path for readers.
+
+    Returns:
+        ``csv_path``
+    """
+    df.to_csv(csv_path, index=False)
+    if PARQUET_AVAILABLE:
+        df.to_parquet(os.path.splitext(csv_path)[0] + ".parquet", index=False)
+    return csv_path
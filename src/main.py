@@ -17,8 +17,13 @@ from pathlib import Path
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
+# The CLI only ever saves figures; a non-interactive backend avoids GUI setup
+import matplotlib
+matplotlib.use('Agg')
+
 from hivec_cm.models.model import EnhancedHIVModel
 from hivec_cm.models.parameters import load_parameters, ModelParameters
+from hivec_cm.utils.io import save_table
 from models.calibrator import run_comprehensive_calibration
 from analysis.analyzer import ModelAnalyzer, save_analysis_results
 from utils.data_loader import load_cameroon_data, validate_data
@@ -195,7 +200,8 @@ def run_analysis(results, validation_data, config: dict, output_dir: str):
     
     # Save results
     analysis_output_dir = os.path.join(output_dir, 'analysis')
-    save_analysis_results(analyzer, analysis_output_dir)
+    plot_dpi = config.get('analysis', {}).get('plot_dpi', 300)
+    save_analysis_results(analyzer, analysis_output_dir, dpi=plot_dpi)
     
     # Print summary
     print_summary(epidemic_indicators, validation_metrics)
@@ -316,7 +322,7 @@ def main():
         
         # Save raw results
         results_path = os.path.join(args.output, 'simulation_results.csv')
-        results.to_csv(results_path, index=False)
+        save_table(results, results_path)
         logging.info(f"Simulation results saved to {results_path}")
         
         # Run analysis
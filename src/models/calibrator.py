@@ -6,20 +6,55 @@ Advanced calibration methods for the HIV/AIDS epidemiological model
 using optimization algorithms and validation techniques.
 """
 
+import dataclasses
+import functools
+import multiprocessing
 import numpy as np
 import pandas as pd
 from scipy.optimize import minimize, differential_evolution
 from typing import Dict, List, Tuple, Optional
 import logging
 
+from hivec_cm.models.parameters import load_parameters
+
 logger = logging.getLogger(__name__)
 
+# Calibrator installed in each differential evolution worker process
+_worker_calibrator = None
+
+
+def _init_calibration_worker(calibrator) -> None:
+    """Pool initializer: receive the calibrator once per worker process."""
+    global _worker_calibrator
+    _worker_calibrator = calibrator
+
+
+def _evaluate_in_worker(params_array: np.ndarray) -> float:
+    """Score one parameter vector with the worker's calibrator."""
+    return _worker_calibrator._evaluate_objective(params_array)
+
 
 class ModelCalibrator:
     """
     Advanced calibration system for HIV epidemic model parameters.
     """
     
+    # Parameter bounds (min, max), in _array_to_params order
+    PARAMETER_BOUNDS = [
+        (0.0005, 0.005),    # base_transmission_rate
+        (3.0, 15.0),        # acute_multiplier
+        (1.5, 8.0),         # aids_multiplier
+        (1.5, 5.0),         # mean_contacts_per_year
+        (0.1, 0.4),         # testing_rate_late
+        (0.5, 0.9)          # treatment_initiation_prob
+    ]
+    
+    # Maximum number of memoized objective evaluations
+    OBJECTIVE_CACHE_SIZE = 4096
+    
+    # Objective value returned for failed model runs
+    FAILED_RUN_PENALTY = 1e6
+    
     def __init__(self, target_data: pd.DataFrame, model_class):
         """
         Initialize calibrator with target data and model class.
@@ -33,7 +68,17 @@ class ModelCalibrator:
         self.calibration_years = None
         self.target_prevalences = None
         self._real_prev_col = None
+        self._base_params = None
+        # Objective values keyed on float32-quantized parameter vectors;
+        # bounded so long calibrations cannot grow it without limit
+        self._objective_cache: Dict[tuple, float] = {}
         self._prepare_calibration_data()
+    
+    def __getstate__(self):
+        # Worker copies never consult the objective cache, so leave it behind
+        state = self.__dict__.copy()
+        state['_objective_cache'] = {}
+        return state
         
     def _prepare_calibration_data(self):
         """Prepare target data for calibration."""
@@ -58,6 +103,11 @@ class ModelCalibrator:
                     # Convert to proportion if data appears to be in percent
                     self.target_prevalences.append(float(prevalence) / 100.0 if prevalence > 1 else float(prevalence))
         
+        # Array views reused by every objective evaluation
+        self._years_arr = np.asarray(self.calibration_years, dtype=float)
+        self._targets_arr = np.asarray(self.target_prevalences, dtype=float)
+        self._weights_arr = np.asarray(self._get_calibration_weights(), dtype=float)
+        
         logger.info(f"Prepared {len(self.calibration_years)} calibration points")
     
     def objective_function(self, params_array: np.ndarray) -> float:
@@ -70,6 +120,53 @@ class ModelCalibrator:
         Returns:
             Objective value (lower is better)
         """
+        # Repeated trial vectors (common across DE generations) reuse the
+        # value of the first run instead of simulating again
+        key = self._cache_key(params_array)
+        cached = self._objective_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        value = self._evaluate_objective(params_array)
+        self._remember(key, value)
+        return value
+    
+    @staticmethod
+    def _cache_key(params_array: np.ndarray) -> tuple:
+        """Objective cache key: the float32-quantized parameter vector."""
+        return tuple(np.asarray(params_array, dtype=np.float32).tolist())
+    
+    def _remember(self, key: tuple, value: float):
+        """Store an objective value, evicting the oldest entry when full."""
+        if len(self._objective_cache) >= self.OBJECTIVE_CACHE_SIZE:
+            del self._objective_cache[next(iter(self._objective_cache))]
+        self._objective_cache[key] = value
+    
+    def _cached_map(self, pool_map):
+        """Map-like ``workers`` callable for differential_evolution.
+        
+        Cache hits are answered in this process; only distinct misses are
+        passed to ``pool_map`` (a callable mapping a list of vectors to their
+        objective values), and their values are stored in this process's
+        cache. The ``func`` that differential_evolution hands to the map is
+        not used, so the calibrator is never pickled per task.
+        """
+        def cached_map(func, iterable):
+            vectors = list(iterable)
+            keys = [self._cache_key(x) for x in vectors]
+            values = {key: self._objective_cache[key] for key in keys if key in self._objective_cache}
+            misses = {}
+            for key, x in zip(keys, vectors):
+                if key not in values:
+                    misses.setdefault(key, x)
+            for key, value in zip(misses, pool_map(list(misses.values()))):
+                values[key] = value
+                self._remember(key, value)
+            return [values[key] for key in keys]
+        return cached_map
+    
+    def _evaluate_objective(self, params_array: np.ndarray) -> float:
+        """Run the model for one parameter vector and score its fit."""
         try:
             # Convert parameter array to ModelParameters object
             params = self._array_to_params(params_array)
@@ -79,22 +176,12 @@ class ModelCalibrator:
             results = model.run_simulation(years=35, dt=0.5)  # Faster run
             
             # Calculate fit to target data
-            model_prevalences = []
-            for year in self.calibration_years:
-                if year in results['year'].values:
-                    model_prev = results[results['year'] == year]['hiv_prevalence'].iloc[0]
-                    model_prevalences.append(model_prev)
-                else:
-                    # Interpolate if exact year not available
-                    model_prev = np.interp(year, results['year'], results['hiv_prevalence'])
-                    model_prevalences.append(model_prev)
+            model_prevalences = self._model_prevalences_at_targets(results)
             
             # Calculate weighted mean squared error
-            weights = self._get_calibration_weights()
             mse = np.average(
-                [(target - model)**2 for target, model in 
-                 zip(self.target_prevalences, model_prevalences)],
-                weights=weights
+                (self._targets_arr - model_prevalences) ** 2,
+                weights=self._weights_arr
             )
             
             # Add penalty for unrealistic epidemic curves
@@ -104,7 +191,21 @@ class ModelCalibrator:
             
         except Exception as e:
             logger.warning(f"Model run failed during calibration: {e}")
-            return 1e6  # Large penalty for failed runs
+            return self.FAILED_RUN_PENALTY
+    
+    def _model_prevalences_at_targets(self, results: pd.DataFrame) -> np.ndarray:
+        """Model prevalence at each calibration year.
+
+        Uses the first recorded value when the year was simulated exactly and
+        linear interpolation otherwise.
+        """
+        years = results['year'].to_numpy(dtype=float)
+        prevalence = results['true_hiv_prevalence'].to_numpy(dtype=float)
+        
+        idx = np.minimum(np.searchsorted(years, self._years_arr), len(years) - 1)
+        exact = years[idx] == self._years_arr
+        # Interpolate if exact year not available
+        return np.where(exact, prevalence[idx], np.interp(self._years_arr, years, prevalence))
     
     def _get_calibration_weights(self) -> List[float]:
         """Get weights for different calibration time points."""
@@ -124,12 +225,12 @@ class ModelCalibrator:
         penalty = 0.0
         
         # Penalty for extremely high prevalence
-        max_prevalence = results['hiv_prevalence'].max()  # proportion
+        max_prevalence = results['true_hiv_prevalence'].max()  # proportion
         if max_prevalence > 0.15:  # >15% seems too high for Cameroon
             penalty += (max_prevalence - 0.15) * 100.0
         
         # Penalty for prevalence increasing after 2010
-        recent_trend = results[results['year'] >= 2010]['hiv_prevalence']
+        recent_trend = results[results['year'] >= 2010]['true_hiv_prevalence']
         if len(recent_trend) > 5:
             trend_slope = np.polyfit(range(len(recent_trend)), recent_trend, 1)[0]
             # slope is in proportion per step (~per year when dt=1)
@@ -137,7 +238,7 @@ class ModelCalibrator:
                 penalty += trend_slope * 500.0
         
         # Penalty for unrealistic ART coverage
-        final_art_coverage = results['art_coverage'].iloc[-1]  # proportion
+        final_art_coverage = results['true_art_coverage'].iloc[-1]  # proportion
         if final_art_coverage > 0.90:  # Unrealistically high
             penalty += (final_art_coverage - 0.90) * 100.0
         
@@ -146,20 +247,22 @@ class ModelCalibrator:
     def _array_to_params(self, params_array: np.ndarray):
         """Convert parameter array to ModelParameters object.
 
-        Starts from baseline parameters loaded from JSON; then overrides entries.
+        Starts from baseline parameters loaded from JSON (once per calibrator);
+        then overrides entries on a fresh copy.
         """
-        from hivec_cm.models.parameters import load_parameters
-        params = load_parameters('config/parameters.json')
+        if self._base_params is None:
+            self._base_params = load_parameters('config/parameters.json')
         
         # Map array elements to parameters (order matters!)
-        params.base_transmission_rate = params_array[0]
-        params.acute_multiplier = params_array[1]
-        params.aids_multiplier = params_array[2]
-        params.mean_contacts_per_year = params_array[3]
-        params.testing_rate_late = params_array[4]
-        params.treatment_initiation_prob = params_array[5]
-        
-        return params
+        return dataclasses.replace(
+            self._base_params,
+            base_transmission_rate=params_array[0],
+            acute_multiplier=params_array[1],
+            aids_multiplier=params_array[2],
+            mean_contacts_per_year=params_array[3],
+            testing_rate_late=params_array[4],
+            treatment_initiation_prob=params_array[5],
+        )
     
     def _params_to_array(self, params) -> np.ndarray:
         """Convert ModelParameters object to array."""
@@ -173,40 +276,67 @@ class ModelCalibrator:
         ])
     
     def calibrate_differential_evolution(self, 
-                                       max_iterations: int = 100) -> Tuple[Dict, float]:
+                                       max_iterations: int = 30,
+                                       workers: int = -1,
+                                       polish_evaluations: int = 20) -> Tuple[Dict, float]:
         """
         Calibrate using differential evolution algorithm.
         
         Args:
             max_iterations: Maximum number of iterations
+            workers: Processes used to evaluate each generation's population
+                (-1 uses all CPU cores, 1 evaluates serially)
+            polish_evaluations: Objective evaluations allowed for the local
+                refinement of the DE optimum (0 disables it)
             
         Returns:
             Best parameters and objective value
         """
         logger.info("Starting differential evolution calibration")
         
-        # Parameter bounds (min, max)
-        bounds = [
-            (0.0005, 0.005),    # base_transmission_rate
-            (3.0, 15.0),        # acute_multiplier
-            (1.5, 8.0),         # aids_multiplier
-            (1.5, 5.0),         # mean_contacts_per_year
-            (0.1, 0.4),         # testing_rate_late
-            (0.5, 0.9)          # treatment_initiation_prob
-        ]
-        
-        result = differential_evolution(
-            self.objective_function,
-            bounds,
+        de_options = dict(
             maxiter=max_iterations,
-            popsize=15,
+            popsize=8,
+            init='sobol',  # low-discrepancy start covers the box with fewer members
+            mutation=(0.5, 1.0),  # dithered per generation
+            recombination=0.9,
+            tol=0.01,
             seed=42,
-            updating='deferred',
-            workers=1
+            updating='deferred',  # required for parallel evaluation
+            polish=False  # gradient polishing is meaningless on a stochastic objective
         )
+        if workers == 1:
+            result = differential_evolution(
+                self.objective_function, self.PARAMETER_BOUNDS, workers=1, **de_options
+            )
+        else:
+            # Own the pool so the objective cache is consulted in this process;
+            # each worker receives the calibrator once, through the initializer
+            processes = None if workers == -1 else workers
+            with multiprocessing.Pool(processes, initializer=_init_calibration_worker,
+                                      initargs=(self,)) as pool:
+                pool_map = functools.partial(pool.map, _evaluate_in_worker)
+                result = differential_evolution(
+                    self.objective_function, self.PARAMETER_BOUNDS,
+                    workers=self._cached_map(pool_map), **de_options
+                )
+        
+        best_x, best_objective = result.x, result.fun
+        
+        # Spend a short local refinement only when DE landed in a usable
+        # region; derivative-free, for the same reason as polish=False
+        if best_objective < self.FAILED_RUN_PENALTY and polish_evaluations > 0:
+            polished = minimize(
+                self.objective_function,
+                best_x,
+                method='Nelder-Mead',
+                bounds=self.PARAMETER_BOUNDS,
+                options={'maxfev': polish_evaluations}
+            )
+            if polished.fun < best_objective:
+                best_x, best_objective = polished.x, polished.fun
         
-        best_params = self._array_to_params(result.x)
-        best_objective = result.fun
+        best_params = self._array_to_params(best_x)
         
         logger.info(f"Calibration completed. Best objective: {best_objective:.4f}")
         
@@ -227,13 +357,18 @@ class ModelCalibrator:
         """
         logger.info("Starting Nelder-Mead calibration")
         
-        initial_array = self._params_to_array(initial_params)
+        # Start inside the box; the simplex is then kept within the same
+        # bounds as differential evolution instead of wandering into
+        # failed-run regions that cost a full simulation each
+        lower, upper = np.array(self.PARAMETER_BOUNDS).T
+        initial_array = np.clip(self._params_to_array(initial_params), lower, upper)
         
         result = minimize(
             self.objective_function,
             initial_array,
             method='Nelder-Mead',
-            options={'maxiter': max_iterations, 'disp': True}
+            bounds=self.PARAMETER_BOUNDS,
+            options={'maxiter': max_iterations, 'maxfev': 2 * max_iterations, 'disp': True}
         )
         
         best_params = self._array_to_params(result.x)
@@ -262,7 +397,7 @@ class ModelCalibrator:
         # Calculate validation metrics
         model_prevalences = []
         for year in self.calibration_years:
-            model_prev = np.interp(year, results['year'], results['hiv_prevalence'])
+            model_prev = np.interp(year, results['year'], results['true_hiv_prevalence'])
             model_prevalences.append(model_prev)
         
         # Calculate metrics
@@ -357,7 +492,7 @@ class MultiObjectiveCalibrator(ModelCalibrator):
         """Calculate prevalence fitting objective."""
         model_prevalences = []
         for year in self.calibration_years:
-            model_prev = np.interp(year, results['year'], results['hiv_prevalence'])
+            model_prev = np.interp(year, results['year'], results['true_hiv_prevalence'])
             model_prevalences.append(model_prev)
         
         weights = self._get_calibration_weights()
@@ -371,7 +506,7 @@ class MultiObjectiveCalibrator(ModelCalibrator):
     def _calculate_incidence_objective(self, results: pd.DataFrame) -> float:
         """Calculate incidence trend objective."""
         # Incidence should peak early and then decline
-        incidence_rates = np.array(results['new_infections']) / np.array(results['total_population']) * 100
+        incidence_rates = np.array(results['true_new_infections']) / np.array(results['total_population']) * 100
         
         # Find peak year
         peak_idx = np.argmax(incidence_rates)
@@ -395,7 +530,7 @@ class MultiObjectiveCalibrator(ModelCalibrator):
     
     def _calculate_curve_objective(self, results: pd.DataFrame) -> float:
         """Calculate epidemic curve realism objective."""
-        prevalences = np.array(results['hiv_prevalence'])
+        prevalences = np.array(results['true_hiv_prevalence'])
         
         penalty = 0.0
         
@@ -437,7 +572,6 @@ def run_comprehensive_calibration(target_data: pd.DataFrame,
         best_params, best_objective = calibrator.calibrate_differential_evolution()
     else:
         # Use default parameters from JSON as starting point
-        from hivec_cm.models.parameters import load_parameters
         initial_params = load_parameters('config/parameters.json')
         best_params, best_objective = calibrator.calibrate_nelder_mead(initial_params)
     
@@ -10,9 +10,46 @@ import numpy as np
 import yaml
 import json
 import os
+import copy
 import logging
+from functools import lru_cache
 from typing import Dict, Any, Optional
 
+REQUIRED_COLUMNS = ['Year', 'HIV_Prevalence_Rate', 'Population_Total']
+REQUIRED_DTYPES = {col: 'float64' for col in REQUIRED_COLUMNS}
+
+
+@lru_cache(maxsize=8)
+def _read_cameroon_csv(data_file: str, mtime: float) -> pd.DataFrame:
+    """Parse and clean a Cameroon data CSV; ``mtime`` keys the cache."""
+    # Only the required columns are parsed, and numeric conversion happens
+    # in the C parser rather than through per-column to_numeric copies
+    header = pd.read_csv(data_file, nrows=0).columns
+    missing_columns = [col for col in REQUIRED_COLUMNS if col not in header]
+
+    if missing_columns:
+        raise ValueError(f"Missing required columns: {missing_columns}")
+
+    try:
+        try:
+            # Multi-threaded Arrow parser when pyarrow is installed; columns
+            # still come back as NumPy float64
+            data = pd.read_csv(data_file, usecols=REQUIRED_COLUMNS,
+                               dtype=REQUIRED_DTYPES, engine='pyarrow')
+        except ImportError:
+            data = pd.read_csv(data_file, usecols=REQUIRED_COLUMNS,
+                               dtype=REQUIRED_DTYPES)
+    except ValueError:
+        # Non-numeric entries: fall back to coercing them to NaN
+        data = pd.read_csv(data_file, usecols=REQUIRED_COLUMNS)
+        data = data.apply(pd.to_numeric, errors='coerce')
+
+    # Remove any rows with invalid data and sort by year
+    data.dropna(inplace=True)
+    data.sort_values('Year', inplace=True, ignore_index=True)
+
+    return data
+
 
 class DataLoader:
     """Handles loading and preprocessing of HIV/AIDS data for Cameroon."""
@@ -20,7 +57,8 @@ class DataLoader:
     def __init__(self, data_dir: str = None):
         if data_dir is None:
             # Default to data directory relative to project root
-            project_root = os.path.dirname(os.path.dirname(__file__))
+            project_root = os.path.dirname(
+                os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
             data_dir = os.path.join(project_root, 'data')
         self.data_dir = data_dir
     
@@ -34,26 +72,11 @@ class DataLoader:
         if not os.path.exists(data_file):
             raise FileNotFoundError(f"Data file not found: {data_file}")
         
-        # Load and validate data
-        data = pd.read_csv(data_file)
-        required_columns = ['Year', 'HIV_Prevalence_Rate', 'Population_Total']
-        missing_columns = [col for col in required_columns if col not in data.columns]
-        
-        if missing_columns:
-            raise ValueError(f"Missing required columns: {missing_columns}")
-        
-        # Clean and preprocess
-        data = data.dropna(subset=required_columns)
-        data['Year'] = pd.to_numeric(data['Year'], errors='coerce')
-        data['HIV_Prevalence_Rate'] = pd.to_numeric(data['HIV_Prevalence_Rate'], errors='coerce')
-        data['Population_Total'] = pd.to_numeric(data['Population_Total'], errors='coerce')
-        
-        # Remove any rows with invalid data
-        data = data.dropna()
-        
-        # Sort by year
-        data = data.sort_values('Year').reset_index(drop=True)
-        
+        # Parsed frames are cached per (path, mtime); hand out a copy so
+        # callers cannot mutate the cached instance
+        data = _read_cameroon_csv(os.path.abspath(data_file),
+                                  os.path.getmtime(data_file)).copy()
+
         logging.info(f"Loaded {len(data)} data points from {data['Year'].min()} to {data['Year'].max()}")
         
         return data
@@ -63,13 +86,9 @@ class DataLoader:
         if data is None:
             data = self.load_cameroon_data(file_path)
         
-        validation_results = {
-            'total_records': len(data),
-            'year_range': (data['Year'].min(), data['Year'].max()),
-            'missing_values': data.isnull().sum().to_dict(),
-            'prevalence_range': (data['HIV_Prevalence_Rate'].min(), data['HIV_Prevalence_Rate'].max()),
-            'population_range': (data['Population_Total'].min(), data['Population_Total'].max())
-        }
+        # Pull each column out once and reduce over the raw arrays
+        prevalence = data['HIV_Prevalence_Rate'].to_numpy(dtype=float)
+        population = data['Population_Total'].to_numpy(dtype=float)
         
         # Validation checks
         issues = []
@@ -77,13 +96,15 @@ class DataLoader:
         if len(data) < 10:
             issues.append(f"Insufficient data points: {len(data)}")
         
-        if data['HIV_Prevalence_Rate'].max() > 20 or data['HIV_Prevalence_Rate'].min() < 0:
-            issues.append("HIV prevalence outside expected range (0-20%)")
-        
-        if data['Population_Total'].min() <= 0:
-            issues.append("Invalid population values found")
+        if len(data) > 0:
+            # nan-aware reductions match pandas' skipna min/max
+            if np.nanmax(prevalence) > 20 or np.nanmin(prevalence) < 0:
+                issues.append("HIV prevalence outside expected range (0-20%)")
+            
+            if np.nanmin(population) <= 0:
+                issues.append("Invalid population values found")
         
-        if data.isnull().sum().sum() > 0:
+        if data.isna().to_numpy().any():
             issues.append("Missing values detected")
         
         if issues:
@@ -94,6 +115,13 @@ class DataLoader:
             return True
 
 
+@lru_cache(maxsize=16)
+def _read_yaml_config(config_path: str, mtime: float) -> Dict[str, Any]:
+    """Parse a YAML configuration file; ``mtime`` keys the cache."""
+    with open(config_path, 'r') as f:
+        return yaml.safe_load(f)
+
+
 class ConfigManager:
     """Manages configuration files and parameter settings."""
     
@@ -161,10 +189,10 @@ class ConfigManager:
     def load_config(config_path: str) -> Dict[str, Any]:
         """Load configuration from YAML file."""
         try:
-            with open(config_path, 'r') as f:
-                config = yaml.safe_load(f)
+            config = _read_yaml_config(os.path.abspath(config_path),
+                                       os.path.getmtime(config_path))
             logging.info(f"Configuration loaded from {config_path}")
-            return config
+            return copy.deepcopy(config)
         except Exception as e:
             logging.error(f"Failed to load configuration: {e}")
             raise
@@ -217,7 +245,12 @@ def load_cameroon_data(custom_file: str = None) -> pd.DataFrame:
 def validate_data(file_path: str = None) -> bool:
     """Convenience function to validate data."""
     loader = DataLoader()
-    return loader.validate_data(file_path=file_path)
+    try:
+        data = loader.load_cameroon_data(file_path)
+    except Exception as e:
+        logging.error(f"Data validation failed: {e}")
+        return False
+    return loader.validate_data(data)
 
 
 def create_results_structure(output_dir: str) -> None:
@@ -243,16 +276,15 @@ def format_parameter_summary(params) -> str:
     else:
         param_dict = params
     
-    summary = "Model Parameters Summary:\n"
-    summary += "-" * 30 + "\n"
+    lines = ["Model Parameters Summary:", "-" * 30]
     
     for key, value in param_dict.items():
         if isinstance(value, float):
-            summary += f"{key:25}: {value:.4f}\n"
+            lines.append(f"{key:25}: {value:.4f}")
         else:
-            summary += f"{key:25}: {value}\n"
+            lines.append(f"{key:25}: {value}")
     
-    return summary
+    return "\n".join(lines) + "\n"
 
 
 def calculate_epidemiological_metrics(data: pd.DataFrame) -> Dict[str, float]:
@@ -260,11 +292,11 @@ def calculate_epidemiological_metrics(data: pd.DataFrame) -> Dict[str, float]:
     metrics = {}
     
     if 'HIV_Prevalence_Rate' in data.columns:
-        prevalence = data['HIV_Prevalence_Rate']
-        metrics['mean_prevalence'] = prevalence.mean()
-        metrics['max_prevalence'] = prevalence.max()
-        metrics['min_prevalence'] = prevalence.min()
-        metrics['std_prevalence'] = prevalence.std()
+        stats = data['HIV_Prevalence_Rate'].agg(['mean', 'max', 'min', 'std'])
+        metrics['mean_prevalence'] = stats['mean']
+        metrics['max_prevalence'] = stats['max']
+        metrics['min_prevalence'] = stats['min']
+        metrics['std_prevalence'] = stats['std']
     
     if 'Population_Total' in data.columns:
         population = data['Population_Total']
@@ -272,7 +304,8 @@ def calculate_epidemiological_metrics(data: pd.DataFrame) -> Dict[str, float]:
         metrics['population_growth_rate'] = (population.iloc[-1] / population.iloc[0]) ** (1/len(population)) - 1
     
     if len(data) > 1 and 'Year' in data.columns:
-        metrics['data_span_years'] = data['Year'].max() - data['Year'].min()
+        year_range = data['Year'].agg(['min', 'max'])
+        metrics['data_span_years'] = year_range['max'] - year_range['min']
         metrics['data_points'] = len(data)
     
     return metrics
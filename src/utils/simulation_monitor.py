@@ -3,20 +3,77 @@ Real-time simulation monitor for HIVEC-CM
 Tracks simulation progress and displays live statistics
 """
 import json
+import os
 import time
 from pathlib import Path
 from typing import Dict, Optional
 import pandas as pd
 
+try:  # optional, much faster serializer for the per-update live log line
+    import orjson
+
+    def _dumps_line(data: Dict) -> str:
+        return orjson.dumps(data).decode()
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+    def _dumps_line(data: Dict) -> str:
+        return json.dumps(data, separators=(',', ':'))
+
+
+_PROGRESS_FIELDS = (
+    'timestamp', 'scenario', 'scenario_num', 'total_scenarios',
+    'current_year', 'start_year', 'end_year', 'year_progress',
+    'overall_progress', 'agents_alive', 'agents_hiv_positive',
+    'agents_on_art', 'new_infections_this_year', 'prevalence', 'art_coverage',
+)
+
 
 class SimulationMonitor:
     """Monitor and track simulation progress in real-time."""
     
-    def __init__(self, output_dir: Path):
+    def __init__(self, output_dir: Path, flush_every: int = 50):
         self.output_dir = Path(output_dir)
         self.progress_file = self.output_dir / ".progress.json"
         self.live_data_file = self.output_dir / ".live_data.json"
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        # Live data log is kept open with a large buffer and flushed every
+        # `flush_every` updates instead of reopened on each update
+        self.flush_every = max(1, int(flush_every))
+        self._live_fh = None
+        self._pending_updates = 0
+        # Rows already parsed by read_live_data and the file offset they end at
+        self._live_rows = []
+        self._live_offset = 0
+        # Progress record reused by every update; values are overwritten in place
+        self._progress_buf = dict.fromkeys(_PROGRESS_FIELDS)
+    
+    def _write_progress(self, progress_data: Dict):
+        """Atomically replace the progress file so readers never see a torn write."""
+        tmp_file = self.progress_file.with_suffix('.json.tmp')
+        with open(tmp_file, 'w') as f:
+            json.dump(progress_data, f, indent=2)
+        os.replace(tmp_file, self.progress_file)
+    
+    def flush(self):
+        """Flush buffered live data lines to disk."""
+        if self._live_fh is not None:
+            self._live_fh.flush()
+        self._pending_updates = 0
+    
+    def close(self):
+        """Flush and close the live data log."""
+        if self._live_fh is not None:
+            self._live_fh.flush()
+            self._live_fh.close()
+            self._live_fh = None
+        self._pending_updates = 0
+    
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
         
     def update_progress(self, 
                        scenario: str,
@@ -31,34 +88,43 @@ class SimulationMonitor:
                        new_infections: int):
         """Update progress data for live monitoring."""
         
+        # Model counters may be NumPy scalars, which neither orjson nor the
+        # stdlib json writers accept (np.int64, np.float32); store plain numbers
+        scenario_num, total_scenarios = int(scenario_num), int(total_scenarios)
+        current_year, start_year, end_year = float(current_year), float(start_year), float(end_year)
+        agents_alive, agents_hiv_positive = int(agents_alive), int(agents_hiv_positive)
+        agents_on_art, new_infections = int(agents_on_art), int(new_infections)
+        
         year_progress = (current_year - start_year) / (end_year - start_year)
         overall_progress = ((scenario_num - 1) + year_progress) / total_scenarios
         
-        progress_data = {
-            'timestamp': time.time(),
-            'scenario': scenario,
-            'scenario_num': scenario_num,
-            'total_scenarios': total_scenarios,
-            'current_year': current_year,
-            'start_year': start_year,
-            'end_year': end_year,
-            'year_progress': year_progress * 100,
-            'overall_progress': overall_progress * 100,
-            'agents_alive': agents_alive,
-            'agents_hiv_positive': agents_hiv_positive,
-            'agents_on_art': agents_on_art,
-            'new_infections_this_year': new_infections,
-            'prevalence': (agents_hiv_positive / agents_alive * 100) if agents_alive > 0 else 0,
-            'art_coverage': (agents_on_art / agents_hiv_positive * 100) if agents_hiv_positive > 0 else 0
-        }
+        progress_data = self._progress_buf
+        progress_data['timestamp'] = time.time()
+        progress_data['scenario'] = scenario
+        progress_data['scenario_num'] = scenario_num
+        progress_data['total_scenarios'] = total_scenarios
+        progress_data['current_year'] = current_year
+        progress_data['start_year'] = start_year
+        progress_data['end_year'] = end_year
+        progress_data['year_progress'] = year_progress * 100
+        progress_data['overall_progress'] = overall_progress * 100
+        progress_data['agents_alive'] = agents_alive
+        progress_data['agents_hiv_positive'] = agents_hiv_positive
+        progress_data['agents_on_art'] = agents_on_art
+        progress_data['new_infections_this_year'] = new_infections
+        progress_data['prevalence'] = (agents_hiv_positive / agents_alive * 100) if agents_alive > 0 else 0
+        progress_data['art_coverage'] = (agents_on_art / agents_hiv_positive * 100) if agents_hiv_positive > 0 else 0
         
         # Write progress file (overwrite)
-        with open(self.progress_file, 'w') as f:
-            json.dump(progress_data, f, indent=2)
+        self._write_progress(progress_data)
         
-        # Append to live data log
-        with open(self.live_data_file, 'a') as f:
-            f.write(json.dumps(progress_data) + '\n')
+        # Append to live data log (buffered, compact: it is only machine-read)
+        if self._live_fh is None:
+            self._live_fh = open(self.live_data_file, 'a', buffering=1 << 20)
+        self._live_fh.write(_dumps_line(progress_data) + '\n')
+        self._pending_updates += 1
+        if self._pending_updates >= self.flush_every:
+            self.flush()
     
     def read_progress(self) -> Optional[Dict]:
         """Read current progress data."""
@@ -71,19 +137,35 @@ class SimulationMonitor:
         return None
     
     def read_live_data(self) -> pd.DataFrame:
-        """Read all live data as DataFrame."""
+        """Read all live data as DataFrame.
+
+        Lines parsed by earlier calls are kept, so each call only parses the
+        lines appended since the previous one.
+        """
+        self.flush()
         if not self.live_data_file.exists():
+            self._live_rows, self._live_offset = [], 0
             return pd.DataFrame()
         
-        data = []
-        with open(self.live_data_file, 'r') as f:
-            for line in f:
-                try:
-                    data.append(json.loads(line.strip()))
-                except:
-                    continue
+        with open(self.live_data_file, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            if f.tell() < self._live_offset:
+                # Log was truncated or replaced; start over
+                self._live_rows, self._live_offset = [], 0
+            f.seek(self._live_offset)
+            chunk = f.read()
+        
+        # Only consume complete lines; a partially written last line is
+        # picked up by the next call
+        complete = chunk[:chunk.rfind(b'\n') + 1]
+        self._live_offset += len(complete)
+        for line in complete.splitlines():
+            try:
+                self._live_rows.append(json.loads(line))
+            except ValueError:
+                continue
         
-        return pd.DataFrame(data) if data else pd.DataFrame()
+        return pd.DataFrame(self._live_rows) if self._live_rows else pd.DataFrame()
     
     def mark_scenario_complete(self, scenario: str):
         """Mark a scenario as complete."""
@@ -91,19 +173,20 @@ class SimulationMonitor:
         if progress:
             progress['scenario_complete'] = scenario
             progress['timestamp'] = time.time()
-            with open(self.progress_file, 'w') as f:
-                json.dump(progress, f, indent=2)
+            self._write_progress(progress)
+        self.flush()
     
     def mark_all_complete(self):
         """Mark entire simulation run as complete."""
         progress = self.read_progress() or {}
         progress['all_complete'] = True
         progress['completion_time'] = time.time()
-        with open(self.progress_file, 'w') as f:
-            json.dump(progress, f, indent=2)
+        self._write_progress(progress)
+        self.flush()
     
     def cleanup(self):
         """Clean up progress files after completion."""
+        self.close()
         if self.progress_file.exists():
             self.progress_file.unlink()
         # Keep live_data_file for history
\ No newline at end of file
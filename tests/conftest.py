@@ -0,0 +1,21 @@
+import os
+import sys
+
+import pytest
+
+# The source tree holds the script-level packages (models, utils) and, when the
+# package is not installed (pip install -e .), hivec_cm itself. Appended so an
+# installed hivec_cm still takes precedence.
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '../src'))
+if SRC_DIR not in sys.path:
+    sys.path.append(SRC_DIR)
+
+
+@pytest.fixture(scope="session")
+def model_parameters():
+    """Fixture to load model parameters once for all tests (treat as read-only)."""
+    from hivec_cm.models.parameters import load_parameters
+
+    # Use a relative path to find the config file from the test file's location
+    config_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../config/parameters.json'))
+    return load_parameters(config_path)
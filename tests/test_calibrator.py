@@ -0,0 +1,101 @@
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from models.calibrator import ModelCalibrator
+
+
+def _results(years, prevalence):
+    """Small results frame with the columns EnhancedHIVModel.run_simulation outputs."""
+    return pd.DataFrame({
+        'year': years,
+        'true_hiv_prevalence': prevalence,
+        'true_art_coverage': np.linspace(0.0, 0.5, len(years)),
+        'true_new_infections': np.arange(len(years)),
+        'total_population': np.full(len(years), 1000),
+    })
+
+
+@pytest.fixture
+def calibrator():
+    target = pd.DataFrame({'Year': [1995, 1998, 2001], 'HIV Prevalence': [2.0, 4.0, 5.0]})
+    return ModelCalibrator(target, model_class=None)
+
+
+def test_model_prevalences_at_targets_exact_and_interpolated(calibrator):
+    """
+    Tests that simulated years are read directly and missing years interpolated.
+    """
+    # GIVEN results for 1995 and 2001 exactly, but not for 1998
+    results = _results([1995, 1997, 1999, 2001], [0.02, 0.03, 0.05, 0.06])
+
+    # WHEN model prevalence is taken at the calibration years
+    prevalences = calibrator._model_prevalences_at_targets(results)
+
+    # THEN exact years use the recorded value and 1998 is interpolated
+    np.testing.assert_allclose(prevalences, [0.02, 0.04, 0.06])
+
+
+def test_objective_scores_model_output(calibrator, model_parameters):
+    """
+    Tests that an objective evaluation on model-shaped results is not a failed run.
+    """
+    results = _results(list(range(1990, 2026)), np.full(36, 0.04))
+
+    class StubModel:
+        def __init__(self, params):
+            pass
+
+        def run_simulation(self, years, dt):
+            return results
+
+    calibrator.model_class = StubModel
+    calibrator._base_params = model_parameters
+
+    value = calibrator._evaluate_objective(np.array([b[0] for b in calibrator.PARAMETER_BOUNDS]))
+
+    assert value < calibrator.FAILED_RUN_PENALTY
+    # Targets are 2%, 4%, 5% against a flat 4% model curve
+    expected = np.average([0.02 ** 2, 0.0, 0.01 ** 2], weights=[1.0, 1.0, 2.0])
+    assert value == pytest.approx(expected)
+
+
+def test_cached_map_sends_only_distinct_misses(calibrator):
+    """
+    Tests that the DE workers map answers cache hits locally and remembers misses.
+    """
+    calls = []
+
+    def pool_map(vectors):
+        calls.append(len(vectors))
+        return [float(np.sum(x)) for x in vectors]
+
+    def objective(x):
+        raise AssertionError("The DE objective must not be dispatched to the pool.")
+
+    cached_map = calibrator._cached_map(pool_map)
+    a, b = np.array([1.0, 2.0]), np.array([3.0, 4.0])
+
+    # GIVEN a generation with a repeated vector
+    assert cached_map(objective, [a, b, a]) == [3.0, 7.0, 3.0]
+    assert calls == [2]
+
+    # WHEN a later generation repeats known vectors, nothing is dispatched
+    assert cached_map(objective, [b, a]) == [7.0, 3.0]
+    assert calls == [2, 0]
+    assert len(calibrator._objective_cache) == 2
+
+
+def test_pickled_calibrator_leaves_objective_cache_behind(calibrator):
+    """
+    Tests that the copy handed to DE worker processes carries no objective cache.
+    """
+    calibrator._remember((1.0, 2.0), 3.0)
+
+    worker_copy = pickle.loads(pickle.dumps(calibrator))
+
+    assert worker_copy._objective_cache == {}
+    assert calibrator._objective_cache == {(1.0, 2.0): 3.0}
+    np.testing.assert_array_equal(worker_copy._targets_arr, calibrator._targets_arr)
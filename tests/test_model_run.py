@@ -1,36 +1,57 @@
 
-import os
-import sys
-import pytest
+import dataclasses
 
-# Add the src directory to the Python path to allow for absolute imports
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
-
-from hivec_cm.models.parameters import load_parameters
 from hivec_cm.models.model import EnhancedHIVModel
 
-@pytest.fixture
-def model_parameters():
-    """Fixture to load model parameters for tests."""
-    # Use a relative path to find the config file from the test file's location
-    config_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../config/parameters.json'))
-    return load_parameters(config_path)
 
 def test_simulation_runs_successfully(model_parameters):
     """
     Tests that a small-scale simulation runs to completion without errors.
     """
     # GIVEN a small initial population for a quick test run
-    model_parameters.initial_population = 100
+    params = dataclasses.replace(model_parameters, initial_population=100)
     
     # WHEN the model is initialized and run for a short period
-    model = EnhancedHIVModel(params=model_parameters)
+    model = EnhancedHIVModel(params=params)
     # Run for 2 years with a large timestep for speed
     results_df = model.run_simulation(years=2, dt=1.0)
     
     # THEN assert that the results are not empty and have the expected columns
-    assert not results_df.empty, "The simulation should produce a non-empty DataFrame."
-    assert 'year' in results_df.columns, "Results should contain a 'year' column."
-    assert 'hiv_prevalence' in results_df.columns, "Results should contain an 'hiv_prevalence' column."
     assert len(results_df) == 3, "The simulation should have run for the specified number of years (initial state + 2 years)."
+    missing = {'year', 'true_hiv_prevalence'}.difference(results_df.columns)
+    assert not missing, f"Results are missing expected columns: {sorted(missing)}"
+
+
+def test_ensemble_runs_members_in_parallel(model_parameters):
+    """
+    Tests that an ensemble of small simulations runs across worker processes.
+    """
+    from hivec_cm.models.ensemble import run_ensemble
+
+    params = dataclasses.replace(model_parameters, initial_population=100)
+
+    results = run_ensemble([params, params], years=2, dt=1.0, n_workers=2, seeds=[1, 2])
+
+    assert len(results) == 2, "One result table per ensemble member is expected."
+    assert all(len(df) == 3 for df in results), "Each member should record initial state + 2 years."
+
+
+def test_population_ages_keep_float64_band_edges(model_parameters):
+    """
+    Tests that gathered ages are not rounded across mortality band edges.
+    """
+    params = dataclasses.replace(model_parameters, initial_population=100)
+    model = EnhancedHIVModel(params=params)
+
+    # GIVEN an age accumulated by 50 steps of dt=0.1 (just below 5.0 in float64)
+    person = model.population[0]
+    person.age = 0.0
+    for _ in range(50):
+        person.age += 0.1
+
+    # WHEN the population is gathered into columns
+    age = model._population_columns([person])['age']
 
+    # THEN the age is kept exactly, so it stays in the under-5 mortality band
+    assert age.dtype == 'float64'
+    assert age[0] == person.age < 5.0
@@ -0,0 +1,73 @@
+import json
+import os
+import shutil
+
+import yaml
+
+from hivec_cm.models.parameters import load_parameters
+from utils import ConfigManager, DataLoader
+
+CONFIG_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '../config/parameters.json'))
+
+
+def _touch_later(path, seconds=10):
+    """Move the file's mtime forward so cache keys change on any filesystem."""
+    mtime = os.path.getmtime(path) + seconds
+    os.utime(path, (mtime, mtime))
+
+
+def test_load_parameters_cache_invalidates_on_edit(tmp_path):
+    """
+    Tests that load_parameters hands out copies and re-parses an edited file.
+    """
+    path = tmp_path / 'parameters.json'
+    shutil.copy(CONFIG_PATH, path)
+
+    first = load_parameters(str(path))
+    first.initial_population = 1
+    assert load_parameters(str(path)).initial_population != 1, "Callers must get their own copy."
+
+    # WHEN the file is edited
+    config = json.loads(path.read_text())
+    config['parameters']['population']['initial_population'] = 1234
+    path.write_text(json.dumps(config))
+    _touch_later(path)
+
+    # THEN the new value is loaded instead of the cached one
+    assert load_parameters(str(path)).initial_population == 1234
+
+
+def test_load_config_cache_invalidates_on_edit(tmp_path):
+    """
+    Tests that ConfigManager.load_config returns copies and re-parses an edited file.
+    """
+    path = tmp_path / 'config.yaml'
+    path.write_text(yaml.safe_dump({'simulation': {'years': 35}}))
+
+    first = ConfigManager.load_config(str(path))
+    first['simulation']['years'] = 1
+    assert ConfigManager.load_config(str(path))['simulation']['years'] == 35
+
+    path.write_text(yaml.safe_dump({'simulation': {'years': 10}}))
+    _touch_later(path)
+
+    assert ConfigManager.load_config(str(path))['simulation']['years'] == 10
+
+
+def test_load_cameroon_data_cache_invalidates_on_edit(tmp_path):
+    """
+    Tests that DataLoader.load_cameroon_data returns copies and re-parses an edited file.
+    """
+    path = tmp_path / 'data.csv'
+    rows = ['Year,HIV_Prevalence_Rate,Population_Total'] + [f'{1990 + i},5.0,1000' for i in range(3)]
+    path.write_text('\n'.join(rows) + '\n')
+    loader = DataLoader(str(tmp_path))
+
+    first = loader.load_cameroon_data(str(path))
+    first.loc[0, 'HIV_Prevalence_Rate'] = -1.0
+    assert loader.load_cameroon_data(str(path))['HIV_Prevalence_Rate'].tolist() == [5.0, 5.0, 5.0]
+
+    path.write_text('\n'.join(rows + ['1993,6.0,1000']) + '\n')
+    _touch_later(path)
+
+    assert loader.load_cameroon_data(str(path))['Year'].tolist() == [1990, 1991, 1992, 1993]
@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+
+from utils.simulation_monitor import SimulationMonitor
+
+
+def _update(monitor, year):
+    monitor.update_progress(
+        scenario='S0_baseline', scenario_num=1, total_scenarios=1,
+        current_year=year, start_year=1990, end_year=2000,
+        agents_alive=100, agents_hiv_positive=10, agents_on_art=5, new_infections=1,
+    )
+
+
+@pytest.fixture
+def monitor(tmp_path):
+    monitor = SimulationMonitor(tmp_path, flush_every=1000)
+    yield monitor
+    monitor.close()
+
+
+def test_read_live_data_flushes_buffered_updates(monitor):
+    """
+    Tests that updates still held in the write buffer are visible to the reader.
+    """
+    _update(monitor, 1991)
+    _update(monitor, 1992)
+
+    live = monitor.read_live_data()
+
+    assert live['current_year'].tolist() == [1991, 1992]
+
+
+def test_read_live_data_defers_partial_last_line(monitor):
+    """
+    Tests that a partially written line is parsed only once it is complete.
+    """
+    _update(monitor, 1991)
+    monitor.read_live_data()
+
+    # GIVEN a writer that has only written half of the next line
+    with open(monitor.live_data_file, 'a') as f:
+        f.write('{"current_year": 19')
+
+    # THEN the half line is left for a later call
+    assert monitor.read_live_data()['current_year'].tolist() == [1991]
+
+    # WHEN the line is completed, it is picked up without re-parsing the first
+    with open(monitor.live_data_file, 'a') as f:
+        f.write('92}\n')
+
+    assert monitor.read_live_data()['current_year'].tolist() == [1991, 1992]
+
+
+def test_read_live_data_restarts_after_truncation(monitor):
+    """
+    Tests that a truncated or replaced log is re-read from the start.
+    """
+    _update(monitor, 1991)
+    _update(monitor, 1992)
+    monitor.read_live_data()
+    monitor.close()
+
+    # GIVEN a new, shorter log in place of the old one
+    monitor.live_data_file.write_text('{"current_year": 2001}\n')
+
+    assert monitor.read_live_data()['current_year'].tolist() == [2001]
+
+
+def test_update_progress_accepts_numpy_scalars(monitor):
+    """
+    Tests that NumPy scalars from the model are written as plain numbers.
+    """
+    monitor.update_progress(
+        scenario='S0_baseline', scenario_num=np.int64(1), total_scenarios=np.int64(1),
+        current_year=np.float32(1991.5), start_year=1990, end_year=np.float64(2000),
+        agents_alive=np.int64(100), agents_hiv_positive=np.int64(10),
+        agents_on_art=np.int32(5), new_infections=np.int64(1),
+    )
+
+    live = monitor.read_live_data()
+    progress = monitor.read_progress()
+
+    assert live['current_year'].tolist() == [1991.5]
+    assert live['agents_alive'].tolist() == [100]
+    assert progress['agents_on_art'] == 5
+    assert progress['prevalence'] == pytest.approx(10.0)
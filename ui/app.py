@@ -8,7 +8,7 @@ import json
 import os
 import sys
 import subprocess
-import time
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
@@ -20,6 +20,26 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from hivec_cm.scenarios.scenario_definitions import SCENARIO_REGISTRY, list_scenarios
 
+try:  # optional C parser for the progress/live files polled every refresh
+    import orjson
+
+    def _loads(data):
+        return orjson.loads(data)
+
+    def _dumps_indented(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+except ImportError:  # orjson is optional
+    orjson = None
+
+    def _loads(data):
+        return json.loads(data)
+
+    def _dumps_indented(obj):
+        return json.dumps(obj, indent=2).encode()
+
+# st.fragment graduated from st.experimental_fragment in Streamlit 1.37
+_fragment = getattr(st, "fragment", None) or st.experimental_fragment
+
 # Page configuration
 st.set_page_config(
     page_title="HIVEC-CM Model Interface",
@@ -29,7 +49,7 @@ st.set_page_config(
 )
 
 # Custom CSS
-st.markdown("""
+PAGE_CSS = """
 <style>
     .main-header {
         font-size: 2.5rem;
@@ -42,29 +62,9 @@ st.markdown("""
         color: #ff7f0e;
         margin-top: 1rem;
     }
-    .info-box {
-        background-color: #e7f3ff;
-        padding: 1rem;
-        border-radius: 0.5rem;
-        border-left: 5px solid #1f77b4;
-        margin: 1rem 0;
-    }
-    .warning-box {
-        background-color: #fff3cd;
-        padding: 1rem;
-        border-radius: 0.5rem;
-        border-left: 5px solid #ffc107;
-        margin: 1rem 0;
-    }
-    .success-box {
-        background-color: #d4edda;
-        padding: 1rem;
-        border-radius: 0.5rem;
-        border-left: 5px solid #28a745;
-        margin: 1rem 0;
-    }
 </style>
-""", unsafe_allow_html=True)
+"""
+st.markdown(PAGE_CSS, unsafe_allow_html=True)
 
 
 def initialize_session_state():
@@ -77,12 +77,257 @@ def initialize_session_state():
         st.session_state.selected_scenarios = ['S0_baseline']
 
 
+def _set_scenario_selection(selected_ids, all_ids):
+    """Quick-select callback: apply ``selected_ids`` and tick the matching form checkboxes.
+
+    Runs before the next script run, while the checkbox keys may still be set.
+    """
+    st.session_state.selected_scenarios = list(selected_ids)
+    for scenario_id in all_ids:
+        st.session_state[f"scenario_{scenario_id}"] = scenario_id in selected_ids
+
+
+@st.cache_data
+def _cached_scenarios():
+    """Scenario registry listing, built once per process."""
+    return list_scenarios()
+
+
+@st.cache_data
+def _cached_defaults(config_path, mtime):
+    """Parsed parameter file; ``mtime`` only keys the cache so edits invalidate it."""
+    with open(config_path, 'rb') as f:
+        return _loads(f.read())
+
+
+# Points per scenario sent to the browser by the live prevalence plot
+LIVE_PLOT_MAX_POINTS = 500
+
+# Columns plotted on the results overview tab
+OVERVIEW_COLUMNS = [
+    'year', 'true_hiv_prevalence', 'true_art_coverage', 'total_population',
+    'true_hiv_positive', 'diagnosed', 'true_on_art',
+]
+
+
+# Low-cardinality string columns of the detailed result files
+CATEGORY_COLUMNS = ('type', 'age_group', 'sex', 'region')
+
+
+def _compact(df):
+    """Downcast floats to float32 and year to int32, and categorize label columns in place."""
+    for col in df.select_dtypes('float64').columns:
+        df[col] = df[col].astype('float32')
+    if 'year' in df.columns and df['year'].dtype == 'int64':
+        df['year'] = df['year'].astype('int32')
+    for col in CATEGORY_COLUMNS:
+        if col in df.columns and df[col].dtype == object:
+            df[col] = df[col].astype('category')
+    return df
+
+
+@st.cache_data(show_spinner=False)
+def _load_csv(path_str, mtime):
+    """Parsed CSV; ``mtime`` only keys the cache so rewritten files are re-read.
+
+    A current Parquet sibling (see scripts/migrate_to_parquet.py) is read
+    instead when present. Either way the frame is compacted (float32,
+    int32 years, categorical labels) before it is cached.
+    """
+    parquet_path = _parquet_sibling(path_str)
+    if parquet_path is not None:
+        try:
+            return _compact(pd.read_parquet(parquet_path, memory_map=True))
+        except ImportError:
+            pass  # pyarrow not installed; fall back to the CSV
+    return _compact(pd.read_csv(path_str))
+
+
+@st.cache_data(show_spinner=False)
+def _json_structure(path_str, mtime):
+    """Year count and per-year data types of a detailed results JSON, cached like ``_load_csv``.
+
+    Only this small summary is cached, never the parsed document; the file
+    is streamed with ijson when it is installed.
+    """
+    try:
+        import ijson
+    except ImportError:  # ijson is optional
+        ijson = None
+    if ijson is None:
+        with open(path_str, 'rb') as f:
+            data = _loads(f.read())
+        first = next(iter(data.values()), {})
+        return {'n_years': len(data), 'data_types': list(first)}
+
+    n_years, data_types = 0, []
+    with open(path_str, 'rb') as f:
+        for prefix, event, value in ijson.parse(f):
+            if event == 'map_key' and prefix == '':
+                n_years += 1
+            elif event == 'map_key' and n_years == 1 and '.' not in prefix:
+                data_types.append(value)
+    return {'n_years': n_years, 'data_types': data_types}
+
+
+# Download payloads kept in memory: one scenario's four files, for five minutes
+DOWNLOAD_CACHE_ENTRIES = 4
+DOWNLOAD_CACHE_TTL = 300
+
+
+@st.cache_data(show_spinner=False, max_entries=DOWNLOAD_CACHE_ENTRIES, ttl=DOWNLOAD_CACHE_TTL)
+def _read_bytes(path_str, mtime):
+    """Raw file contents for download buttons, cached like ``_load_csv``.
+
+    Bounded in size and age: these are whole files, and only the scenario
+    currently open on the downloads view needs them.
+    """
+    with open(path_str, 'rb') as f:
+        return f.read()
+
+
+def _cached(loader, path):
+    """Call a cached ``loader`` for ``path`` keyed on its current mtime."""
+    return loader(str(path), path.stat().st_mtime)
+
+
+@st.cache_data(show_spinner=False)
+def _scenario_summary(detailed_csv, mtime):
+    """Per-scenario aggregates of a detailed age-sex CSV shared by the results and compare tabs.
+
+    The groupbys (and their sort) run once per file, reading each record
+    type through ``_load_detailed``; charts then take ``.loc`` slices.
+
+    Returns a dict with:
+        years: sorted years present in the file
+        age_groups: sorted age groups of the prevalence rows
+        regions: sorted regions of the regional rows
+        prevalence_by_year_age: mean prevalence_pct indexed by (year, age_group)
+        prevalence_by_year_sex_age: mean prevalence_pct indexed by (year, sex, age_group)
+        regional_by_year_region: mean prevalence_pct indexed by (year, region)
+    """
+    prevalence = _load_detailed(detailed_csv, mtime, 'prevalence')
+    regional = _load_detailed(detailed_csv, mtime, 'regional_prevalence')
+    return {
+        'years': np.union1d(prevalence['year'].to_numpy(), regional['year'].to_numpy()).tolist(),
+        'age_groups': sorted(prevalence['age_group'].dropna().unique()),
+        'regions': sorted(regional['region'].dropna().unique()),
+        'prevalence_by_year_age': prevalence.groupby(
+            ['year', 'age_group'], observed=True)['prevalence_pct'].mean(),
+        'prevalence_by_year_sex_age': prevalence.groupby(
+            ['year', 'sex', 'age_group'], observed=True)['prevalence_pct'].mean(),
+        'regional_by_year_region': regional.groupby(
+            ['year', 'region'], observed=True)['prevalence_pct'].mean(),
+    }
+
+
+def _summary_slice(series, key):
+    """``series.loc[key]`` for a leading index key, or an empty Series when absent."""
+    try:
+        return series.loc[key]
+    except KeyError:
+        n_levels = len(key) if isinstance(key, tuple) else 1
+        return series.iloc[:0].droplevel(list(range(n_levels)))
+
+
+def _parquet_sibling(csv_path):
+    """Parquet copy written next to ``csv_path`` by save_table, if present and current."""
+    parquet_path = Path(csv_path).with_suffix('.parquet')
+    if parquet_path.exists() and parquet_path.stat().st_mtime >= Path(csv_path).stat().st_mtime:
+        return parquet_path
+    return None
+
+
+# (column, legend name, colour) of the treatment-cascade plot
+CASCADE_SERIES = [
+    ('true_hiv_positive', 'PLHIV', 'red'),
+    ('diagnosed', 'Diagnosed', 'orange'),
+    ('true_on_art', 'On ART', 'green'),
+]
+
+
+@st.cache_data
+def _load_overview(results_file, mtime):
+    """Overview columns of a results CSV; ``mtime`` only keys the cache."""
+    parquet_path = _parquet_sibling(results_file)
+    if parquet_path is not None:
+        try:
+            return pd.read_parquet(parquet_path, columns=OVERVIEW_COLUMNS, memory_map=True)
+        except (ImportError, KeyError, ValueError):
+            pass  # pyarrow missing or an older file layout; fall back to the CSV
+    wanted = set(OVERVIEW_COLUMNS)
+    return pd.read_csv(
+        results_file,
+        usecols=lambda c: c in wanted,
+        dtype={c: 'float32' for c in OVERVIEW_COLUMNS if c != 'year'},
+        engine='c',
+    )
+
+
+# Columns of the compare-page outcomes table, in the positional order used by _final_outcomes
+COMPARE_COLUMNS = [
+    'true_hiv_prevalence', 'true_hiv_positive', 'true_art_coverage',
+    'total_population', 'deaths_hiv', 'true_new_infections',
+]
+
+
+@st.cache_data(show_spinner=False)
+def _final_outcomes(results_file, mtime):
+    """Final-year outcomes and cumulative HIV deaths of one results CSV; ``mtime`` only keys the cache."""
+    wanted = set(COMPARE_COLUMNS)
+    df = pd.read_csv(results_file, usecols=lambda c: c in wanted, engine='c')
+    arr = df[COMPARE_COLUMNS].to_numpy(dtype=np.float64)
+    last = arr[-1]
+    return {
+        'Prevalence (%)': last[0] * 100,
+        'PLHIV': last[1],
+        'ART Coverage (%)': last[2] * 100,
+        'Population': last[3],
+        'Deaths (HIV)': arr[:, 4].sum(),
+        'New Infections': last[5],
+    }
+
+
+@st.cache_data
+def _load_detailed(detailed_csv, mtime, record_type):
+    """Rows of one ``type`` from a detailed age-sex CSV; ``mtime`` only keys the cache.
+
+    With a Parquet sibling the ``type`` predicate is pushed down to the
+    reader, so rows of other types are never materialized.
+    """
+    parquet_path = _parquet_sibling(detailed_csv)
+    if parquet_path is not None:
+        try:
+            return _compact(pd.read_parquet(parquet_path, filters=[('type', '==', record_type)]))
+        except ImportError:
+            pass
+    df = _load_csv(detailed_csv, mtime)
+    return df[df['type'] == record_type].copy()
+
+
+@st.cache_data
+def _pivot_year(detailed_csv, mtime, year):
+    """Age-group x sex prevalence table for one year of a detailed CSV."""
+    by_year_sex_age = _scenario_summary(detailed_csv, mtime)['prevalence_by_year_sex_age']
+    return _summary_slice(by_year_sex_age, year).unstack('sex')
+
+
+@st.cache_data(ttl=30)
+def _list_result_dirs(base):
+    """Subdirectories of ``base`` as strings; cached for 30 s to avoid a scan per rerun."""
+    return [entry.path for entry in os.scandir(base) if entry.is_dir()]
+
+
+def _result_dirs(base):
+    """Cached subdirectory listing of ``base`` as Paths."""
+    return [Path(d) for d in _list_result_dirs(str(base))]
+
+
 def load_default_parameters():
     """Load default parameters from config file."""
     config_path = Path(__file__).parent.parent / "config" / "parameters.json"
     if config_path.exists():
-        with open(config_path, 'r') as f:
-            return json.load(f)
+        return _cached_defaults(str(config_path), config_path.stat().st_mtime)
     return {}
 
 
@@ -92,8 +337,8 @@ def save_parameters(params, filename="custom_parameters.json"):
     config_dir.mkdir(exist_ok=True)
     
     filepath = config_dir / filename
-    with open(filepath, 'w') as f:
-        json.dump(params, f, indent=2)
+    with open(filepath, 'wb') as f:
+        f.write(_dumps_indented(params))
     
     return filepath
 
@@ -157,6 +402,180 @@ def main():
         advanced_settings_page()
 
 
+def _downsample(values, max_points=LIVE_PLOT_MAX_POINTS):
+    """Evenly strided subset of ``values`` (first and last kept) to bound the plot payload."""
+    if len(values) <= max_points:
+        return values
+    return values[np.linspace(0, len(values) - 1, max_points).astype(int)]
+
+
+def _read_live_rows(live_data_file):
+    """Return all rows of the live JSONL log, parsing only lines added since the last call.
+
+    Rows and the byte offset already consumed are kept in session state and
+    reset when the file changes or shrinks (a new run).
+    """
+    key = str(live_data_file)
+    size = live_data_file.stat().st_size
+    if st.session_state.get('live_file') != key or size < st.session_state.get('live_offset', 0):
+        st.session_state.live_file = key
+        st.session_state.live_offset = 0
+        st.session_state.live_rows = []
+
+    rows = st.session_state.live_rows
+    with open(live_data_file, 'rb') as f:
+        f.seek(st.session_state.live_offset)
+        new = f.read()
+    # Leave a partially written last line for the next refresh
+    complete = new.rfind(b'\n') + 1
+    st.session_state.live_offset += complete
+    for line in new[:complete].splitlines():
+        try:
+            rows.append(_loads(line))
+        except ValueError:
+            continue
+    return rows
+
+
+def _count_completed(output_dir):
+    """Number of scenario subdirectories of ``output_dir`` that have written their results."""
+    n = 0
+    try:
+        with os.scandir(output_dir) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False) and os.path.isfile(
+                    os.path.join(entry.path, "simulation_results.csv")
+                ):
+                    n += 1
+    except FileNotFoundError:
+        return 0
+    return n
+
+
+@_fragment(run_every=2)
+def _live_monitor(output_dir):
+    """Live progress block; reruns on its own every 2 s without redrawing the page."""
+    if not st.session_state.simulation_running:
+        return
+    with st.container(border=True):
+        st.markdown("### 🔄 Live Simulation Monitor")
+    
+        # Check for progress file
+        progress_file = output_dir / ".progress.json"
+    
+        if progress_file.exists():
+            try:
+                progress_data = _loads(progress_file.read_bytes())
+            
+                # Overall Progress
+                col1, col2 = st.columns([3, 1])
+                with col1:
+                    st.progress(progress_data.get('overall_progress', 0) / 100)
+                with col2:
+                    st.metric("Overall", f"{progress_data.get('overall_progress', 0):.1f}%")
+            
+                # Current Scenario Info
+                st.markdown(f"**Current Scenario:** `{progress_data.get('scenario', 'Unknown')}`  "
+                          f"(#{progress_data.get('scenario_num', 0)}/{progress_data.get('total_scenarios', 0)})")
+            
+                # Year Progress
+                current_year = progress_data.get('current_year', 0)
+                st.markdown(f"**Simulation Year:** {current_year:.1f}")
+                year_prog = progress_data.get('year_progress', 0) / 100
+                st.progress(year_prog)
+            
+                # Live Agent Statistics
+                st.markdown("#### 📊 Live Agent Statistics")
+            
+                metric_col1, metric_col2, metric_col3, metric_col4 = st.columns(4)
+            
+                with metric_col1:
+                    st.metric(
+                        "👥 Agents Alive",
+                        f"{progress_data.get('agents_alive', 0):,}",
+                        help="Total agents currently in simulation"
+                    )
+            
+                with metric_col2:
+                    hiv_pos = progress_data.get('agents_hiv_positive', 0)
+                    prevalence = progress_data.get('prevalence', 0)
+                    st.metric(
+                        "🦠 HIV+ Agents",
+                        f"{hiv_pos:,}",
+                        delta=f"{prevalence:.2f}% prevalence",
+                        delta_color="inverse"
+                    )
+            
+                with metric_col3:
+                    on_art = progress_data.get('agents_on_art', 0)
+                    art_cov = progress_data.get('art_coverage', 0)
+                    st.metric(
+                        "💊 On ART",
+                        f"{on_art:,}",
+                        delta=f"{art_cov:.1f}% coverage"
+                    )
+            
+                with metric_col4:
+                    new_inf = progress_data.get('new_infections_this_year', 0)
+                    st.metric(
+                        "🔴 New Infections",
+                        f"{new_inf:,}",
+                        help="New infections this simulation year"
+                    )
+            
+                # Live Plot - Prevalence Evolution
+                live_data_file = output_dir / ".live_data.json"
+                if live_data_file.exists():
+                    try:
+                        live_data = _read_live_rows(live_data_file)
+                    
+                        if live_data:
+                            df_live = pd.DataFrame(live_data)
+                            if not df_live.empty and 'current_year' in df_live.columns:
+                                st.markdown("#### 📈 Live Prevalence Evolution")
+                            
+                                fig = go.Figure([
+                                    go.Scattergl(
+                                        x=_downsample(group['current_year'].to_numpy()),
+                                        y=_downsample(group['prevalence'].to_numpy()),
+                                        mode='lines',
+                                        name=str(scenario),
+                                    )
+                                    for scenario, group in df_live.groupby('scenario', sort=False)
+                                ])
+                                fig.update_layout(
+                                    title='HIV Prevalence Over Time (Live)',
+                                    xaxis_title='Year',
+                                    yaxis_title='HIV Prevalence (%)',
+                                    height=300,
+                                    uirevision='live_prev',
+                                )
+                                st.plotly_chart(fig, use_container_width=True)
+                    except Exception as e:
+                        st.warning(f"Could not load live plot data: {e}")
+        
+            except Exception as e:
+                st.warning(f"Could not read progress: {e}")
+        else:
+            # Fallback to basic progress tracking
+            if output_dir.exists():
+                completed = _count_completed(output_dir)
+                total = len(st.session_state.selected_scenarios)
+                progress = completed / total if total > 0 else 0
+            
+                st.progress(progress)
+                st.text(f"Completed: {completed}/{total} scenarios")
+            
+                if completed == total:
+                    st.session_state.simulation_running = False
+                    st.success("✅ All scenarios completed!")
+                    st.balloons()
+                    # Full-page rerun so the run controls pick up the new state
+                    st.rerun()
+            else:
+                st.info("⏳ Initializing simulation...")
+
+
 def configure_and_run_page():
     """Main configuration and run page."""
     st.markdown('<h2 class="sub-header">Simulation Configuration</h2>', unsafe_allow_html=True)
@@ -168,23 +587,36 @@ def configure_and_run_page():
     with tab1:
         st.markdown("### Select Policy Scenarios to Simulate")
         
-        scenarios_list = list_scenarios()
-        
-        # Display scenarios with descriptions
-        col1, col2 = st.columns(2)
+        scenarios_list = _cached_scenarios()
         
-        selected_scenarios = []
+        # Checkbox state lives in session state so the quick-select buttons
+        # below can tick and untick it
+        scenario_ids = [scenario['id'] for scenario in scenarios_list]
+        for scenario_id in scenario_ids:
+            st.session_state.setdefault(
+                f"scenario_{scenario_id}", scenario_id in st.session_state.selected_scenarios
+            )
         
-        for i, scenario in enumerate(scenarios_list):
-            with col1 if i % 2 == 0 else col2:
-                with st.expander(f"**{scenario['name']}** ({scenario['id']})", expanded=False):
-                    st.write(scenario['description'])
-                    
-                    if st.checkbox(f"Select {scenario['id']}", key=f"scenario_{scenario['id']}",
-                                 value=scenario['id'] == 'S0_baseline'):
-                        selected_scenarios.append(scenario['id'])
+        # Display scenarios with descriptions; the form batches checkbox
+        # changes into a single rerun on "Apply Selection"
+        with st.form("scenario_form"):
+            col1, col2 = st.columns(2)
+            
+            selected_scenarios = []
+            
+            for i, scenario in enumerate(scenarios_list):
+                with col1 if i % 2 == 0 else col2:
+                    with st.expander(f"**{scenario['name']}** ({scenario['id']})", expanded=False):
+                        st.write(scenario['description'])
+                        
+                        if st.checkbox(f"Select {scenario['id']}", key=f"scenario_{scenario['id']}"):
+                            selected_scenarios.append(scenario['id'])
+            
+            submitted = st.form_submit_button("Apply Selection")
         
-        st.session_state.selected_scenarios = selected_scenarios
+        if submitted:
+            st.session_state.selected_scenarios = selected_scenarios
+        selected_scenarios = st.session_state.selected_scenarios
         
         if selected_scenarios:
             st.success(f"✅ {len(selected_scenarios)} scenario(s) selected: {', '.join(selected_scenarios)}")
@@ -194,17 +626,15 @@ def configure_and_run_page():
         # Quick select buttons
         col1, col2, col3 = st.columns(3)
         with col1:
-            if st.button("Select All", use_container_width=True):
-                st.session_state.selected_scenarios = [s['id'] for s in scenarios_list]
-                st.rerun()
+            st.button("Select All", use_container_width=True,
+                      on_click=_set_scenario_selection, args=(scenario_ids, scenario_ids))
         with col2:
-            if st.button("Select Funding Scenarios", use_container_width=True):
-                st.session_state.selected_scenarios = ['S0_baseline', 'S1a_optimistic_funding', 'S1b_pessimistic_funding']
-                st.rerun()
+            st.button("Select Funding Scenarios", use_container_width=True,
+                      on_click=_set_scenario_selection,
+                      args=(['S0_baseline', 'S1a_optimistic_funding', 'S1b_pessimistic_funding'], scenario_ids))
         with col3:
-            if st.button("Clear All", use_container_width=True):
-                st.session_state.selected_scenarios = []
-                st.rerun()
+            st.button("Clear All", use_container_width=True,
+                      on_click=_set_scenario_selection, args=([], scenario_ids))
     
     # Tab 2: Time and Population Settings
     with tab2:
@@ -257,17 +687,18 @@ def configure_and_run_page():
             total_steps = int(years / dt)
             st.metric("Total Simulation Steps", f"{total_steps:,}")
         
-        # Estimation
-        st.markdown("---")
-        st.markdown("### Execution Time Estimation")
-        
-        estimated_time_per_scenario = (population / 10000) * (years / 35) * 3  # rough estimate in minutes
-        total_estimated_time = estimated_time_per_scenario * len(st.session_state.selected_scenarios)
-        
-        col1, col2, col3 = st.columns(3)
-        col1.metric("Per Scenario", f"{estimated_time_per_scenario:.1f} min")
-        col2.metric("Total Time", f"{total_estimated_time:.1f} min ({total_estimated_time/60:.1f} hrs)")
-        col3.metric("Agent-Years", f"{(population * years / 1000000):.1f}M")
+        # Estimation (only useful before a run starts)
+        if not st.session_state.simulation_running:
+            st.markdown("---")
+            st.markdown("### Execution Time Estimation")
+            
+            estimated_time_per_scenario = (population / 10000) * (years / 35) * 3  # rough estimate in minutes
+            total_estimated_time = estimated_time_per_scenario * len(st.session_state.selected_scenarios)
+            
+            col1, col2, col3 = st.columns(3)
+            col1.metric("Per Scenario", f"{estimated_time_per_scenario:.1f} min")
+            col2.metric("Total Time", f"{total_estimated_time:.1f} min ({total_estimated_time/60:.1f} hrs)")
+            col3.metric("Agent-Years", f"{(population * years / 1000000):.1f}M")
     
     # Tab 3: Model Parameters
     with tab3:
@@ -482,129 +913,272 @@ def configure_and_run_page():
     
     # Show progress if running
     if st.session_state.simulation_running:
-        st.markdown('<div class="info-box">', unsafe_allow_html=True)
-        st.markdown("### 🔄 Live Simulation Monitor")
+        _live_monitor(output_dir)
+
+
+@_fragment
+def _results_overview_tab(selected_scenario):
+    """Overview tab: key indicators, prevalence trajectory and treatment cascade."""
+    # Load results
+    results_file = selected_scenario / "simulation_results.csv"
+    if results_file.exists():
+        df = _load_overview(str(results_file), results_file.stat().st_mtime)
         
-        # Check for progress file
-        progress_file = output_dir / ".progress.json"
+        # Display key metrics
+        st.markdown("### Key Indicators")
+        final_row = df.iloc[-1]
         
-        if progress_file.exists():
-            try:
-                with open(progress_file, 'r') as f:
-                    progress_data = json.load(f)
-                
-                # Overall Progress
-                col1, col2 = st.columns([3, 1])
-                with col1:
-                    st.progress(progress_data.get('overall_progress', 0) / 100)
-                with col2:
-                    st.metric("Overall", f"{progress_data.get('overall_progress', 0):.1f}%")
-                
-                # Current Scenario Info
-                st.markdown(f"**Current Scenario:** `{progress_data.get('scenario', 'Unknown')}`  "
-                          f"(#{progress_data.get('scenario_num', 0)}/{progress_data.get('total_scenarios', 0)})")
-                
-                # Year Progress
-                current_year = progress_data.get('current_year', 0)
-                st.markdown(f"**Simulation Year:** {current_year:.1f}")
-                year_prog = progress_data.get('year_progress', 0) / 100
-                st.progress(year_prog)
-                
-                # Live Agent Statistics
-                st.markdown("#### 📊 Live Agent Statistics")
-                
-                metric_col1, metric_col2, metric_col3, metric_col4 = st.columns(4)
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("Final Prevalence", f"{final_row['true_hiv_prevalence']*100:.2f}%")
+        col2.metric("ART Coverage", f"{final_row['true_art_coverage']*100:.1f}%")
+        col3.metric("Population", f"{final_row['total_population']:,.0f}")
+        col4.metric("PLHIV", f"{final_row['true_hiv_positive']:,.0f}")
+        
+        # Plot prevalence trajectory
+        st.markdown("### HIV Prevalence Trajectory")
+        fig = px.line(df, x='year', y='true_hiv_prevalence', render_mode='webgl',
+                    title='HIV Prevalence Over Time',
+                    labels={'true_hiv_prevalence': 'HIV Prevalence (%)',
+                            'year': 'Year'})
+        fig.update_traces(line_color='#1f77b4', line_width=3)
+        fig.update_yaxes(tickformat='.1%')
+        st.plotly_chart(fig, use_container_width=True)
+        
+        # Treatment cascade
+        st.markdown("### Treatment Cascade Progress")
+        years_x = df['year'].to_numpy()
+        fig2 = go.Figure()
+        fig2.add_traces([
+            go.Scattergl(x=years_x, y=df[col].to_numpy(dtype='float32'),
+                       mode='lines', name=name,
+                       line=dict(color=color, width=2))
+            for col, name, color in CASCADE_SERIES
+        ])
+        fig2.update_layout(title='Treatment Cascade Over Time',
+                         xaxis_title='Year',
+                         yaxis_title='Number of People',
+                         uirevision='cascade')
+        st.plotly_chart(fig2, use_container_width=True)
+
+
+@_fragment
+def _results_age_sex_tab(selected_scenario):
+    """Age-Sex tab: per-year age/sex prevalence and age-group trends."""
+    detailed_csv = selected_scenario / "detailed_age_sex_results.csv"
+    if detailed_csv.exists():
+        st.markdown("### Age-Sex Stratified Analysis")
+        
+        detailed_mtime = detailed_csv.stat().st_mtime
+        summary = _scenario_summary(str(detailed_csv), detailed_mtime)
+        
+        # Prevalence data only (not regional)
+        by_year_age = summary['prevalence_by_year_age']
+        
+        if len(by_year_age) > 0:
+            # Year selector
+            years_available = summary['years']
+            selected_years = st.multiselect(
+                "Select Years to Display",
+                options=years_available,
+                default=[years_available[0], years_available[-1]]
+            )
+            
+            if selected_years:
+                # Prevalence by Age and Sex
+                st.markdown("#### HIV Prevalence by Age Group and Sex")
                 
-                with metric_col1:
-                    st.metric(
-                        "👥 Agents Alive",
-                        f"{progress_data.get('agents_alive', 0):,}",
-                        help="Total agents currently in simulation"
+                for year in selected_years:
+                    pivot = _pivot_year(str(detailed_csv), detailed_mtime, year)
+                    
+                    # Bar chart
+                    fig = go.Figure()
+                    if 'M' in pivot.columns:
+                        fig.add_trace(go.Bar(
+                            x=pivot.index,
+                            y=pivot['M'],
+                            name='Male',
+                            marker_color='steelblue'
+                        ))
+                    if 'F' in pivot.columns:
+                        fig.add_trace(go.Bar(
+                            x=pivot.index,
+                            y=pivot['F'],
+                            name='Female',
+                            marker_color='salmon'
+                        ))
+                    
+                    fig.update_layout(
+                        title=f'HIV Prevalence by Age and Sex ({year})',
+                        xaxis_title='Age Group',
+                        yaxis_title='HIV Prevalence (%)',
+                        barmode='group',
+                        height=400
                     )
+                    st.plotly_chart(fig, use_container_width=True)
                 
-                with metric_col2:
-                    hiv_pos = progress_data.get('agents_hiv_positive', 0)
-                    prevalence = progress_data.get('prevalence', 0)
-                    st.metric(
-                        "🦠 HIV+ Agents",
-                        f"{hiv_pos:,}",
-                        delta=f"{prevalence:.2f}% prevalence",
-                        delta_color="inverse"
-                    )
+                # Time series by age group
+                st.markdown("#### Prevalence Trends by Age Group")
                 
-                with metric_col3:
-                    on_art = progress_data.get('agents_on_art', 0)
-                    art_cov = progress_data.get('art_coverage', 0)
-                    st.metric(
-                        "💊 On ART",
-                        f"{on_art:,}",
-                        delta=f"{art_cov:.1f}% coverage"
-                    )
+                age_groups = summary['age_groups']
+                selected_ages = st.multiselect(
+                    "Select Age Groups",
+                    options=age_groups,
+                    default=age_groups[:3] if len(age_groups) >= 3 else age_groups
+                )
                 
-                with metric_col4:
-                    new_inf = progress_data.get('new_infections_this_year', 0)
-                    st.metric(
-                        "🔴 New Infections",
-                        f"{new_inf:,}",
-                        help="New infections this simulation year"
+                if selected_ages:
+                    trends = by_year_age[
+                        by_year_age.index.get_level_values('age_group').isin(selected_ages)
+                    ].reset_index()
+                    fig = px.line(trends, x='year', y='prevalence_pct', color='age_group',
+                                  category_orders={'age_group': selected_ages},
+                                  render_mode='webgl')
+                    fig.update_traces(line_width=2)
+                    
+                    fig.update_layout(
+                        title='HIV Prevalence Trends by Age Group',
+                        xaxis_title='Year',
+                        yaxis_title='HIV Prevalence (%)',
+                        height=500
                     )
-                
-                # Live Plot - Prevalence Evolution
-                live_data_file = output_dir / ".live_data.json"
-                if live_data_file.exists():
-                    try:
-                        live_data = []
-                        with open(live_data_file, 'r') as f:
-                            for line in f:
-                                try:
-                                    live_data.append(json.loads(line.strip()))
-                                except:
-                                    continue
-                        
-                        if live_data:
-                            df_live = pd.DataFrame(live_data)
-                            if not df_live.empty and 'current_year' in df_live.columns:
-                                st.markdown("#### 📈 Live Prevalence Evolution")
-                                
-                                fig = px.line(
-                                    df_live,
-                                    x='current_year',
-                                    y='prevalence',
-                                    color='scenario',
-                                    title='HIV Prevalence Over Time (Live)',
-                                    labels={'current_year': 'Year',
-                                            'prevalence': 'HIV Prevalence (%)'}
-                                )
-                                fig.update_layout(height=300)
-                                st.plotly_chart(fig, use_container_width=True)
-                    except Exception as e:
-                        st.warning(f"Could not load live plot data: {e}")
-            
-            except Exception as e:
-                st.warning(f"Could not read progress: {e}")
+                    st.plotly_chart(fig, use_container_width=True)
         else:
-            # Fallback to basic progress tracking
-            if output_dir.exists():
-                completed = len([d for d in output_dir.iterdir()
-                               if d.is_dir() and (d / "simulation_results.csv").exists()])
-                total = len(st.session_state.selected_scenarios)
-                progress = completed / total if total > 0 else 0
-                
-                st.progress(progress)
-                st.text(f"Completed: {completed}/{total} scenarios")
-                
-                if completed == total:
-                    st.session_state.simulation_running = False
-                    st.success("✅ All scenarios completed!")
-                    st.balloons()
-            else:
-                st.info("⏳ Initializing simulation...")
+            st.info("No age-sex prevalence data available.")
+    else:
+        st.warning("Detailed age-sex results not available for this scenario.")
+        st.info("� This data is available in newer simulations (e.g., Saint_Seya_Simulation_Detailed)")
+
+
+@_fragment
+def _results_regional_tab(selected_scenario):
+    """Regional tab: regional prevalence for a year and trends over time."""
+    detailed_csv = selected_scenario / "detailed_age_sex_results.csv"
+    if detailed_csv.exists():
+        st.markdown("### Regional Stratified Analysis")
         
-        # Auto-refresh
-        time.sleep(2)
-        st.rerun()
+        detailed_mtime = detailed_csv.stat().st_mtime
+        summary = _scenario_summary(str(detailed_csv), detailed_mtime)
+        by_year_region = summary['regional_by_year_region']
         
-        st.markdown('</div>', unsafe_allow_html=True)
+        if len(by_year_region) > 0:
+            # Year selector
+            years_available = summary['years']
+            selected_year = st.select_slider(
+                "Select Year",
+                options=years_available,
+                value=years_available[-1]
+            )
+            
+            # Regional prevalence comparison
+            st.markdown(f"#### HIV Prevalence by Region ({selected_year})")
+            
+            regional_summary = _summary_slice(by_year_region, selected_year).sort_values(ascending=False)
+            
+            fig = go.Figure(go.Bar(
+                x=regional_summary.values,
+                y=regional_summary.index,
+                orientation='h',
+                marker_color='teal'
+            ))
+            
+            fig.update_layout(
+                title=f'HIV Prevalence by Region ({selected_year})',
+                xaxis_title='HIV Prevalence (%)',
+                yaxis_title='Region',
+                height=500,
+                uirevision='keep'
+            )
+            st.plotly_chart(fig, use_container_width=True)
+            
+            # Regional trends over time
+            st.markdown("#### Regional Trends Over Time")
+            
+            regions = summary['regions']
+            selected_regions = st.multiselect(
+                "Select Regions to Compare",
+                options=regions,
+                default=regions[:5] if len(regions) >= 5 else regions
+            )
+            
+            if selected_regions:
+                trends = by_year_region[
+                    by_year_region.index.get_level_values('region').isin(selected_regions)
+                ].reset_index()
+                fig = px.line(trends, x='year', y='prevalence_pct', color='region',
+                              category_orders={'region': selected_regions},
+                              render_mode='webgl')
+                fig.update_traces(line_width=2)
+                
+                fig.update_layout(
+                    title='HIV Prevalence Trends by Region',
+                    xaxis_title='Year',
+                    yaxis_title='HIV Prevalence (%)',
+                    height=500
+                )
+                st.plotly_chart(fig, use_container_width=True)
+        else:
+            st.info("No regional prevalence data available.")
+    else:
+        st.warning("Detailed regional results not available for this scenario.")
+        st.info("💡 This data is available in newer simulations (e.g., Saint_Seya_Simulation_Detailed)")
+
+
+@_fragment
+def _results_downloads_tab(selected_scenario):
+    """Downloads tab: raw result files of the scenario."""
+    st.markdown("### Download Data Files")
+    
+    # Basic results
+    results_file = selected_scenario / "simulation_results.csv"
+    if results_file.exists():
+        st.download_button(
+            label="📥 Download Aggregate Results (CSV)",
+            data=_cached(_read_bytes, results_file),
+            file_name=f"{selected_scenario.name}_results.csv",
+            mime="text/csv"
+        )
+    
+    # Detailed age-sex results
+    detailed_csv = selected_scenario / "detailed_age_sex_results.csv"
+    if detailed_csv.exists():
+        st.download_button(
+            label="📥 Download Detailed Age-Sex Results (CSV)",
+            data=_cached(_read_bytes, detailed_csv),
+            file_name=f"{selected_scenario.name}_detailed_age_sex.csv",
+            mime="text/csv"
+        )
+    
+    # Detailed JSON results
+    detailed_json = selected_scenario / "detailed_results.json"
+    if detailed_json.exists():
+        st.download_button(
+            label="📥 Download Complete Detailed Results (JSON)",
+            data=_cached(_read_bytes, detailed_json),
+            file_name=f"{selected_scenario.name}_detailed_results.json",
+            mime="application/json"
+        )
+        
+        # Show JSON structure preview
+        with st.expander("📋 View Detailed Results Structure"):
+            structure = _cached(_json_structure, detailed_json)
+            data_types = structure['data_types']
+            
+            st.write(f"**Years Available:** {structure['n_years']} years")
+            st.write(f"**Data Dimensions per Year:** {len(data_types)}")
+            st.write("**Available Data Types:**")
+            
+            for i, dtype in enumerate(data_types, 1):
+                st.write(f"  {i}. `{dtype}`")
+    
+    # Metadata
+    metadata_file = selected_scenario / "metadata.json"
+    if metadata_file.exists():
+        st.download_button(
+            label="📥 Download Scenario Metadata (JSON)",
+            data=_cached(_read_bytes, metadata_file),
+            file_name=f"{selected_scenario.name}_metadata.json",
+            mime="application/json"
+        )
 
 
 def view_results_page():
@@ -618,7 +1192,9 @@ def view_results_page():
         return
     
     # List available result directories
-    result_dirs = [d for d in results_base.iterdir() if d.is_dir()]
+    if st.button("🔄 Refresh results list", key="refresh_results"):
+        _list_result_dirs.clear()
+    result_dirs = _result_dirs(results_base)
     
     if not result_dirs:
         st.info("No simulation results found yet. Run a simulation to generate results.")
@@ -645,7 +1221,7 @@ def view_results_page():
             col4.metric("Execution Time", f"{summary.get('total_execution_time_seconds', 0)/60:.1f} min")
         
         # List scenarios
-        scenario_dirs = [d for d in selected_dir.iterdir() if d.is_dir()]
+        scenario_dirs = _result_dirs(selected_dir)
         
         if scenario_dirs:
             st.markdown("### Available Scenarios")
@@ -658,294 +1234,286 @@ def view_results_page():
             
             if selected_scenario:
                 # Create tabs for different views
-                tab1, tab2, tab3, tab4 = st.tabs([
-                    "📊 Overview", 
-                    "👥 Age-Sex Analysis", 
-                    "🗺️ Regional Analysis",
-                    "💾 Data Downloads"
-                ])
-                
-                # Tab 1: Overview (existing functionality)
-                with tab1:
-                    # Load results
-                    results_file = selected_scenario / "simulation_results.csv"
-                    if results_file.exists():
-                        df = pd.read_csv(results_file)
-                        
-                        # Display key metrics
-                        st.markdown("### Key Indicators")
-                        final_row = df.iloc[-1]
-                        
-                        col1, col2, col3, col4 = st.columns(4)
-                        col1.metric("Final Prevalence", f"{final_row['true_hiv_prevalence']*100:.2f}%")
-                        col2.metric("ART Coverage", f"{final_row['true_art_coverage']*100:.1f}%")
-                        col3.metric("Population", f"{final_row['total_population']:,.0f}")
-                        col4.metric("PLHIV", f"{final_row['true_hiv_positive']:,.0f}")
-                        
-                        # Plot prevalence trajectory
-                        st.markdown("### HIV Prevalence Trajectory")
-                        fig = px.line(df, x='year', y='true_hiv_prevalence',
-                                    title='HIV Prevalence Over Time',
-                                    labels={'true_hiv_prevalence': 'HIV Prevalence (%)',
-                                            'year': 'Year'})
-                        fig.update_traces(line_color='#1f77b4', line_width=3)
-                        fig.update_yaxes(tickformat='.1%')
-                        st.plotly_chart(fig, use_container_width=True)
-                        
-                        # Treatment cascade
-                        st.markdown("### Treatment Cascade Progress")
-                        fig2 = go.Figure()
-                        fig2.add_trace(go.Scatter(x=df['year'], y=df['true_hiv_positive'],
-                                                 mode='lines', name='PLHIV',
-                                                 line=dict(color='red', width=2)))
-                        fig2.add_trace(go.Scatter(x=df['year'], y=df['diagnosed'],
-                                                 mode='lines', name='Diagnosed',
-                                                 line=dict(color='orange', width=2)))
-                        fig2.add_trace(go.Scatter(x=df['year'], y=df['true_on_art'],
-                                                 mode='lines', name='On ART',
-                                                 line=dict(color='green', width=2)))
-                        fig2.update_layout(title='Treatment Cascade Over Time',
-                                         xaxis_title='Year',
-                                         yaxis_title='Number of People')
-                        st.plotly_chart(fig2, use_container_width=True)
-                
-                # Tab 2: Age-Sex Analysis
-                with tab2:
-                    detailed_csv = selected_scenario / "detailed_age_sex_results.csv"
-                    if detailed_csv.exists():
-                        st.markdown("### Age-Sex Stratified Analysis")
-                        
-                        df_detailed = pd.read_csv(detailed_csv)
-                        
-                        # Filter for prevalence data only (not regional)
-                        age_sex_data = df_detailed[df_detailed['type'] == 'prevalence'].copy()
-                        
-                        if len(age_sex_data) > 0:
-                            # Year selector
-                            years_available = sorted(age_sex_data['year'].unique())
-                            selected_years = st.multiselect(
-                                "Select Years to Display",
-                                options=years_available,
-                                default=[years_available[0], years_available[-1]]
-                            )
-                            
-                            if selected_years:
-                                # Prevalence by Age and Sex
-                                st.markdown("#### HIV Prevalence by Age Group and Sex")
-                                
-                                for year in selected_years:
-                                    year_data = age_sex_data[age_sex_data['year'] == year]
-                                    
-                                    # Create pivot table
-                                    pivot = year_data.pivot_table(
-                                        values='prevalence_pct',
-                                        index='age_group',
-                                        columns='sex',
-                                        aggfunc='mean'
-                                    )
-                                    
-                                    # Bar chart
-                                    fig = go.Figure()
-                                    if 'M' in pivot.columns:
-                                        fig.add_trace(go.Bar(
-                                            x=pivot.index,
-                                            y=pivot['M'],
-                                            name='Male',
-                                            marker_color='steelblue'
-                                        ))
-                                    if 'F' in pivot.columns:
-                                        fig.add_trace(go.Bar(
-                                            x=pivot.index,
-                                            y=pivot['F'],
-                                            name='Female',
-                                            marker_color='salmon'
-                                        ))
-                                    
-                                    fig.update_layout(
-                                        title=f'HIV Prevalence by Age and Sex ({year})',
-                                        xaxis_title='Age Group',
-                                        yaxis_title='HIV Prevalence (%)',
-                                        barmode='group',
-                                        height=400
-                                    )
-                                    st.plotly_chart(fig, use_container_width=True)
-                                
-                                # Time series by age group
-                                st.markdown("#### Prevalence Trends by Age Group")
-                                
-                                age_groups = sorted(age_sex_data['age_group'].unique())
-                                selected_ages = st.multiselect(
-                                    "Select Age Groups",
-                                    options=age_groups,
-                                    default=age_groups[:3] if len(age_groups) >= 3 else age_groups
-                                )
-                                
-                                if selected_ages:
-                                    fig = go.Figure()
-                                    for age in selected_ages:
-                                        age_data = age_sex_data[age_sex_data['age_group'] == age]
-                                        by_year = age_data.groupby('year')['prevalence_pct'].mean()
-                                        fig.add_trace(go.Scatter(
-                                            x=by_year.index,
-                                            y=by_year.values,
-                                            mode='lines',
-                                            name=age,
-                                            line=dict(width=2)
-                                        ))
-                                    
-                                    fig.update_layout(
-                                        title='HIV Prevalence Trends by Age Group',
-                                        xaxis_title='Year',
-                                        yaxis_title='HIV Prevalence (%)',
-                                        height=500
-                                    )
-                                    st.plotly_chart(fig, use_container_width=True)
-                        else:
-                            st.info("No age-sex prevalence data available.")
-                    else:
-                        st.warning("Detailed age-sex results not available for this scenario.")
-                        st.info("� This data is available in newer simulations (e.g., Saint_Seya_Simulation_Detailed)")
-                
-                # Tab 3: Regional Analysis
-                with tab3:
-                    detailed_csv = selected_scenario / "detailed_age_sex_results.csv"
-                    if detailed_csv.exists():
-                        st.markdown("### Regional Stratified Analysis")
-                        
-                        df_detailed = pd.read_csv(detailed_csv)
-                        
-                        # Filter for regional data
-                        regional_data = df_detailed[df_detailed['type'] == 'regional_prevalence'].copy()
-                        
-                        if len(regional_data) > 0:
-                            # Year selector
-                            years_available = sorted(regional_data['year'].unique())
-                            selected_year = st.select_slider(
-                                "Select Year",
-                                options=years_available,
-                                value=years_available[-1]
-                            )
-                            
-                            year_data = regional_data[regional_data['year'] == selected_year]
-                            
-                            # Regional prevalence comparison
-                            st.markdown(f"#### HIV Prevalence by Region ({selected_year})")
-                            
-                            regional_summary = year_data.groupby('region')['prevalence_pct'].mean().sort_values(ascending=False)
-                            
-                            fig = go.Figure(go.Bar(
-                                x=regional_summary.values,
-                                y=regional_summary.index,
-                                orientation='h',
-                                marker_color='teal'
-                            ))
-                            
-                            fig.update_layout(
-                                title=f'HIV Prevalence by Region ({selected_year})',
-                                xaxis_title='HIV Prevalence (%)',
-                                yaxis_title='Region',
-                                height=500
-                            )
-                            st.plotly_chart(fig, use_container_width=True)
-                            
-                            # Regional trends over time
-                            st.markdown("#### Regional Trends Over Time")
-                            
-                            regions = sorted(regional_data['region'].dropna().unique())
-                            selected_regions = st.multiselect(
-                                "Select Regions to Compare",
-                                options=regions,
-                                default=regions[:5] if len(regions) >= 5 else regions
-                            )
-                            
-                            if selected_regions:
-                                fig = go.Figure()
-                                for region in selected_regions:
-                                    region_data = regional_data[regional_data['region'] == region]
-                                    by_year = region_data.groupby('year')['prevalence_pct'].mean()
-                                    fig.add_trace(go.Scatter(
-                                        x=by_year.index,
-                                        y=by_year.values,
-                                        mode='lines',
-                                        name=region,
-                                        line=dict(width=2)
-                                    ))
-                                
-                                fig.update_layout(
-                                    title='HIV Prevalence Trends by Region',
-                                    xaxis_title='Year',
-                                    yaxis_title='HIV Prevalence (%)',
-                                    height=500
-                                )
-                                st.plotly_chart(fig, use_container_width=True)
-                        else:
-                            st.info("No regional prevalence data available.")
-                    else:
-                        st.warning("Detailed regional results not available for this scenario.")
-                        st.info("💡 This data is available in newer simulations (e.g., Saint_Seya_Simulation_Detailed)")
-                
-                # Tab 4: Downloads
-                with tab4:
-                    st.markdown("### Download Data Files")
-                    
-                    # Basic results
-                    results_file = selected_scenario / "simulation_results.csv"
-                    if results_file.exists():
-                        with open(results_file, 'rb') as f:
-                            st.download_button(
-                                label="📥 Download Aggregate Results (CSV)",
-                                data=f.read(),
-                                file_name=f"{selected_scenario.name}_results.csv",
-                                mime="text/csv"
-                            )
-                    
-                    # Detailed age-sex results
-                    detailed_csv = selected_scenario / "detailed_age_sex_results.csv"
-                    if detailed_csv.exists():
-                        with open(detailed_csv, 'rb') as f:
-                            st.download_button(
-                                label="📥 Download Detailed Age-Sex Results (CSV)",
-                                data=f.read(),
-                                file_name=f"{selected_scenario.name}_detailed_age_sex.csv",
-                                mime="text/csv"
-                            )
-                    
-                    # Detailed JSON results
-                    detailed_json = selected_scenario / "detailed_results.json"
-                    if detailed_json.exists():
-                        with open(detailed_json, 'rb') as f:
-                            st.download_button(
-                                label="📥 Download Complete Detailed Results (JSON)",
-                                data=f.read(),
-                                file_name=f"{selected_scenario.name}_detailed_results.json",
-                                mime="application/json"
-                            )
-                        
-                        # Show JSON structure preview
-                        with st.expander("📋 View Detailed Results Structure"):
-                            with open(detailed_json, 'r') as f:
-                                detailed_data = json.load(f)
-                                
-                            sample_year = list(detailed_data.keys())[0]
-                            data_types = list(detailed_data[sample_year].keys())
-                            
-                            st.write(f"**Years Available:** {len(detailed_data)} years")
-                            st.write(f"**Data Dimensions per Year:** {len(data_types)}")
-                            st.write("**Available Data Types:**")
-                            
-                            for i, dtype in enumerate(data_types, 1):
-                                st.write(f"  {i}. `{dtype}`")
-                    
-                    # Metadata
-                    metadata_file = selected_scenario / "metadata.json"
-                    if metadata_file.exists():
-                        with open(metadata_file, 'rb') as f:
-                            st.download_button(
-                                label="📥 Download Scenario Metadata (JSON)",
-                                data=f.read(),
-                                file_name=f"{selected_scenario.name}_metadata.json",
-                                mime="application/json"
-                            )
+                # Only the selected view runs, so other tabs' files are not read
+                views = {
+                    "📊 Overview": _results_overview_tab,
+                    "👥 Age-Sex Analysis": _results_age_sex_tab,
+                    "🗺️ Regional Analysis": _results_regional_tab,
+                    "💾 Data Downloads": _results_downloads_tab,
+                }
+                active = st.radio(
+                    "View",
+                    options=list(views),
+                    horizontal=True,
+                    label_visibility="collapsed",
+                    key="results_view"
+                )
+                views[active](selected_scenario)
+
+
+@_fragment
+def _compare_overview_tab(selected_scenarios):
+    """Overview comparison: final-year outcomes and prevalence trends."""
+    st.markdown("### Final Year Outcomes Comparison")
+    
+    # Collect data from all scenarios
+    comparison_data = []
+    for scenario_path in selected_scenarios:
+        results_file = scenario_path / "simulation_results.csv"
+        if results_file.exists():
+            comparison_data.append({
+                'Scenario': scenario_path.name,
+                **_cached(_final_outcomes, results_file),
+            })
+    
+    if comparison_data:
+        comp_df = pd.DataFrame(comparison_data)
+        
+        # Display table
+        st.dataframe(comp_df, use_container_width=True)
+        
+        # Prevalence comparison
+        st.markdown("#### HIV Prevalence Comparison")
+        fig1 = go.Figure()
+        fig1.add_trace(go.Bar(
+            x=comp_df['Scenario'],
+            y=comp_df['Prevalence (%)'],
+            marker_color='steelblue'
+        ))
+        fig1.update_layout(
+            title='Final HIV Prevalence by Scenario',
+            xaxis_title='Scenario',
+            yaxis_title='HIV Prevalence (%)',
+            height=400
+        )
+        st.plotly_chart(fig1, use_container_width=True)
+        
+        # ART Coverage comparison
+        st.markdown("#### ART Coverage Comparison")
+        fig2 = go.Figure()
+        fig2.add_trace(go.Bar(
+            x=comp_df['Scenario'],
+            y=comp_df['ART Coverage (%)'],
+            marker_color='green'
+        ))
+        fig2.update_layout(
+            title='Final ART Coverage by Scenario',
+            xaxis_title='Scenario',
+            yaxis_title='ART Coverage (%)',
+            height=400
+        )
+        st.plotly_chart(fig2, use_container_width=True)
+        
+        # Time series comparison
+        st.markdown("#### Prevalence Trends Over Time")
+        frames = []
+        for scenario_path in selected_scenarios:
+            results_file = scenario_path / "simulation_results.csv"
+            if results_file.exists():
+                df = _cached(_load_overview, results_file)
+                frames.append(pd.DataFrame({
+                    'year': _downsample(df['year'].to_numpy()),
+                    'prevalence': _downsample(df['true_hiv_prevalence'].to_numpy() * 100),
+                    'Scenario': scenario_path.name,
+                }))
+        trends = pd.concat(frames, ignore_index=True)
+        fig3 = px.line(trends, x='year', y='prevalence', color='Scenario', render_mode='webgl')
+        fig3.update_traces(line_width=2)
+        
+        fig3.update_layout(
+            title='HIV Prevalence Trends Comparison',
+            xaxis_title='Year',
+            yaxis_title='HIV Prevalence (%)',
+            height=500
+        )
+        st.plotly_chart(fig3, use_container_width=True)
+
+
+@_fragment
+def _compare_age_sex_tab(selected_scenarios):
+    """Age-sex comparison for one year across scenarios."""
+    st.markdown("### Age-Sex Stratified Comparison")
+    
+    # Check if detailed data exists
+    has_detailed = all(
+        (s / "detailed_age_sex_results.csv").exists() 
+        for s in selected_scenarios
+    )
+    
+    if has_detailed:
+        # Year selector
+        summaries = {
+            s: _cached(_scenario_summary, s / "detailed_age_sex_results.csv")
+            for s in selected_scenarios
+        }
+        years_available = summaries[selected_scenarios[0]]['years']
+        
+        selected_year = st.select_slider(
+            "Select Year for Comparison",
+            options=years_available,
+            value=years_available[-1]
+        )
+        
+        # Compare prevalence by age-sex
+        st.markdown(f"#### HIV Prevalence by Age-Sex ({selected_year})")
+        
+        fig = go.Figure()
+        
+        for scenario_path in selected_scenarios:
+            # Averaged across sexes for simplicity
+            by_age = _summary_slice(
+                summaries[scenario_path]['prevalence_by_year_age'], selected_year
+            )
+            
+            if len(by_age) > 0:
+                fig.add_trace(go.Scattergl(
+                    x=by_age.index,
+                    y=by_age.values,
+                    mode='lines+markers',
+                    name=scenario_path.name,
+                    line=dict(width=2)
+                ))
+        
+        fig.update_layout(
+            title=f'HIV Prevalence by Age Group ({selected_year})',
+            xaxis_title='Age Group',
+            yaxis_title='HIV Prevalence (%)',
+            height=500
+        )
+        st.plotly_chart(fig, use_container_width=True)
+        
+        # Gender comparison
+        st.markdown(f"#### Female vs Male Prevalence ({selected_year})")
+        
+        # One long (Scenario, sex, age_group) frame feeds both panels
+        by_sex = pd.concat(
+            {
+                scenario_path.name: _summary_slice(
+                    summaries[scenario_path]['prevalence_by_year_sex_age'], selected_year
+                )
+                for scenario_path in selected_scenarios
+            },
+            names=['Scenario'],
+        )
+        by_sex = by_sex.reset_index() if len(by_sex) else None
+        scenario_order = {'Scenario': [s.name for s in selected_scenarios]}
+        
+        for col, sex, title, showlegend in zip(
+            st.columns(2), ('F', 'M'), ('Female Prevalence', 'Male Prevalence'), (False, True)
+        ):
+            with col:
+                if by_sex is not None:
+                    fig = px.bar(by_sex[by_sex['sex'] == sex], x='age_group', y='prevalence_pct',
+                                 color='Scenario', barmode='group', category_orders=scenario_order)
+                else:
+                    fig = go.Figure()
+                fig.update_layout(
+                    title=title,
+                    xaxis_title='Age Group',
+                    yaxis_title='Prevalence (%)',
+                    height=400,
+                    showlegend=showlegend
+                )
+                st.plotly_chart(fig, use_container_width=True)
+        
+    else:
+        st.warning("Detailed age-sex data not available for selected scenarios.")
+        st.info("💡 Run simulations with detailed data collection (e.g., Saint_Seya_Simulation_Detailed)")
+
+
+@_fragment
+def _compare_regional_tab(selected_scenarios):
+    """Regional comparison for one year across scenarios."""
+    st.markdown("### Regional Stratified Comparison")
+    
+    # Check if detailed data exists
+    has_detailed = all(
+        (s / "detailed_age_sex_results.csv").exists() 
+        for s in selected_scenarios
+    )
+    
+    if has_detailed:
+        # Year selector
+        summaries = {
+            s: _cached(_scenario_summary, s / "detailed_age_sex_results.csv")
+            for s in selected_scenarios
+        }
+        years_available = summaries[selected_scenarios[0]]['years']
+        
+        selected_year = st.select_slider(
+            "Select Year for Regional Comparison",
+            options=years_available,
+            value=years_available[-1],
+            key="regional_year"
+        )
+        
+        st.markdown(f"#### Regional HIV Prevalence Comparison ({selected_year})")
+        
+        # Region x scenario prevalence matrix, filled straight from the summaries
+        slices = []
+        for scenario_path in selected_scenarios:
+            by_region = _summary_slice(
+                summaries[scenario_path]['regional_by_year_region'], selected_year
+            )
+            if len(by_region) > 0:
+                slices.append((scenario_path.name, by_region))
+        
+        if slices:
+            scenario_names = [name for name, _ in slices]
+            regions = sorted(set().union(*(by_region.index for _, by_region in slices)))
+            z = np.full((len(regions), len(slices)), np.nan, dtype=np.float32)
+            for j, (_, by_region) in enumerate(slices):
+                z[:, j] = by_region.reindex(regions).to_numpy(dtype=np.float32)
+            
+            # Heatmap comparison
+            fig = go.Figure(data=go.Heatmap(
+                z=z,
+                x=scenario_names,
+                y=regions,
+                colorscale='YlOrRd',
+                text=z,
+                texttemplate='%{text:.2f}',
+                textfont={"size": 10},
+                colorbar=dict(title="Prevalence (%)")
+            ))
+            
+            fig.update_layout(
+                title=f'Regional HIV Prevalence Heatmap ({selected_year})',
+                xaxis_title='Scenario',
+                yaxis_title='Region',
+                height=600,
+                uirevision='keep'
+            )
+            st.plotly_chart(fig, use_container_width=True)
+            
+            # Bar chart comparison for selected region
+            st.markdown("#### Compare Specific Region Across Scenarios")
+            
+            selected_region = st.selectbox(
+                "Select Region",
+                options=regions
+            )
+            
+            fig2 = go.Figure()
+            fig2.add_trace(go.Bar(
+                x=scenario_names,
+                y=z[regions.index(selected_region)],
+                marker_color='teal'
+            ))
+            
+            fig2.update_layout(
+                title=f'{selected_region} - HIV Prevalence Comparison',
+                xaxis_title='Scenario',
+                yaxis_title='HIV Prevalence (%)',
+                height=400,
+                uirevision='keep'
+            )
+            st.plotly_chart(fig2, use_container_width=True)
+        else:
+            st.info("No regional data available for comparison.")
+    else:
+        st.warning("Detailed regional data not available for selected scenarios.")
+        st.info("💡 Run simulations with detailed data collection (e.g., Saint_Seya_Simulation_Detailed)")
 
 
 def compare_scenarios_page():
@@ -959,7 +1527,9 @@ def compare_scenarios_page():
         return
     
     # List available result directories
-    result_dirs = [d for d in results_base.iterdir() if d.is_dir()]
+    if st.button("🔄 Refresh results list", key="refresh_compare"):
+        _list_result_dirs.clear()
+    result_dirs = _result_dirs(results_base)
     
     if not result_dirs:
         st.info("No simulation results found yet. Run a simulation to generate results.")
@@ -976,7 +1546,7 @@ def compare_scenarios_page():
     
     if selected_dir:
         # List scenarios
-        scenario_dirs = [d for d in selected_dir.iterdir() if d.is_dir()]
+        scenario_dirs = _result_dirs(selected_dir)
         
         if len(scenario_dirs) < 2:
             st.warning("Need at least 2 scenarios to compare. Run more scenarios first.")
@@ -994,321 +1564,20 @@ def compare_scenarios_page():
         
         if len(selected_scenarios) >= 2:
             # Create comparison tabs
-            tab1, tab2, tab3 = st.tabs([
-                "📊 Overview Comparison",
-                "👥 Age-Sex Comparison",
-                "🗺️ Regional Comparison"
-            ])
-            
-            # Tab 1: Overview Comparison
-            with tab1:
-                st.markdown("### Final Year Outcomes Comparison")
-                
-                # Collect data from all scenarios
-                comparison_data = []
-                for scenario_path in selected_scenarios:
-                    results_file = scenario_path / "simulation_results.csv"
-                    if results_file.exists():
-                        df = pd.read_csv(results_file)
-                        final = df.iloc[-1]
-                        
-                        comparison_data.append({
-                            'Scenario': scenario_path.name,
-                            'Prevalence (%)': final['true_hiv_prevalence'] * 100,
-                            'PLHIV': final['true_hiv_positive'],
-                            'ART Coverage (%)': final['true_art_coverage'] * 100,
-                            'Population': final['total_population'],
-                            'Deaths (HIV)': df['deaths_hiv'].sum(),
-                            'New Infections': final['true_new_infections']
-                        })
-                
-                if comparison_data:
-                    comp_df = pd.DataFrame(comparison_data)
-                    
-                    # Display table
-                    st.dataframe(comp_df, use_container_width=True)
-                    
-                    # Prevalence comparison
-                    st.markdown("#### HIV Prevalence Comparison")
-                    fig1 = go.Figure()
-                    fig1.add_trace(go.Bar(
-                        x=comp_df['Scenario'],
-                        y=comp_df['Prevalence (%)'],
-                        marker_color='steelblue'
-                    ))
-                    fig1.update_layout(
-                        title='Final HIV Prevalence by Scenario',
-                        xaxis_title='Scenario',
-                        yaxis_title='HIV Prevalence (%)',
-                        height=400
-                    )
-                    st.plotly_chart(fig1, use_container_width=True)
-                    
-                    # ART Coverage comparison
-                    st.markdown("#### ART Coverage Comparison")
-                    fig2 = go.Figure()
-                    fig2.add_trace(go.Bar(
-                        x=comp_df['Scenario'],
-                        y=comp_df['ART Coverage (%)'],
-                        marker_color='green'
-                    ))
-                    fig2.update_layout(
-                        title='Final ART Coverage by Scenario',
-                        xaxis_title='Scenario',
-                        yaxis_title='ART Coverage (%)',
-                        height=400
-                    )
-                    st.plotly_chart(fig2, use_container_width=True)
-                    
-                    # Time series comparison
-                    st.markdown("#### Prevalence Trends Over Time")
-                    fig3 = go.Figure()
-                    
-                    for scenario_path in selected_scenarios:
-                        results_file = scenario_path / "simulation_results.csv"
-                        if results_file.exists():
-                            df = pd.read_csv(results_file)
-                            fig3.add_trace(go.Scatter(
-                                x=df['year'],
-                                y=df['true_hiv_prevalence'] * 100,
-                                mode='lines',
-                                name=scenario_path.name,
-                                line=dict(width=2)
-                            ))
-                    
-                    fig3.update_layout(
-                        title='HIV Prevalence Trends Comparison',
-                        xaxis_title='Year',
-                        yaxis_title='HIV Prevalence (%)',
-                        height=500
-                    )
-                    st.plotly_chart(fig3, use_container_width=True)
-            
-            # Tab 2: Age-Sex Comparison
-            with tab2:
-                st.markdown("### Age-Sex Stratified Comparison")
-                
-                # Check if detailed data exists
-                has_detailed = all(
-                    (s / "detailed_age_sex_results.csv").exists() 
-                    for s in selected_scenarios
-                )
-                
-                if has_detailed:
-                    # Year selector
-                    sample_csv = selected_scenarios[0] / "detailed_age_sex_results.csv"
-                    sample_df = pd.read_csv(sample_csv)
-                    years_available = sorted(sample_df['year'].unique())
-                    
-                    selected_year = st.select_slider(
-                        "Select Year for Comparison",
-                        options=years_available,
-                        value=years_available[-1]
-                    )
-                    
-                    # Compare prevalence by age-sex
-                    st.markdown(f"#### HIV Prevalence by Age-Sex ({selected_year})")
-                    
-                    fig = go.Figure()
-                    
-                    for scenario_path in selected_scenarios:
-                        detailed_csv = scenario_path / "detailed_age_sex_results.csv"
-                        df_det = pd.read_csv(detailed_csv)
-                        
-                        # Filter for selected year and type
-                        year_data = df_det[
-                            (df_det['year'] == selected_year) & 
-                            (df_det['type'] == 'prevalence')
-                        ]
-                        
-                        if len(year_data) > 0:
-                            # Average across sexes for simplicity
-                            by_age = year_data.groupby('age_group')['prevalence_pct'].mean()
-                            
-                            fig.add_trace(go.Scatter(
-                                x=by_age.index,
-                                y=by_age.values,
-                                mode='lines+markers',
-                                name=scenario_path.name,
-                                line=dict(width=2)
-                            ))
-                    
-                    fig.update_layout(
-                        title=f'HIV Prevalence by Age Group ({selected_year})',
-                        xaxis_title='Age Group',
-                        yaxis_title='HIV Prevalence (%)',
-                        height=500
-                    )
-                    st.plotly_chart(fig, use_container_width=True)
-                    
-                    # Gender comparison
-                    st.markdown(f"#### Female vs Male Prevalence ({selected_year})")
-                    
-                    col1, col2 = st.columns(2)
-                    
-                    with col1:
-                        fig_f = go.Figure()
-                        for scenario_path in selected_scenarios:
-                            detailed_csv = scenario_path / "detailed_age_sex_results.csv"
-                            df_det = pd.read_csv(detailed_csv)
-                            year_data = df_det[
-                                (df_det['year'] == selected_year) & 
-                                (df_det['type'] == 'prevalence') &
-                                (df_det['sex'] == 'F')
-                            ]
-                            if len(year_data) > 0:
-                                by_age = year_data.groupby('age_group')['prevalence_pct'].mean()
-                                fig_f.add_trace(go.Bar(
-                                    x=by_age.index,
-                                    y=by_age.values,
-                                    name=scenario_path.name
-                                ))
-                        
-                        fig_f.update_layout(
-                            title='Female Prevalence',
-                            xaxis_title='Age Group',
-                            yaxis_title='Prevalence (%)',
-                            height=400,
-                            showlegend=False
-                        )
-                        st.plotly_chart(fig_f, use_container_width=True)
-                    
-                    with col2:
-                        fig_m = go.Figure()
-                        for scenario_path in selected_scenarios:
-                            detailed_csv = scenario_path / "detailed_age_sex_results.csv"
-                            df_det = pd.read_csv(detailed_csv)
-                            year_data = df_det[
-                                (df_det['year'] == selected_year) & 
-                                (df_det['type'] == 'prevalence') &
-                                (df_det['sex'] == 'M')
-                            ]
-                            if len(year_data) > 0:
-                                by_age = year_data.groupby('age_group')['prevalence_pct'].mean()
-                                fig_m.add_trace(go.Bar(
-                                    x=by_age.index,
-                                    y=by_age.values,
-                                    name=scenario_path.name
-                                ))
-                        
-                        fig_m.update_layout(
-                            title='Male Prevalence',
-                            xaxis_title='Age Group',
-                            yaxis_title='Prevalence (%)',
-                            height=400
-                        )
-                        st.plotly_chart(fig_m, use_container_width=True)
-                    
-                else:
-                    st.warning("Detailed age-sex data not available for selected scenarios.")
-                    st.info("💡 Run simulations with detailed data collection (e.g., Saint_Seya_Simulation_Detailed)")
-            
-            # Tab 3: Regional Comparison
-            with tab3:
-                st.markdown("### Regional Stratified Comparison")
-                
-                # Check if detailed data exists
-                has_detailed = all(
-                    (s / "detailed_age_sex_results.csv").exists() 
-                    for s in selected_scenarios
-                )
-                
-                if has_detailed:
-                    # Year selector
-                    sample_csv = selected_scenarios[0] / "detailed_age_sex_results.csv"
-                    sample_df = pd.read_csv(sample_csv)
-                    years_available = sorted(sample_df['year'].unique())
-                    
-                    selected_year = st.select_slider(
-                        "Select Year for Regional Comparison",
-                        options=years_available,
-                        value=years_available[-1],
-                        key="regional_year"
-                    )
-                    
-                    st.markdown(f"#### Regional HIV Prevalence Comparison ({selected_year})")
-                    
-                    # Collect regional data
-                    regional_comparison = []
-                    
-                    for scenario_path in selected_scenarios:
-                        detailed_csv = scenario_path / "detailed_age_sex_results.csv"
-                        df_det = pd.read_csv(detailed_csv)
-                        
-                        regional_data = df_det[
-                            (df_det['year'] == selected_year) & 
-                            (df_det['type'] == 'regional_prevalence')
-                        ]
-                        
-                        if len(regional_data) > 0:
-                            by_region = regional_data.groupby('region')['prevalence_pct'].mean()
-                            
-                            for region, prev in by_region.items():
-                                regional_comparison.append({
-                                    'Scenario': scenario_path.name,
-                                    'Region': region,
-                                    'Prevalence (%)': prev
-                                })
-                    
-                    if regional_comparison:
-                        reg_df = pd.DataFrame(regional_comparison)
-                        
-                        # Heatmap comparison
-                        pivot = reg_df.pivot(
-                            index='Region',
-                            columns='Scenario',
-                            values='Prevalence (%)'
-                        )
-                        
-                        fig = go.Figure(data=go.Heatmap(
-                            z=pivot.values,
-                            x=pivot.columns,
-                            y=pivot.index,
-                            colorscale='YlOrRd',
-                            text=pivot.values,
-                            texttemplate='%{text:.2f}',
-                            textfont={"size": 10},
-                            colorbar=dict(title="Prevalence (%)")
-                        ))
-                        
-                        fig.update_layout(
-                            title=f'Regional HIV Prevalence Heatmap ({selected_year})',
-                            xaxis_title='Scenario',
-                            yaxis_title='Region',
-                            height=600
-                        )
-                        st.plotly_chart(fig, use_container_width=True)
-                        
-                        # Bar chart comparison for selected region
-                        st.markdown("#### Compare Specific Region Across Scenarios")
-                        
-                        regions = sorted(reg_df['Region'].unique())
-                        selected_region = st.selectbox(
-                            "Select Region",
-                            options=regions
-                        )
-                        
-                        region_data = reg_df[reg_df['Region'] == selected_region]
-                        
-                        fig2 = go.Figure()
-                        fig2.add_trace(go.Bar(
-                            x=region_data['Scenario'],
-                            y=region_data['Prevalence (%)'],
-                            marker_color='teal'
-                        ))
-                        
-                        fig2.update_layout(
-                            title=f'{selected_region} - HIV Prevalence Comparison',
-                            xaxis_title='Scenario',
-                            yaxis_title='HIV Prevalence (%)',
-                            height=400
-                        )
-                        st.plotly_chart(fig2, use_container_width=True)
-                    else:
-                        st.info("No regional data available for comparison.")
-                else:
-                    st.warning("Detailed regional data not available for selected scenarios.")
-                    st.info("💡 Run simulations with detailed data collection (e.g., Saint_Seya_Simulation_Detailed)")
+            # Only the selected view runs, so other tabs' summaries are not built
+            views = {
+                "📊 Overview Comparison": _compare_overview_tab,
+                "👥 Age-Sex Comparison": _compare_age_sex_tab,
+                "🗺️ Regional Comparison": _compare_regional_tab,
+            }
+            active = st.radio(
+                "View",
+                options=list(views),
+                horizontal=True,
+                label_visibility="collapsed",
+                key="compare_view"
+            )
+            views[active](selected_scenarios)
         else:
             st.info("Please select at least 2 scenarios to compare.")
 
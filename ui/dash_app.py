@@ -1,11 +1,12 @@
 import os
 import sys
 import threading
-from queue import Queue, Empty
+from queue import Queue
 from typing import List, Dict, Any
 
 import dash
 from dash import html, dcc, Output, Input, State
+from dash.exceptions import PreventUpdate
 import plotly.graph_objects as go
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
@@ -19,15 +20,25 @@ RUN_UPDATES: List[Dict[str, Any]] = []
 RUN_THREAD: threading.Thread | None = None
 RUN_MODEL: EnhancedHIVModel | None = None
 RUNNING: bool = False
+RUN_ID: int = 0  # bumped per run so the figures know to start over
+
+# (graph id, row key, title, y-axis title, scale) of the live figures
+FIGURES = [
+    ('fig-prev', 'hiv_prevalence', 'HIV Prevalence (%)', '%', 100),
+    ('fig-art', 'art_coverage', 'ART Coverage (%)', '%', 100),
+    ('fig-inf', 'new_infections', 'New Infections', '#', 1),
+    ('fig-pop', 'total_population', 'Total Population', '#', 1),
+]
 
 
 def start_run(population: int, years: int, dt: float, start_year: int, seed: int | None,
               mixing_method: str, use_numba: bool):
-    global RUN_QUEUE, RUN_UPDATES, RUN_THREAD, RUN_MODEL, RUNNING
+    global RUN_QUEUE, RUN_UPDATES, RUN_THREAD, RUN_MODEL, RUNNING, RUN_ID
     params = load_parameters(os.path.join(os.path.dirname(__file__), '../config/parameters.json'))
     params.initial_population = population
     RUN_QUEUE = Queue()
     RUN_UPDATES = []
+    RUN_ID += 1
 
     def on_year_result(row: dict):
         if RUN_QUEUE is not None:
@@ -60,6 +71,16 @@ def stop_run():
         RUN_MODEL.request_stop()
 
 
+def _figure(title: str, yaxis_title: str, years=(), values=()) -> go.Figure:
+    fig = go.Figure([go.Scatter(x=list(years), y=list(values), mode='lines')])
+    fig.update_layout(title=title, xaxis_title='Year', yaxis_title=yaxis_title)
+    return fig
+
+
+def _series(rows: List[Dict[str, Any]], key: str, scale: float) -> List[float]:
+    return [(r[key] or 0) * scale for r in rows]
+
+
 app = dash.Dash(__name__)
 app.title = 'HIVEC-CM Live (Dash)'
 
@@ -86,13 +107,14 @@ app.layout = html.Div([
         html.Button('Stop', id='btn-stop', n_clicks=0),
     ], style={'display': 'grid', 'gridTemplateColumns': 'repeat(8, minmax(130px, 1fr))', 'gap': '10px'}),
 
-    dcc.Store(id='run-data', data=[]),
+    # Rows stay server-side in RUN_UPDATES; the store only signals how many exist
+    dcc.Store(id='run-data', data={'run': 0, 'n': 0}),
+    # [run id, rows already drawn]; figures are extended from there each tick
+    dcc.Store(id='drawn', data=[0, 0]),
     dcc.Interval(id='tick', interval=300, n_intervals=0),
     html.Div(id='status'),
-    dcc.Graph(id='fig-prev'),
-    dcc.Graph(id='fig-art'),
-    dcc.Graph(id='fig-inf'),
-    dcc.Graph(id='fig-pop'),
+    *[dcc.Graph(id=graph_id, figure=_figure(title, yaxis_title))
+      for graph_id, _key, title, yaxis_title, _scale in FIGURES],
 ])
 
 
@@ -104,41 +126,48 @@ app.layout = html.Div([
 )
 def poll_updates(_n, data):
     global RUN_QUEUE, RUNNING, RUN_UPDATES
-    # Drain queue
+    # Drain queue in one locked batch
     if RUN_QUEUE is not None:
-        while True:
-            try:
-                item = RUN_QUEUE.get_nowait()
-                RUN_UPDATES.append(item)
-            except Empty:
-                break
+        with RUN_QUEUE.mutex:
+            items = list(RUN_QUEUE.queue)
+            RUN_QUEUE.queue.clear()
+        RUN_UPDATES.extend(items)
     status = 'Running…' if RUNNING else ('Idle' if not RUN_UPDATES else 'Completed/Stopped')
-    return RUN_UPDATES, status
+    current = {'run': RUN_ID, 'n': len(RUN_UPDATES)}
+    return (dash.no_update if current == data else current), status
 
 
 @app.callback(
-    Output('fig-prev', 'figure'),
-    Output('fig-art', 'figure'),
-    Output('fig-inf', 'figure'),
-    Output('fig-pop', 'figure'),
-    Input('run-data', 'data')
+    *[Output(graph_id, 'figure') for graph_id, *_ in FIGURES],
+    *[Output(graph_id, 'extendData') for graph_id, *_ in FIGURES],
+    Output('drawn', 'data'),
+    Input('run-data', 'data'),
+    State('drawn', 'data')
 )
-def redraw_figures(rows):
-    years = [r['year'] for r in rows] if rows else []
-    prev = [r['hiv_prevalence'] * 100 for r in rows] if rows else []
-    art = [((r['art_coverage'] or 0) * 100) for r in rows] if rows else []
-    inf = [r['new_infections'] for r in rows] if rows else []
-    pop = [r['total_population'] for r in rows] if rows else []
-
-    fig1 = go.Figure([go.Scatter(x=years, y=prev, mode='lines')])
-    fig1.update_layout(title='HIV Prevalence (%)', xaxis_title='Year', yaxis_title='%')
-    fig2 = go.Figure([go.Scatter(x=years, y=art, mode='lines')])
-    fig2.update_layout(title='ART Coverage (%)', xaxis_title='Year', yaxis_title='%')
-    fig3 = go.Figure([go.Scatter(x=years, y=inf, mode='lines')])
-    fig3.update_layout(title='New Infections', xaxis_title='Year', yaxis_title='#')
-    fig4 = go.Figure([go.Scatter(x=years, y=pop, mode='lines')])
-    fig4.update_layout(title='Total Population', xaxis_title='Year', yaxis_title='#')
-    return fig1, fig2, fig3, fig4
+def redraw_figures(data, drawn):
+    run_id = data['run']
+    if run_id != RUN_ID:
+        raise PreventUpdate  # stale signal from a replaced run; the next tick catches up
+    n_rows = data['n']
+    drawn_run, n_drawn = drawn or (0, 0)
+    keep = [dash.no_update] * len(FIGURES)
+
+    if run_id != drawn_run or n_rows < n_drawn:
+        # New run: replace the figures once, then extend them from here on
+        rows = RUN_UPDATES[:n_rows]
+        years = [r['year'] for r in rows]
+        figures = [_figure(title, yaxis_title, years, _series(rows, key, scale))
+                   for _id, key, title, yaxis_title, scale in FIGURES]
+        return (*figures, *keep, [run_id, n_rows])
+    if n_rows == n_drawn:
+        raise PreventUpdate
+
+    # Send only the rows appended since the last tick
+    new_rows = RUN_UPDATES[n_drawn:n_rows]
+    years = [r['year'] for r in new_rows]
+    extensions = [(dict(x=[years], y=[_series(new_rows, key, scale)]), [0])
+                  for _id, key, _title, _yaxis_title, scale in FIGURES]
+    return (*keep, *extensions, [run_id, n_rows])
 
 
 @app.callback(